@@ -0,0 +1,67 @@
+import random
+import sys
+import time
+from array import array
+
+from src.services import audio_gate
+from src.services.audio_gate import AudioGate, PcmAudio
+
+RATE = 16_000
+
+
+def chunk(rng: random.Random, seconds: float, speech: float) -> bytes:
+    """Background hiss with a burst of loud noise covering ``speech`` of the chunk."""
+    total = int(RATE * seconds)
+    voiced = range(int(total * (1 - speech) / 2), int(total * (1 + speech) / 2))
+    samples = array(
+        "h",
+        (
+            rng.randint(-6000, 6000) if index in voiced else rng.randint(-30, 30)
+            for index in range(total)
+        ),
+    )
+    return PcmAudio(samples.tobytes(), RATE, 1).to_wav()
+
+
+def session(chunks: int, seconds: float) -> list[bytes]:
+    # Roughly what a live meeting looks like chunked at 1s: long pauses, partial speech
+    rng = random.Random(7)
+    shapes = [chunk(rng, seconds, speech) for speech in (0.0, 0.0, 0.3, 0.6, 1.0)]
+    return [rng.choice(shapes) for _ in range(chunks)]
+
+
+def run(chunks: list[bytes]) -> tuple[dict[str, float], float]:
+    gate = AudioGate()
+    started = time.perf_counter()
+    now = 0.0
+    for data in chunks:
+        gate.process(data, "audio/wav", stream="meeting", now=now)
+        now += 1.0
+    gate.process(b"", "audio/pcm", stream="meeting", final=True, now=now)
+    return gate.stats(), (time.perf_counter() - started) / len(chunks) * 1e6
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    chunks = session(count, 1.0)
+
+    timings = {}
+    if audio_gate.np is not None:
+        stats, timings["numpy"] = run(chunks)
+    numpy, audio_gate.np = audio_gate.np, None
+    stats, timings["pure python"] = run(chunks)
+    audio_gate.np = numpy
+
+    print(f"{count} one-second WAV chunks through the gate")
+    print(f"upstream calls       {count:>6} -> {stats['upstream_calls']:>6}")
+    print(
+        f"audio seconds        {stats['audio_seconds_in']:>6.0f} -> "
+        f"{stats['audio_seconds_sent']:>6.0f}"
+    )
+    print(f"silent chunks        {stats['silent_chunks']:>6}")
+    costs = ", ".join(f"{name} {micros:.0f} us" for name, micros in timings.items())
+    print(f"gate cost per chunk  {costs}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import sys
+import time
+
+from src.services import websocket_manager
+from src.services.state_manager import StateManager
+from src.services.websocket_manager import WebSocketConnectionManager
+
+
+class CountingWebSocket:
+    def __init__(self):
+        self.frames = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, payload: dict) -> None:
+        # What Starlette does for every socket: encode, then send
+        json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        self.frames += 1
+
+    async def send_text(self, text: str) -> None:
+        self.frames += 1
+
+
+def build_deltas(count: int) -> list[dict]:
+    manager = StateManager(min_update_interval_seconds=0)
+    deltas = []
+    for index in range(count):
+        text = f"Action: follow up with vendor {index} about the renewal terms and pricing tiers"
+        delta = manager.process_transcript_segment("m1", text, "Alice")
+        deltas.append({"type": "meeting.delta", "meeting_id": "m1", "payload": delta})
+    return deltas
+
+
+async def per_socket_encoding(deltas: list[dict], viewers: int) -> float:
+    sockets = [CountingWebSocket() for _ in range(viewers)]
+    started = time.perf_counter()
+    for delta in deltas:
+        for socket in sockets:
+            await socket.send_json(delta)
+    return time.perf_counter() - started
+
+
+async def encode_once(deltas: list[dict], viewers: int) -> float:
+    manager = WebSocketConnectionManager(max_queue_size=len(deltas) + 1)
+    sockets = [CountingWebSocket() for _ in range(viewers)]
+    for socket in sockets:
+        await manager.connect("m1", socket)
+
+    started = time.perf_counter()
+    for delta in deltas:
+        await manager.broadcast("m1", delta)
+    while any(socket.frames < len(deltas) for socket in sockets):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    await manager.close()
+    return elapsed
+
+
+async def main() -> None:
+    viewers = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    deltas = build_deltas(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+    frame_bytes = len(websocket_manager.encode_message(deltas[-1]))
+    print(f"{viewers} viewers, {len(deltas)} deltas, last frame {frame_bytes:,} bytes")
+
+    baseline = await per_socket_encoding(deltas, viewers)
+    print(f"{'send_json per socket':<28} {baseline:7.3f}s")
+    fast = await encode_once(deltas, viewers)
+    encoder = "orjson" if websocket_manager.orjson is not None else "json"
+    print(f"{'encode once (' + encoder + ')':<28} {fast:7.3f}s  {baseline / fast:5.1f}x")
+    if websocket_manager.orjson is not None:
+        websocket_manager.orjson = None
+        stdlib = await encode_once(deltas, viewers)
+        print(f"{'encode once (json)':<28} {stdlib:7.3f}s  {baseline / stdlib:5.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.broker import LocalPubSubServer, RespBroker
+from src.services.websocket_manager import WebSocketConnectionManager
+
+
+class CountingWebSocket:
+    def __init__(self):
+        self.frames = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, text: str) -> None:
+        self.frames += 1
+
+
+async def run_worker(url: str, workers: int, viewers: int, messages: int, batch: int, barrier):
+    broker = RespBroker(url, max_batch_size=batch, flush_interval_seconds=0.002 if batch > 1 else 0)
+    manager = WebSocketConnectionManager(max_queue_size=workers * messages + 1, broker=broker)
+    await manager.start()
+    sockets = [CountingWebSocket() for _ in range(viewers)]
+    for socket in sockets:
+        await manager.connect("m1", socket)
+    while "meeting-copilot:m1" not in broker.subscribed:
+        await asyncio.sleep(0.01)
+    await asyncio.to_thread(barrier.wait)
+
+    started = time.perf_counter()
+    for index in range(messages):
+        payload = {"n": index, "text": "x" * 200}
+        await manager.broadcast("m1", {"type": "bot.flag", "payload": payload})
+        if index % 64 == 0:
+            await asyncio.sleep(0)
+    expected = workers * messages
+    while any(socket.frames < expected for socket in sockets):
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    commands = broker.publish_commands
+    await manager.close()
+    return elapsed, commands
+
+
+def worker_main(url, workers, viewers, messages, batch, barrier, results) -> None:
+    results.put(asyncio.run(run_worker(url, workers, viewers, messages, batch, barrier)))
+
+
+async def run(url: str, workers: int, viewers: int, messages: int, batch: int) -> None:
+    context = multiprocessing.get_context("spawn")
+    barrier, results = context.Barrier(workers), context.Queue()
+    processes = [
+        context.Process(
+            target=worker_main,
+            args=(url, workers, viewers, messages, batch, barrier, results),
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [await asyncio.to_thread(results.get) for _ in processes]
+    for process in processes:
+        process.join()
+
+    elapsed = max(seconds for seconds, _ in outcomes)
+    commands = sum(count for _, count in outcomes)
+    frames = workers * messages
+    label = "batched" if batch > 1 else "one PUBLISH per frame"
+    print(
+        f"{label:<22} {elapsed:7.3f}s  {frames / elapsed:10,.0f} frames/s published  "
+        f"{frames * workers * viewers / elapsed:12,.0f} socket frames/s  {commands:,} PUBLISH"
+    )
+
+
+async def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    viewers = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    messages = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    print(f"{workers} workers x {viewers} viewers, {messages} broadcasts per worker")
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"unix://{Path(directory) / 'broker.sock'}"
+        server = LocalPubSubServer()
+        await server.start(url)
+        await run(url, workers, viewers, messages, batch=1)
+        await run(url, workers, viewers, messages, batch=256)
+        await server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
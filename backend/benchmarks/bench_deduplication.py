@@ -0,0 +1,114 @@
+import itertools
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+from src.services.deduplication import (
+    DeduplicationEngine,
+    WindowedDeduplicationEngine,
+    normalize_text,
+)
+
+COMMON_WORDS = (
+    "the we to and need should will for on by of a in with is it this that next week "
+    "team review follow up before after send check update plan risk decision action"
+).split()
+LEGACY_LIMIT = 1_000
+WINDOW_SIZE = 1_000
+REFERENCE_LIMIT = 10_000
+
+
+def make_insights(count: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    # Like natural language, the most frequent words are the shortest ones
+    vocabulary = sorted(
+        {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(20_000)},
+        key=len,
+    )
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    originals: list[str] = []
+    insights: list[str] = []
+    for _ in range(count):
+        if originals and rng.random() < 0.25:
+            chars = list(rng.choice(originals))
+            for _ in range(rng.randint(0, 3)):
+                chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+            text = "".join(chars)
+            insights.append(text.upper() if rng.random() < 0.3 else text)
+            continue
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(2, 8))
+        words += rng.choices(COMMON_WORDS, k=rng.randint(0, 3))
+        rng.shuffle(words)
+        text = " ".join(words)
+        originals.append(text)
+        insights.append(text)
+    return insights
+
+
+class LinearDeduplication:
+    """The previous engine: every insert runs ``ratio()`` against every known text.
+
+    With ``cascade`` it rejects candidates on the cheaper upper bounds first, which gives
+    exactly the same answers and is fast enough to serve as a reference at 10k insights.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.92, cascade: bool = False):
+        self.similarity_threshold = similarity_threshold
+        self.cascade = cascade
+        self._known: set[str] = set()
+        self._texts: list[str] = []
+
+    def add_if_unique(self, text: str) -> bool:
+        normalized = normalize_text(text)
+        if normalized in self._known:
+            return False
+        for candidate in self._texts:
+            if self.cascade:
+                matcher = SequenceMatcher(a=normalized, b=candidate)
+                if matcher.real_quick_ratio() < self.similarity_threshold:
+                    continue
+                if matcher.quick_ratio() < self.similarity_threshold:
+                    continue
+                ratio = matcher.ratio()
+            else:
+                matcher = SequenceMatcher(a=normalize_text(text), b=normalize_text(candidate))
+                ratio = matcher.ratio()
+            if ratio >= self.similarity_threshold:
+                return False
+        self._known.add(normalized)
+        self._texts.append(normalized)
+        return True
+
+
+def measure(label: str, engine, insights: list[str]) -> list[bool]:
+    started = time.perf_counter()
+    accepted = [engine.add_if_unique(text) for text in insights]
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<26} {len(insights):>8,} insights {elapsed:>8.2f}s"
+        f" {len(insights) / elapsed:>9,.0f}/s  accepted {sum(accepted):,}",
+    )
+    return accepted
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    for size in sizes:
+        insights = make_insights(size)
+        indexed = measure("lsh index", DeduplicationEngine(), insights)
+        if size <= LEGACY_LIMIT:
+            measure("legacy linear scan", LinearDeduplication(), insights)
+        if size <= REFERENCE_LIMIT:
+            windowed = WindowedDeduplicationEngine(max_entries=WINDOW_SIZE)
+            measure(f"window of {WINDOW_SIZE:,}", windowed, insights)
+            print(f"{'window stage counts':<26} {windowed.stats()}")
+            reference = measure("linear + cascade", LinearDeduplication(cascade=True), insights)
+            differ = sum(left != right for left, right in zip(indexed, reference, strict=True))
+            print(f"{'decisions that differ':<26} {differ:>8,}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
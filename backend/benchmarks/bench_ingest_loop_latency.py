@@ -0,0 +1,93 @@
+import asyncio
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services.ingest_pipeline import IngestPipeline
+from src.services.state_manager import StateManager
+from src.services.summary_scheduler import SummaryFlushScheduler
+
+TOPICS = ["pricing", "onboarding", "vendor", "migration", "hiring", "launch", "billing", "search"]
+
+
+class NullWebSocketManager:
+    def connection_count(self, meeting_id: str) -> int:
+        return 0
+
+    async def broadcast(self, meeting_id: str, payload: dict) -> None:
+        await asyncio.sleep(0)
+
+
+class NullStateRepository:
+    async def add_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> None:
+        await asyncio.sleep(0)
+
+    async def add_insight(self, kind, item) -> None:
+        await asyncio.sleep(0)
+
+
+async def probe_loop(samples: list[float], stop: asyncio.Event, interval: float = 0.001) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def feed_meeting(pipeline: IngestPipeline, meeting_id: str, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for index in range(count):
+        topic = rng.choice(TOPICS)
+        text = f"Action: {rng.randrange(10**6)} follow up on {topic} item {index} for {meeting_id}"
+        await pipeline.submit(meeting_id, text, "Alice")
+
+
+async def run(label: str, meetings: int, segments: int, workers: int) -> None:
+    state_manager = StateManager(min_update_interval_seconds=0)
+    websocket_manager = NullWebSocketManager()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers else None
+    pipeline = IngestPipeline(
+        state_manager,
+        NullStateRepository(),
+        websocket_manager,
+        scheduler,
+        executor=executor,
+    )
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop(samples, stop))
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(feed_meeting(pipeline, f"m{index}", segments, index) for index in range(meetings)),
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    await pipeline.close()
+    await scheduler.close()
+    if executor is not None:
+        executor.shutdown()
+
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{label:<22} {meetings * segments / elapsed:>9,.0f} segments/s"
+        f"  loop lag p50 {statistics.median(samples):6.2f} ms"
+        f"  p99 {p99:7.2f} ms  max {samples[-1]:7.2f} ms",
+    )
+
+
+def main() -> None:
+    meetings = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    segments = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    print(f"meetings: {meetings}; segments per meeting: {segments}")
+    asyncio.run(run("inline on event loop", meetings, segments, workers=0))
+    for workers in (1, 2, 4):
+        asyncio.run(run(f"thread pool ({workers})", meetings, segments, workers=workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import random
+import time
+
+from src.services.insight_rules import load_insight_classifier
+
+ACTION_KEYWORDS = [
+    "need to",
+    "should",
+    "must",
+    "will do",
+    "to prepare",
+    "to send",
+    "to review",
+    "to follow up",
+    "let's",
+    "please",
+]
+DECISION_KEYWORDS = [
+    "decided",
+    "agreed",
+    "confirmed",
+    "approved",
+    "final decision",
+    "we will",
+    "we'll go with",
+]
+RISK_KEYWORDS = ["risk", "danger", "concern", "worried", "problem", "issue", "blocker"]
+
+SENTENCES = [
+    "Decision: move the launch to Monday",
+    "Action: prepare the customer email",
+    "Risk: API timeout spike in region A",
+    "Question: who signs off on the budget?",
+    "I think we need to review the onboarding flow before the demo",
+    "We agreed that the pricing page stays as is",
+    "The main concern is the vendor contract renewal",
+    "Thanks everyone for joining, let me share my screen",
+    "The dashboard numbers look a lot better than last week",
+    "Can everybody see the slides now or is it still loading",
+    "Решение: переносим релиз на понедельник",
+    "Нужно подготовить отчёт для клиента до пятницы",
+    "Коллеги, всем привет, начинаем через пару минут",
+]
+
+
+def legacy_extract(text: str) -> tuple[str, str] | None:
+    normalized = text.strip()
+    lowered = normalized.lower()
+    if lowered.startswith("decision:"):
+        return "decisions", normalized.split(":", 1)[1].strip()
+    if lowered.startswith("action:") or lowered.startswith("action item:"):
+        return "actions", normalized.split(":", 1)[1].strip()
+    if lowered.startswith("risk:"):
+        return "risks", normalized.split(":", 1)[1].strip()
+    if lowered.startswith("question:"):
+        return "open_questions", normalized.split(":", 1)[1].strip()
+    if any(kw in lowered for kw in ACTION_KEYWORDS):
+        return "actions", normalized
+    if any(kw in lowered for kw in DECISION_KEYWORDS):
+        return "decisions", normalized
+    if any(kw in lowered for kw in RISK_KEYWORDS):
+        return "risks", normalized
+    return None
+
+
+def legacy_bilingual_extract(classifier, text: str) -> tuple[str, str] | None:
+    lowered = text.strip().lower()
+    for rule in sorted(classifier.rules, key=lambda item: -item.priority):
+        literal = rule.pattern.lower()
+        if lowered.startswith(literal) if rule.match == "prefix" else literal in lowered:
+            return rule.collection, text.strip()
+    return None
+
+
+def measure(label: str, func, segments: list[str]) -> float:
+    started = time.perf_counter()
+    for segment in segments:
+        func(segment)
+    elapsed = time.perf_counter() - started
+    rate = len(segments) / elapsed
+    print(f"{label:<32} {rate:>12,.0f} segments/s")
+    return rate
+
+
+def main(count: int = 200_000) -> None:
+    rng = random.Random(42)
+    segments = [rng.choice(SENTENCES) for _ in range(count)]
+
+    english_only = load_insight_classifier(["en"])
+    bilingual = load_insight_classifier(["en", "ru"])
+
+    mismatches = 0
+    for segment in set(segments):
+        found = english_only.classify(segment)
+        if (found and (found.collection, found.content)) != legacy_extract(segment):
+            mismatches += 1
+    print(f"segments: {count:,}; legacy/en disagreements on corpus: {mismatches}")
+
+    measure("legacy any() chains (en)", legacy_extract, segments)
+    measure(
+        "legacy-style chains (en+ru)",
+        lambda text: legacy_bilingual_extract(bilingual, text),
+        segments,
+    )
+    measure("compiled classifier (en)", english_only.classify, segments)
+    measure("compiled classifier (en+ru)", bilingual.classify, segments)
+
+
+if __name__ == "__main__":
+    main()
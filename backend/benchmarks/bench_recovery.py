@@ -0,0 +1,101 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.config.settings import get_settings
+from src.db.database import Database
+from src.db.migrations import apply_migrations
+from src.db.repositories import MeetingRepository, MeetingStateRepository
+from src.db.write_behind import WriteBehindQueue
+from src.services.state_manager import (
+    INSIGHT_COLLECTIONS,
+    INSIGHT_KINDS,
+    INSIGHT_MODELS,
+    StateManager,
+)
+
+SENTENCES = [
+    "Decision: move the launch to Monday",
+    "Action: prepare the customer email",
+    "Risk: API timeout spike in region A",
+    "Question: who signs off on the budget?",
+    "I think we need to review the onboarding flow before the demo",
+    "Thanks everyone for joining, let me share my screen",
+    "The dashboard numbers look a lot better than last week",
+    "Can everybody see the slides now or is it still loading",
+]
+SPEAKERS = ["Alice", "Bob", "Carol", None]
+
+
+async def run(segment_count: int, target_seconds: float) -> bool:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp_dir) / 'recovery.db'}"
+        get_settings.cache_clear()
+        database = Database(get_settings())
+        await apply_migrations(database)
+        meeting = await MeetingRepository(database).create("Recovery benchmark")
+
+        writer = WriteBehindQueue(database, max_batch_size=500, flush_interval_seconds=0.05)
+        writer.start()
+        repository = MeetingStateRepository(database, writer)
+        rng = random.Random(7)
+        insight_count = segment_count // 25
+        risk_ids: list[str] = []
+
+        started = time.perf_counter()
+        for index in range(segment_count):
+            text = f"{rng.choice(SENTENCES)} #{index}"
+            await repository.add_segment(meeting.id, text, rng.choice(SPEAKERS))
+        for index in range(insight_count):
+            collection = INSIGHT_COLLECTIONS[index % len(INSIGHT_COLLECTIONS)]
+            item = INSIGHT_MODELS[collection](
+                id=f"insight-{index}",
+                meeting_id=meeting.id,
+                content=f"{collection} item {index}",
+                created_at=datetime.now(timezone.utc),
+            )
+            if collection == "risks":
+                risk_ids.append(item.id)
+            await repository.add_insight(INSIGHT_KINDS[collection], item)
+        await writer.flush()
+        write_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        record = await repository.load(meeting.id)
+        load_elapsed = time.perf_counter() - started
+
+        restarted = StateManager(state_loader=repository.load)
+        started = time.perf_counter()
+        restarted._rehydrate(meeting.id, record)
+        rebuild_elapsed = time.perf_counter() - started
+        await writer.close()
+
+        restored = restarted.get_state(meeting.id)
+        assert len(restored.transcript_lines) == segment_count
+        assert [item.id for item in restored.risks] == risk_ids
+
+        total = load_elapsed + rebuild_elapsed
+        print(f"segments: {segment_count:,}; insights: {insight_count:,}")
+        rows = segment_count + insight_count
+        rate = rows / write_elapsed
+        print(f"{'write-behind persist':<24} {write_elapsed:>8.3f}s ({rate:,.0f} rows/s)")
+        print(f"{'load from SQLite':<24} {load_elapsed:>8.3f}s")
+        print(f"{'rebuild state + dedup':<24} {rebuild_elapsed:>8.3f}s")
+        print(f"{'recovery total':<24} {total:>8.3f}s (target {target_seconds:.1f}s)")
+        return total <= target_seconds
+
+
+def main() -> None:
+    segment_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    target_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    if not asyncio.run(run(segment_count, target_seconds)):
+        raise SystemExit("recovery exceeded target")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import random
+import sys
+import time
+
+from src.services.search_index import SearchIndex
+
+VOCABULARY_SIZE = 20_000
+QUERIES = [
+    "what did we say about {rare} and {common}",
+    "{rare} {medium}",
+    "{medium} {common} {common2}",
+    "{common} {common2}",
+    "{rare}",
+]
+
+
+def main(count: int = 50_000, repeats: int = 200) -> None:
+    rng = random.Random(3)
+    # Zipf-like vocabulary: a handful of very common words and a long tail of rare ones
+    vocabulary = [f"word{rank}" for rank in range(VOCABULARY_SIZE)]
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(VOCABULARY_SIZE)]
+    index = SearchIndex()
+
+    segments = [" ".join(rng.choices(vocabulary, weights, k=12)) for _ in range(count)]
+    started = time.perf_counter()
+    for position, segment in enumerate(segments):
+        index.add(segment, position)
+    build_elapsed = time.perf_counter() - started
+
+    print(f"segments: {count:,}; terms: {index.term_count:,}; ~{index.memory_bytes / 1e6:.1f} MB")
+    print(f"{'index build':<44} {count / build_elapsed:>10,.0f} segments/s")
+
+    words = {"common": "word0", "common2": "word3", "medium": "word60", "rare": "word4000"}
+    for template in QUERIES:
+        query = template.format(**words)
+        started = time.perf_counter()
+        for _ in range(repeats):
+            index.search(query, limit=5)
+        per_query = (time.perf_counter() - started) / repeats * 1000
+        print(f"{query:<44} {per_query:>8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,49 @@
+import sys
+import time
+from datetime import datetime, timezone
+
+from src.services.snapshot_cache import SnapshotCache
+from src.services.state_manager import StateManager, build_state_snapshot
+from src.services.websocket_manager import OutboundFrame
+
+LINES = [
+    "Action: follow up with vendor {n} about the renewal terms",
+    "Risk: the migration for region {n} may slip past the freeze",
+    "Decision: we ship the beta to cohort {n} on Friday",
+    "I think the pricing page still needs another pass before {n}",
+]
+
+
+def main() -> None:
+    segments = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    joins = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    manager = StateManager(min_update_interval_seconds=0)
+    for index in range(segments):
+        manager.process_transcript_segment("m1", LINES[index % len(LINES)].format(n=index), "PM")
+    state = manager.get_state("m1")
+
+    started = time.perf_counter()
+    for _ in range(joins):
+        OutboundFrame.encode(
+            {
+                "type": "meeting.state",
+                "meeting_id": "m1",
+                "payload": build_state_snapshot(state),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+    rebuilt = time.perf_counter() - started
+
+    cache = SnapshotCache()
+    started = time.perf_counter()
+    for _ in range(joins):
+        frame = cache.frame("m1", state)
+    cached = time.perf_counter() - started
+
+    print(f"{segments} segments, {joins} joins, snapshot frame {len(frame.text):,} bytes")
+    for label, elapsed in (("rebuild per join", rebuilt), ("cached", cached)):
+        print(f"{label:<18} {elapsed * 1000:9.2f} ms  {elapsed / joins * 1e6:9.1f} us/join")
+
+
+if __name__ == "__main__":
+    main()
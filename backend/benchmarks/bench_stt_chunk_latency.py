@@ -0,0 +1,126 @@
+import asyncio
+import base64
+import json
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+from src.api import stt
+from src.config.settings import Settings
+from src.services.ai.elevenlabs_provider import ElevenLabsRealtimeProvider
+from src.services.http_clients import HttpClientPool
+
+RESPONSE_BODY = json.dumps({"text": "Decision: ship the beta on Friday"}).encode()
+
+
+async def handle_upstream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Minimal keep-alive HTTP/1.1 stand-in for the speech-to-text API
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            while length > 0:
+                length -= len(await reader.readexactly(min(length, 64 * 1024)))
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(RESPONSE_BODY), RESPONSE_BODY)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def self_signed_contexts(directory: Path) -> tuple[ssl.SSLContext, ssl.SSLContext]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", str(key), "-out", str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    server = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server.load_cert_chain(cert, key)
+    client = ssl.create_default_context(cafile=str(cert))
+    return server, client
+
+
+class PerCallClientPool(HttpClientPool):
+    """The old behaviour: a fresh client, and so a fresh connection, for every call."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._previous: httpx.AsyncClient | None = None
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        # Calls are sequential here, so the previous call is done with its client
+        if self._previous is not None:
+            asyncio.get_running_loop().create_task(self._previous.aclose())
+        self._previous = httpx.AsyncClient(base_url=base_url, timeout=30, verify=self._verify)
+        return self._previous
+
+
+async def measure(pool: HttpClientPool, base_url: str, requests: int) -> list[float]:
+    settings = Settings(
+        _env_file=None, elevenlabs_api_key="key", elevenlabs_base_url=base_url  # type: ignore[call-arg]
+    )
+    app = FastAPI()
+    app.include_router(stt.router)
+    app.state.realtime_providers = {"elevenlabs": ElevenLabsRealtimeProvider(settings, pool)}
+    audio = base64.b64encode(b"\x00" * 16_000).decode()
+    body = {"audio_base64": audio, "mime_type": "audio/webm"}
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.post("/api/stt/elevenlabs/chunk", json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+    await pool.close()
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<26} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+
+async def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with tempfile.TemporaryDirectory() as directory:
+        server_context, client_context = self_signed_contexts(Path(directory))
+        for scheme, context in (("http", None), ("https", server_context)):
+            server = await asyncio.start_server(handle_upstream, "localhost", 0, ssl=context)
+            port = server.sockets[0].getsockname()[1]
+            base_url = f"{scheme}://localhost:{port}"
+            verify = client_context if context is not None else True
+
+            print(f"{requests} chunk requests against a local {scheme} upstream")
+            per_call = PerCallClientPool(verify=verify)
+            report("client per call", await measure(per_call, base_url, requests))
+            pooled = HttpClientPool(verify=verify)
+            report("shared keep-alive pool", await measure(pooled, base_url, requests))
+            server.close()
+            await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+import asyncio
+import base64
+import json
+import sys
+import tracemalloc
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.bench_stt_chunk_latency import handle_upstream
+from src.api import stt
+from src.config.settings import Settings
+from src.services.ai.elevenlabs_provider import ElevenLabsRealtimeProvider
+from src.services.http_clients import HttpClientPool
+
+
+async def chunked(body: bytes, size: int = 64 * 1024):
+    # Servers hand the app the body in socket-sized pieces, not as one bytes object
+    for offset in range(0, len(body), size):
+        yield body[offset : offset + size]
+
+
+async def peak_bytes(client: httpx.AsyncClient, url: str, **options) -> int:
+    # The body is rendered before tracing starts, so only the server side is counted
+    rendered = client.build_request("POST", url, **options)
+    body = await rendered.aread()
+    request = client.build_request("POST", url, content=chunked(body), headers=rendered.headers)
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    response = await client.send(request)
+    response.raise_for_status()
+    return tracemalloc.get_traced_memory()[1] - baseline
+
+
+async def main() -> None:
+    sizes_mb = [float(size) for size in sys.argv[1:]] or [0.5, 4, 16]
+    server = await asyncio.start_server(handle_upstream, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    settings = Settings(
+        _env_file=None,  # type: ignore[call-arg]
+        elevenlabs_api_key="key",
+        elevenlabs_base_url=f"http://127.0.0.1:{port}",
+    )
+    pool = HttpClientPool()
+    app = FastAPI()
+    app.include_router(stt.router)
+    app.state.settings = settings
+    app.state.realtime_providers = {"elevenlabs": ElevenLabsRealtimeProvider(settings, pool)}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+        # Warm the upstream connection so the first measurement does not pay for it
+        await client.post("/api/stt/elevenlabs/chunk/upload", content=b"warm-up")
+        tracemalloc.start()
+        print(f"{'chunk':>8}  {'json + base64':>14}  {'raw upload':>11}  {'multipart':>10}")
+        for size_mb in sizes_mb:
+            audio = b"\x01" * int(size_mb * 1024 * 1024)
+            body = json.dumps(
+                {"audio_base64": base64.b64encode(audio).decode(), "mime_type": "audio/webm"}
+            ).encode()
+            encoded = await peak_bytes(
+                client,
+                "/api/stt/elevenlabs/chunk",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+            del body
+            raw = await peak_bytes(
+                client,
+                "/api/stt/elevenlabs/chunk/upload",
+                content=audio,
+                headers={"Content-Type": "audio/webm"},
+            )
+            multipart = await peak_bytes(
+                client,
+                "/api/stt/elevenlabs/chunk/upload",
+                files={"file": ("chunk.webm", audio, "audio/webm")},
+            )
+            print(
+                f"{size_mb:>6.1f}MB  {encoded / 2**20:>12.1f}MB  {raw / 2**20:>9.1f}MB"
+                f"  {multipart / 2**20:>8.1f}MB"
+            )
+        tracemalloc.stop()
+
+    await pool.close()
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from src.services import websocket_manager
+from src.services.state_manager import StateManager, build_state_snapshot
+from src.services.websocket_manager import WireFormat
+
+LINES = [
+    "Action: follow up with vendor {n} about the renewal terms",
+    "Risk: the migration for region {n} may slip past the freeze",
+    "Decision: we ship the beta to cohort {n} on Friday",
+    "I think the pricing page still needs another pass before {n}",
+    "Question: who owns the on-call rotation for service {n}?",
+]
+
+
+def build_events(count: int) -> list[dict]:
+    manager = StateManager(min_update_interval_seconds=0)
+    events = []
+    for index in range(count):
+        text = LINES[index % len(LINES)].format(n=index)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        events.append(
+            {
+                "type": "transcript.segment",
+                "meeting_id": "m1",
+                "payload": {"text": text, "speaker": "Alice"},
+                "timestamp": timestamp,
+            }
+        )
+        delta = manager.process_transcript_segment("m1", text, "Alice")
+        events.append(
+            {"type": "meeting.delta", "meeting_id": "m1", "payload": delta, "timestamp": timestamp}
+        )
+    snapshot = build_state_snapshot(manager.get_state("m1"))
+    events.append({"type": "meeting.state", "meeting_id": "m1", "payload": snapshot})
+    return events
+
+
+def measure(wire_format: WireFormat, events: list[dict], rounds: int = 5) -> tuple[float, float]:
+    sizes = [len(wire_format.encode(event)) for event in events[:-1]]
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for event in events[:-1]:
+            wire_format.encode(event)
+        timings.append((time.perf_counter() - started) / (len(events) - 1) * 1e6)
+    return statistics.mean(sizes), min(timings)
+
+
+def main() -> None:
+    events = build_events(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
+    encoder = "orjson" if websocket_manager.orjson is not None else "json"
+    print(f"{len(events) - 1} live events (segments and deltas), JSON via {encoder}")
+    print(f"{'format':<32} {'bytes/event':>12} {'encode us':>10} {'snapshot bytes':>15}")
+    for encoding in ("json", "msgpack"):
+        if encoding == "msgpack" and websocket_manager.msgpack is None:
+            print(f"{'meeting-copilot.msgpack':<32} not installed")
+            continue
+        for compression in ("none", "deflate"):
+            wire_format = WireFormat(encoding, compression)
+            size, encode_us = measure(wire_format, events)
+            snapshot = len(wire_format.encode(events[-1]))
+            print(f"{wire_format.subprotocol:<32} {size:12.0f} {encode_us:10.1f} {snapshot:15,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -53,13 +53,16 @@ async def stop_meeting(
 ) -> Meeting:
     try:
         meeting = await service.stop(meeting_id)
+        await request.app.state.summary_scheduler.stop(meeting_id)
+        request.app.state.transcript_stitcher.discard(meeting_id)
 
         settings = request.app.state.settings
         telegram_chat_id = request.headers.get("x-telegram-chat-id", "").strip() or settings.telegram_default_chat_id
         telegram_bot = request.app.state.telegram_bot
         state_manager = request.app.state.state_manager
+        state_manager.mark_stopped(meeting_id)
         if telegram_chat_id:
-            summary = state_manager.get_state(meeting_id).summary
+            summary = (await state_manager.load_state(meeting_id)).summary
             await telegram_bot.autopost_summary(telegram_chat_id, summary)
 
         return meeting
@@ -70,8 +73,14 @@ async def stop_meeting(
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_meeting(
     meeting_id: str,
+    request: Request,
     service: MeetingService = Depends(get_meeting_service),
 ) -> None:
+    # In-flight ingest jobs drop their results once the state is gone, and rows already
+    # buffered are written before the delete removes them with the meeting
+    request.app.state.state_manager.discard(meeting_id)
+    request.app.state.transcript_stitcher.discard(meeting_id)
+    await request.app.state.meeting_state_repository.flush()
     await service.delete(meeting_id)
 
 
@@ -89,7 +98,7 @@ async def export_meeting(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
     state_manager = request.app.state.state_manager
-    state = state_manager.get_state(meeting_id)
+    state = await state_manager.load_state(meeting_id)
 
     if format == "html":
         body = export_service.render_html(meeting, state)
@@ -114,8 +123,23 @@ async def send_export_to_telegram(
 
     state_manager = request.app.state.state_manager
     telegram_bot = request.app.state.telegram_bot
-    state = state_manager.get_state(meeting_id)
+    state = await state_manager.load_state(meeting_id)
 
     report = export_service.render_markdown(meeting, state)
     await telegram_bot.send_message(payload.chat_id, report)
     return {"status": "queued"}
+
+
+@router.get("/{meeting_id}/answer-cache")
+async def get_answer_cache_stats(meeting_id: str, request: Request) -> dict[str, int]:
+    return request.app.state.state_manager.answer_cache_stats(meeting_id)
+
+
+@router.get("/{meeting_id}/dedup")
+async def get_dedup_stats(meeting_id: str, request: Request) -> dict[str, int]:
+    return request.app.state.state_manager.dedup_stats(meeting_id)
+
+
+@router.get("/{meeting_id}/ingest")
+async def get_ingest_stats(meeting_id: str, request: Request) -> dict[str, int]:
+    return request.app.state.ingest_rate_limiter.stats(meeting_id)
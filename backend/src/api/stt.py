@@ -1,36 +1,194 @@
+import asyncio
+import base64
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any, BinaryIO
+
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+
+from src.services.audio_gate import AudioGate
+from src.services.audio_upload import UploadTooLarge, limit_stream, spool_stream
 
 router = APIRouter(prefix="/api/stt", tags=["stt"])
 
+Transcribe = Callable[..., Awaitable[dict[str, Any]]]
+
 
 class ElevenLabsChunkRequest(BaseModel):
     audio_base64: str
     mime_type: str = "audio/webm"
+    stream: str | None = None
+    final: bool = False
+    meeting_id: str | None = None
 
 
 class ElevenLabsChunkResponse(BaseModel):
     text: str
+    status: str = "transcribed"
 
 
-@router.post("/elevenlabs/chunk", response_model=ElevenLabsChunkResponse)
-async def transcribe_elevenlabs_chunk(payload: ElevenLabsChunkRequest, request: Request) -> ElevenLabsChunkResponse:
+def _elevenlabs_method(request: Request, name: str) -> Any:
     providers = request.app.state.realtime_providers
     elevenlabs_provider = providers.get("elevenlabs")
     if elevenlabs_provider is None:
         raise HTTPException(status_code=500, detail="ElevenLabs provider is not available")
 
-    if not hasattr(elevenlabs_provider, "transcribe_audio_chunk_base64"):
+    if not hasattr(elevenlabs_provider, name):
         raise HTTPException(status_code=500, detail="ElevenLabs transcription method is not configured")
+    return getattr(elevenlabs_provider, name)
 
+
+async def _transcribe(call: Awaitable[dict[str, Any]]) -> ElevenLabsChunkResponse:
     try:
-        result = await elevenlabs_provider.transcribe_audio_chunk_base64(
-            payload.audio_base64,
-            payload.mime_type,
-        )
+        result = await call
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=502, detail="Failed to transcribe audio chunk with ElevenLabs") from exc
 
     return ElevenLabsChunkResponse(text=str(result.get("text", "")).strip())
+
+
+def _audio_gate(request: Request, mime_type: str) -> AudioGate | None:
+    gate = getattr(request.app.state, "audio_gate", None)
+    return gate if gate is not None and gate.accepts(mime_type) else None
+
+
+async def _gated(
+    gate: AudioGate,
+    transcribe: Transcribe,
+    audio: bytes,
+    mime_type: str,
+    stream: str | None,
+    final: bool,
+    meeting_id: str | None,
+) -> ElevenLabsChunkResponse:
+    try:
+        result = gate.process(audio, mime_type, stream, final, meeting_id=meeting_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if result.audio is None:
+        return ElevenLabsChunkResponse(text="", status=result.status)
+    return await _transcribe(transcribe(result.audio, result.mime_type))
+
+
+async def _upload(
+    request: Request,
+    transcribe: Transcribe,
+    file: BinaryIO,
+    mime_type: str,
+    stream: str | None,
+    final: bool,
+    meeting_id: str | None,
+) -> ElevenLabsChunkResponse:
+    if file.seek(0, os.SEEK_END) == 0:
+        raise HTTPException(status_code=400, detail="Audio upload is empty")
+    file.seek(0)
+    # PCM has to be read in full to measure it; anything else is streamed through
+    gate = _audio_gate(request, mime_type)
+    if gate is not None:
+        audio = await asyncio.to_thread(file.read)
+        return await _gated(gate, transcribe, audio, mime_type, stream, final, meeting_id)
+    return await _transcribe(transcribe(file, mime_type))
+
+
+@router.post("/elevenlabs/chunk", response_model=ElevenLabsChunkResponse)
+async def transcribe_elevenlabs_chunk(payload: ElevenLabsChunkRequest, request: Request) -> ElevenLabsChunkResponse:
+    gate = _audio_gate(request, payload.mime_type)
+    if gate is not None:
+        transcribe = _elevenlabs_method(request, "transcribe_audio_chunk")
+        try:
+            audio = base64.b64decode(payload.audio_base64)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail="Invalid base64 audio payload") from exc
+        return await _gated(
+            gate,
+            transcribe,
+            audio,
+            payload.mime_type,
+            payload.stream,
+            payload.final,
+            payload.meeting_id,
+        )
+
+    transcribe = _elevenlabs_method(request, "transcribe_audio_chunk_base64")
+    return await _transcribe(transcribe(payload.audio_base64, payload.mime_type))
+
+
+@router.post("/elevenlabs/chunk/upload", response_model=ElevenLabsChunkResponse)
+async def upload_elevenlabs_chunk(
+    request: Request,
+    mime_type: str = "audio/webm",
+    stream: str | None = None,
+    final: bool = False,
+    meeting_id: str | None = None,
+) -> ElevenLabsChunkResponse:
+    """Raw audio (``application/octet-stream`` or ``audio/*``) or a multipart ``file`` part.
+
+    The body is spooled to memory, or to a temp file once it is large, and streamed on
+    to the provider from there without base64 or another copy. WAV and ``audio/pcm``
+    chunks go through the audio gate first, which may skip them as silence or hold them
+    for a longer window under their ``stream`` key. A held window that times out is only
+    transcribed when ``meeting_id`` says where its text goes; otherwise send ``final``.
+    """
+    transcribe = _elevenlabs_method(request, "transcribe_audio_chunk")
+    settings = request.app.state.settings
+    max_bytes = settings.stt_upload_max_bytes
+    too_large = HTTPException(status_code=413, detail=f"Audio upload exceeds {max_bytes} bytes")
+    content_type = request.headers.get("content-type", "application/octet-stream")
+    multipart = content_type.startswith("multipart/form-data")
+    if content_type.startswith("audio/"):
+        mime_type = content_type
+    elif not multipart and not content_type.startswith("application/octet-stream"):
+        detail = f"Unsupported audio upload type: {content_type}"
+        raise HTTPException(status_code=415, detail=detail)
+    # Multipart bodies get headroom for part headers; the file part is checked once parsed
+    limit = max_bytes + 64 * 1024 if multipart else max_bytes
+    content_length = request.headers.get("content-length", "")
+    if max_bytes > 0 and content_length.isdigit() and int(content_length) > limit:
+        raise too_large
+
+    if multipart:
+        # The cap is enforced while the body is read, whether or not Content-Length was sent
+        parser = MultiPartParser(
+            request.headers,
+            limit_stream(request.stream(), limit),
+            max_files=1,
+            max_fields=4,
+        )
+        try:
+            form = await parser.parse()
+        except UploadTooLarge as exc:
+            raise too_large from exc
+        except MultiPartException as exc:
+            raise HTTPException(status_code=400, detail=exc.message) from exc
+        try:
+            upload = form.get("file")
+            if not isinstance(upload, UploadFile):
+                raise HTTPException(status_code=400, detail="Multipart upload needs a 'file' part")
+            if max_bytes > 0 and (upload.size or 0) > max_bytes:
+                raise too_large
+            if upload.content_type and upload.content_type.startswith("audio/"):
+                mime_type = upload.content_type
+            mime_type = str(form.get("mime_type") or mime_type)
+            return await _upload(
+                request, transcribe, upload.file, mime_type, stream, final, meeting_id
+            )
+        finally:
+            await form.close()
+
+    try:
+        spool = await spool_stream(request.stream(), settings.stt_upload_spool_bytes, max_bytes)
+    except UploadTooLarge as exc:
+        raise too_large from exc
+    with spool:
+        return await _upload(request, transcribe, spool, mime_type, stream, final, meeting_id)
+
+
+@router.get("/stats")
+async def get_stt_stats(request: Request) -> dict[str, float]:
+    gate = getattr(request.app.state, "audio_gate", None)
+    return gate.stats() if gate is not None else AudioGate().stats()
@@ -1,84 +1,204 @@
+import json
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, WebSocket
 from starlette.websockets import WebSocketDisconnect
 
 from src.models.websocket_events import WebSocketEvent
+from src.services.ingest_pipeline import IngestPipeline
+from src.services.transcript_stitcher import TranscriptStitcher
+from src.services.websocket_manager import (
+    INVALID_PAYLOAD_CLOSE_CODE,
+    WebSocketConnectionManager,
+    WireFormat,
+    negotiate_wire_format,
+)
 
 router = APIRouter(tags=["websocket"])
 
+# Sources that transcribe overlapping audio chunks, whose segments repeat each other's edges
+CHUNKED_STT_SOURCES = ("elevenlabs",)
 
-def build_state_snapshot(state) -> dict:
-    return {
-        "transcript_lines": state.transcript_lines,
-        "summary": state.summary,
-        "insights": {
-            "decisions": [item.model_dump(mode="json") for item in state.decisions],
-            "actions": [item.model_dump(mode="json") for item in state.actions],
-            "risks": [item.model_dump(mode="json") for item in state.risks],
-            "open_questions": [item.model_dump(mode="json") for item in state.open_questions],
+
+def _segment(payload: dict) -> tuple[str, str | None] | None:
+    text = str(payload.get("text", "")).strip()
+    if not text:
+        return None
+    speaker = payload.get("speaker")
+    return text, str(speaker) if speaker else None
+
+
+def _is_chunked(payload: dict) -> bool:
+    return str(payload.get("source", "")).lower() in CHUNKED_STT_SOURCES
+
+
+def _stitch(
+    stitcher: TranscriptStitcher, meeting_id: str, segments: list[tuple[str, str | None]]
+) -> list[tuple[str, str | None]]:
+    stitched = []
+    for text, speaker in segments:
+        text = stitcher.stitch(meeting_id, text, speaker)
+        if text:
+            stitched.append((text, speaker))
+    return stitched
+
+
+async def _receive_payload(websocket: WebSocket, wire_format: WireFormat) -> dict:
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("text") is not None:
+        return json.loads(message["text"])
+    return wire_format.decode(message["bytes"])
+
+
+def _resume(manager, meeting_id: str, websocket: WebSocket) -> bool:
+    stream = websocket.query_params.get("stream")
+    try:
+        last_seq = int(websocket.query_params.get("last_seq", ""))
+    except ValueError:
+        return False
+    return manager.resume(meeting_id, websocket, stream, last_seq)
+
+
+async def ingest_segments(
+    manager: WebSocketConnectionManager,
+    ingest_pipeline: IngestPipeline,
+    meeting_id: str,
+    segments: list[tuple[str, str | None]],
+) -> None:
+    # A batch is one broadcast and one ingest job, so it yields at most one delta
+    timestamp = datetime.now(timezone.utc).isoformat()
+    if len(segments) == 1:
+        text, speaker = segments[0]
+        payload = {"text": text, "speaker": speaker or "Attendee"}
+        await manager.broadcast(
+            meeting_id,
+            {
+                "type": "transcript.segment",
+                "meeting_id": meeting_id,
+                "payload": payload,
+                "timestamp": timestamp,
+            },
+        )
+        await ingest_pipeline.submit(meeting_id, text, speaker)
+        return
+
+    await manager.broadcast(
+        meeting_id,
+        {
+            "type": "transcript.segments",
+            "meeting_id": meeting_id,
+            "payload": {
+                "segments": [
+                    {"text": text, "speaker": speaker or "Attendee"} for text, speaker in segments
+                ]
+            },
+            "timestamp": timestamp,
         },
-        "updated_at": state.last_updated_at.isoformat() if state.last_updated_at else None,
-    }
+    )
+    await ingest_pipeline.submit_batch(meeting_id, segments)
 
 
 @router.websocket("/ws/meetings/{meeting_id}")
 async def meeting_ws(websocket: WebSocket, meeting_id: str) -> None:
     manager = websocket.app.state.websocket_manager
     state_manager = websocket.app.state.state_manager
-
-    await manager.connect(meeting_id, websocket)
-    await websocket.send_json(
-        {
-            "type": "meeting.connected",
-            "meeting_id": meeting_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        },
+    ingest_pipeline = websocket.app.state.ingest_pipeline
+    transcript_stitcher = websocket.app.state.transcript_stitcher
+    snapshot_cache = websocket.app.state.snapshot_cache
+    throttle = websocket.app.state.ingest_rate_limiter.connection(meeting_id)
+    # Held-back lines come out of the throttle later, so this follows the socket's source
+    chunked_source = False
+
+    wire_format, subprotocol = negotiate_wire_format(
+        websocket.query_params,
+        websocket.scope.get("subprotocols", ()),
     )
-    await websocket.send_json(
+    await manager.connect(meeting_id, websocket, wire_format, subprotocol)
+    stream, seq = manager.position(meeting_id)
+    await manager.send(
+        meeting_id,
+        websocket,
         {
-            "type": "meeting.state",
+            "type": "meeting.connected",
             "meeting_id": meeting_id,
-            "payload": build_state_snapshot(state_manager.get_state(meeting_id)),
+            "payload": {
+                "encoding": wire_format.encoding,
+                "compression": wire_format.compression,
+                "stream": stream,
+                "seq": seq,
+                "owner": state_manager.owner,
+            },
             "timestamp": datetime.now(timezone.utc).isoformat(),
         },
     )
-
+    # A meeting with a live socket stays in memory, so viewers never watch an evicted copy
+    state_manager.pin(meeting_id)
     try:
+        # A reconnecting client that still fits in the event log only gets what it missed
+        if not _resume(manager, meeting_id, websocket):
+            state = await state_manager.load_state(meeting_id)
+            frame = snapshot_cache.frame(meeting_id, state, wire_format)
+            await manager.send_frame(meeting_id, websocket, frame)
+
         while True:
-            raw_payload = await websocket.receive_json()
-            event = WebSocketEvent.model_validate(raw_payload)
+            try:
+                event = WebSocketEvent.model_validate(
+                    await _receive_payload(websocket, wire_format)
+                )
+            except ValueError as exc:
+                # A frame that does not decode or validate ends the socket like a disconnect
+                await websocket.close(code=INVALID_PAYLOAD_CLOSE_CODE)
+                raise WebSocketDisconnect(INVALID_PAYLOAD_CLOSE_CODE) from exc
+            manager.touch(meeting_id, websocket)
+
+            if event.type in ("transcript.segment", "transcript.segments"):
+                if event.type == "transcript.segment":
+                    items = [event.payload]
+                else:
+                    items = event.payload.get("segments")
+                    items = items if isinstance(items, list) else []
+                items = [item for item in items if isinstance(item, dict)]
+                segments = [segment for item in items if (segment := _segment(item))]
+                if items:
+                    chunked_source = any(_is_chunked(item) for item in items)
+
+                # Over budget, segments are held back or shed before any broadcast or state work.
+                # Only admitted text moves the stitcher's tail forward.
+                segments = throttle.admit(segments)
+                if chunked_source:
+                    segments = _stitch(transcript_stitcher, meeting_id, segments)
+                status = throttle.status_change()
+                if status is not None:
+                    await manager.send(
+                        meeting_id,
+                        websocket,
+                        {
+                            "type": "provider.status",
+                            "meeting_id": meeting_id,
+                            "payload": status,
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        },
+                    )
+                if segments:
+                    await ingest_segments(manager, ingest_pipeline, meeting_id, segments)
 
-            if event.type == "transcript.segment":
+            if event.type == "meeting.command":
                 payload = event.payload
-                text = str(payload.get("text", "")).strip()
-                speaker = payload.get("speaker")
-
-                if not text:
+                if payload.get("command") != "resync":
                     continue
 
-                await manager.broadcast(
-                    meeting_id,
-                    {
-                        "type": "transcript.segment",
-                        "meeting_id": meeting_id,
-                        "payload": {
-                            "text": text,
-                            "speaker": str(speaker) if speaker else "Attendee",
-                        },
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-
-                delta = state_manager.process_transcript_segment(
-                    meeting_id=meeting_id,
-                    text=text,
-                    speaker=str(speaker) if speaker else None,
-                )
+                try:
+                    since_version = int(payload.get("version", -1))
+                except (TypeError, ValueError):
+                    since_version = -1
 
+                delta = state_manager.build_delta(meeting_id, since_version)
                 if delta is not None:
-                    await manager.broadcast(
+                    await manager.send(
                         meeting_id,
+                        websocket,
                         {
                             "type": "meeting.delta",
                             "meeting_id": meeting_id,
@@ -86,6 +206,13 @@ async def meeting_ws(websocket: WebSocket, meeting_id: str) -> None:
                             "timestamp": datetime.now(timezone.utc).isoformat(),
                         },
                     )
+                else:
+                    state = state_manager.get_state(meeting_id)
+                    await manager.send_frame(
+                        meeting_id,
+                        websocket,
+                        snapshot_cache.frame(meeting_id, state, wire_format),
+                    )
 
             if event.type == "user.question":
                 payload = event.payload
@@ -93,6 +220,7 @@ async def meeting_ws(websocket: WebSocket, meeting_id: str) -> None:
                 if not question:
                     continue
 
+                await state_manager.load_state(meeting_id)
                 answer = state_manager.answer_question(meeting_id, question)
                 await manager.broadcast(
                     meeting_id,
@@ -108,3 +236,12 @@ async def meeting_ws(websocket: WebSocket, meeting_id: str) -> None:
                 )
     except WebSocketDisconnect:
         manager.disconnect(meeting_id, websocket)
+        held_back = throttle.drain()
+        if chunked_source:
+            held_back = _stitch(transcript_stitcher, meeting_id, held_back)
+        if held_back:
+            await ingest_segments(manager, ingest_pipeline, meeting_id, held_back)
+        if not manager.connection_count(meeting_id):
+            transcript_stitcher.discard(meeting_id)
+    finally:
+        state_manager.unpin(meeting_id)
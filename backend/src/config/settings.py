@@ -15,6 +15,19 @@ class Settings(BaseSettings):
     stt_fallback_provider: str = "none"
     ai_provider: str = "openai"
     elevenlabs_stt_model: str = "scribe_v1"
+    stt_upload_max_bytes: int = 25 * 1024 * 1024
+    stt_upload_spool_bytes: int = 1024 * 1024
+    stt_vad_enabled: bool = True
+    stt_vad_threshold_db: float = -45.0
+    stt_vad_frame_ms: int = 30
+    stt_vad_min_speech_ms: int = 150
+    stt_vad_padding_ms: int = 200
+    stt_coalesce_target_seconds: float = 4.0
+    stt_coalesce_max_wait_seconds: float = 10.0
+    stt_coalesce_flush_interval_seconds: float = 1.0
+    openai_base_url: str = "https://api.openai.com"
+    elevenlabs_base_url: str = "https://api.elevenlabs.io"
+    telegram_api_base_url: str = "https://api.telegram.org"
     telegram_bot_token: str = ""
     telegram_whitelist: str = ""
     telegram_default_chat_id: str = ""
@@ -22,6 +35,54 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./meeting_copilot.db"
     cors_origins: str = "http://localhost:5173,http://127.0.0.1:5173"
 
+    transcript_tail_size: int = 2000
+    transcript_spill_dir: str = ""
+    insight_rule_packs: str = "en,ru"
+    summary_min_update_interval_seconds: int = 30
+    summary_flush_min_delay_seconds: float = 1.0
+    summary_flush_max_delay_seconds: float = 10.0
+    summary_flush_busy_segment_rate: float = 2.0
+    summary_flush_busy_subscribers: int = 50
+    state_max_meetings: int = 1000
+    state_memory_budget_mb: int = 256
+    state_idle_ttl_seconds: float = 3600
+    state_stopped_ttl_seconds: float = 300
+    state_eviction_interval_seconds: float = 60
+    state_restore_on_startup: bool = True
+    search_max_documents: int = 100_000
+    answer_cache_size: int = 128
+    snapshot_cache_mb: int = 64
+    dedup_window_size: int = 0
+    dedup_window_seconds: float = 0
+    dedup_memory_budget_kb: int = 0
+    transcript_stitch_min_overlap_tokens: int = 3
+    transcript_stitch_max_overlap_tokens: int = 32
+    websocket_send_queue_size: int = 256
+    websocket_slow_consumer_policy: str = "coalesce"
+    websocket_event_log_size: int = 512
+    websocket_heartbeat_interval_seconds: float = 20
+    websocket_heartbeat_timeout_seconds: float = 60
+    websocket_broker_url: str = ""
+    websocket_broker_batch_size: int = 256
+    websocket_broker_flush_interval_seconds: float = 0.002
+    ingest_workers: int = 2
+    ingest_queue_size: int = 1000
+    ingest_meeting_segments_per_second: float = 50
+    ingest_meeting_burst: int = 200
+    ingest_connection_segments_per_second: float = 20
+    ingest_connection_burst: int = 100
+    ingest_overflow_policy: str = "coalesce"
+    ingest_coalesce_max_chars: int = 2000
+    persistence_batch_size: int = 500
+    persistence_flush_interval_seconds: float = 0.5
+    persistence_max_pending: int = 10_000
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30
+    http_connect_timeout_seconds: float = 5
+    http_timeout_seconds: float = 30
+    http2_enabled: bool = True
+
     model_config = SettingsConfigDict(
         env_file=(".env", "../.env"),
         env_file_encoding="utf-8",
@@ -2,7 +2,33 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from src.db.database import Database
-from src.models.meeting import Meeting
+from src.db.write_behind import WriteBehindQueue
+from src.models.insights import ActionItem, Decision, InsightKind, OpenQuestion, Risk
+from src.models.meeting import Meeting, MeetingStateRecord
+
+Insight = Decision | ActionItem | Risk | OpenQuestion
+
+# Buffered rows can reach the database after their meeting was deleted; those are dropped
+INSERT_TRANSCRIPT_SEGMENT = """
+INSERT INTO transcript_segments (id, meeting_id, speaker, text, started_at, ended_at, created_at)
+SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7
+WHERE EXISTS (SELECT 1 FROM meetings WHERE id = ?2)
+"""
+
+INSERT_INSIGHT = """
+INSERT OR IGNORE INTO insights (id, meeting_id, kind, content, owner, due_date, created_at)
+SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7
+WHERE EXISTS (SELECT 1 FROM meetings WHERE id = ?2)
+"""
+
+MEETING_CHILD_TABLES = ("transcript_segments", "insights", "snapshots")
+
+INSIGHT_MODELS_BY_KIND = {
+    "decision": Decision,
+    "action": ActionItem,
+    "risk": Risk,
+    "open_question": OpenQuestion,
+}
 
 
 def utc_now_iso() -> str:
@@ -61,5 +87,102 @@ class MeetingRepository:
         return await self.get(meeting_id)
 
     async def delete(self, meeting_id: str) -> None:
+        # ON DELETE CASCADE needs foreign_keys on the connection, so children go explicitly
         async with self._database.connection() as conn:
+            for table in MEETING_CHILD_TABLES:
+                await conn.execute(f"DELETE FROM {table} WHERE meeting_id = ?", (meeting_id,))
             await conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
+
+
+class MeetingStateRepository:
+    def __init__(self, database: Database, writer: WriteBehindQueue | None = None):
+        self._database = database
+        self._writer = writer or WriteBehindQueue(database, flush_interval_seconds=0)
+
+    async def add_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> None:
+        now = utc_now_iso()
+        await self._writer.put(
+            INSERT_TRANSCRIPT_SEGMENT,
+            (str(uuid4()), meeting_id, speaker, text, None, None, now),
+        )
+
+    async def add_insight(self, kind: InsightKind, item: Insight) -> None:
+        owner = item.owner if isinstance(item, ActionItem) else None
+        due_date = item.due_date if isinstance(item, ActionItem) else None
+        await self._writer.put(
+            INSERT_INSIGHT,
+            (
+                item.id,
+                item.meeting_id,
+                kind,
+                item.content,
+                owner,
+                due_date.isoformat() if due_date else None,
+                item.created_at.isoformat(),
+            ),
+        )
+
+    async def flush(self) -> None:
+        await self._writer.flush()
+
+    async def active_meeting_ids(self, limit: int) -> list[str]:
+        async with self._database.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT id FROM meetings
+                WHERE status = 'active'
+                ORDER BY datetime(updated_at) DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = await cursor.fetchall()
+        return [row["id"] for row in rows]
+
+    async def load(self, meeting_id: str) -> MeetingStateRecord | None:
+        # Rows still sitting in the write-behind buffer must be visible to the rebuild
+        await self._writer.flush()
+        async with self._database.connection() as conn:
+            cursor = await conn.execute("SELECT status FROM meetings WHERE id = ?", (meeting_id,))
+            meeting_row = await cursor.fetchone()
+            if meeting_row is None:
+                return None
+
+            cursor = await conn.execute(
+                "SELECT speaker, text FROM transcript_segments WHERE meeting_id = ? ORDER BY rowid",
+                (meeting_id,),
+            )
+            segment_rows = await cursor.fetchall()
+
+            cursor = await conn.execute(
+                """
+                SELECT id, kind, content, owner, due_date, created_at
+                FROM insights
+                WHERE meeting_id = ?
+                ORDER BY rowid
+                """,
+                (meeting_id,),
+            )
+            insight_rows = await cursor.fetchall()
+
+        insights = []
+        for row in insight_rows:
+            model = INSIGHT_MODELS_BY_KIND.get(row["kind"])
+            if model is None:
+                continue
+            fields = {
+                "id": row["id"],
+                "meeting_id": meeting_id,
+                "content": row["content"],
+                "created_at": row["created_at"],
+            }
+            if model is ActionItem:
+                fields["owner"] = row["owner"]
+                fields["due_date"] = row["due_date"]
+            insights.append((row["kind"], model.model_validate(fields)))
+
+        return MeetingStateRecord(
+            status=meeting_row["status"],
+            segments=[(row["speaker"], row["text"]) for row in segment_rows],
+            insights=insights,
+        )
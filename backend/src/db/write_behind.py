@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from src.db.database import Database
+
+logger = logging.getLogger(__name__)
+
+WriteOp = tuple[str, Sequence[Any]]
+
+
+class WriteBehindQueue:
+    """Buffers INSERTs and writes them with ``executemany`` off the request path.
+
+    Batches close when ``max_batch_size`` rows are pending or ``flush_interval_seconds``
+    has passed since the first one arrived. ``put`` only waits when ``max_pending`` rows
+    are already queued, which pushes back on the producer instead of growing unbounded.
+    Rows are numbered as they are queued, so ``flush`` waits for the rows ahead of it and
+    not for a queue that other meetings may keep busy.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        max_batch_size: int = 500,
+        flush_interval_seconds: float = 0.5,
+        max_pending: int = 10_000,
+    ):
+        self._database = database
+        self._max_batch_size = max(max_batch_size, 1)
+        self._flush_interval = flush_interval_seconds
+        self._queue: asyncio.Queue[WriteOp] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+        self._queued = 0
+        self._done = 0
+        self._waiters: list[tuple[int, asyncio.Future]] = []
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def put(self, statement: str, params: Sequence[Any]) -> None:
+        try:
+            self._queue.put_nowait((statement, params))
+        except asyncio.QueueFull:
+            await self._queue.put((statement, params))
+        self._queued += 1
+
+    async def flush(self) -> None:
+        """Wait until every row queued before the call has been written (or has failed)."""
+        if self._task is None:
+            await self._write(self._drain(self._queue.qsize()))
+            return
+        if self._done >= self._queued:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((self._queued, waiter))
+        await waiter
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _drain(self, limit: int) -> list[WriteOp]:
+        batch: list[WriteOp] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            batch += self._drain(self._max_batch_size - 1)
+            if len(batch) < self._max_batch_size and self._flush_interval > 0:
+                await asyncio.sleep(self._flush_interval)
+                batch += self._drain(self._max_batch_size - len(batch))
+            await self._write(batch)
+
+    async def _write(self, batch: list[WriteOp]) -> None:
+        if not batch:
+            return
+
+        grouped: dict[str, list[Sequence[Any]]] = {}
+        for statement, params in batch:
+            grouped.setdefault(statement, []).append(params)
+
+        try:
+            async with self._database.connection() as conn:
+                for statement, rows in grouped.items():
+                    await conn.executemany(statement, rows)
+            self.written += len(batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("Failed to write %d buffered rows", len(batch))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+            # The queue is FIFO, so everything up to this count has been through a batch
+            self._done += len(batch)
+            waiting = []
+            for target, waiter in self._waiters:
+                if target > self._done:
+                    waiting.append((target, waiter))
+                elif not waiter.done():
+                    waiter.set_result(None)
+            self._waiters = waiting
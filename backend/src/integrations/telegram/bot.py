@@ -1,17 +1,17 @@
-from dataclasses import dataclass
-
-import httpx
+from dataclasses import dataclass, field
 
 from src.config.settings import Settings
 from src.integrations.telegram.commands import TelegramCommandHandler
 from src.integrations.telegram.formatters import format_summary
 from src.integrations.telegram.security import is_chat_allowed, parse_whitelist
+from src.services.http_clients import HttpClientPool
 
 
 @dataclass
 class TelegramBotIntegration:
     settings: Settings
     command_handler: TelegramCommandHandler
+    http_clients: HttpClientPool = field(default_factory=HttpClientPool)
 
     @property
     def enabled(self) -> bool:
@@ -25,17 +25,17 @@ class TelegramBotIntegration:
         if not is_chat_allowed(chat_id, whitelist):
             return False
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.post(
-                f"https://api.telegram.org/bot{self.settings.telegram_bot_token}/sendMessage",
-                json={
-                    "chat_id": chat_id,
-                    "text": text,
-                    "parse_mode": "MarkdownV2",
-                    "disable_web_page_preview": True,
-                },
-            )
-            response.raise_for_status()
+        client = self.http_clients.client(self.settings.telegram_api_base_url)
+        response = await client.post(
+            f"/bot{self.settings.telegram_bot_token}/sendMessage",
+            json={
+                "chat_id": chat_id,
+                "text": text,
+                "parse_mode": "MarkdownV2",
+                "disable_web_page_preview": True,
+            },
+        )
+        response.raise_for_status()
 
         return True
 
@@ -1,21 +1,34 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.router import api_router
+from src.api.websocket import ingest_segments
 from src.config.settings import get_settings
 from src.db.database import Database
 from src.db.migrations import apply_migrations
-from src.db.repositories import MeetingRepository
+from src.db.repositories import MeetingRepository, MeetingStateRepository
+from src.db.write_behind import WriteBehindQueue
 from src.integrations.telegram.bot import TelegramBotIntegration
 from src.integrations.telegram.commands import TelegramCommandHandler
 from src.services.ai.elevenlabs_provider import ElevenLabsRealtimeProvider
 from src.services.ai.openai_provider import OpenAIRealtimeProvider
 from src.services.ai.prompts import PromptLoader
+from src.services.audio_gate import AudioGate
+from src.services.broker import create_broker
 from src.services.export_service import ExportService
+from src.services.http_clients import HttpClientPool
+from src.services.ingest_pipeline import IngestPipeline
+from src.services.insight_rules import load_insight_classifier
+from src.services.snapshot_cache import SnapshotCache
 from src.services.state_manager import StateManager
+from src.services.summary_scheduler import SummaryFlushScheduler
+from src.services.transcript_stitcher import TranscriptStitcher
 from src.services.meeting_service import MeetingService
+from src.services.rate_limiter import IngestRateLimiter
 from src.services.websocket_manager import WebSocketConnectionManager
 
 
@@ -29,19 +42,156 @@ async def lifespan(app: FastAPI):
     app.state.database = database
     app.state.meeting_repository = MeetingRepository(database)
     app.state.meeting_service = MeetingService(app.state.meeting_repository)
-    app.state.state_manager = StateManager(min_update_interval_seconds=30)
-    app.state.websocket_manager = WebSocketConnectionManager()
-    app.state.telegram_bot = TelegramBotIntegration(settings=settings, command_handler=TelegramCommandHandler())
+    app.state.write_behind = WriteBehindQueue(
+        database,
+        max_batch_size=settings.persistence_batch_size,
+        flush_interval_seconds=settings.persistence_flush_interval_seconds,
+        max_pending=settings.persistence_max_pending,
+    )
+    app.state.write_behind.start()
+    app.state.meeting_state_repository = MeetingStateRepository(database, app.state.write_behind)
+    app.state.state_manager = StateManager(
+        min_update_interval_seconds=settings.summary_min_update_interval_seconds,
+        transcript_tail_size=settings.transcript_tail_size,
+        transcript_spill_dir=settings.transcript_spill_dir or None,
+        classifier=load_insight_classifier(
+            [pack.strip() for pack in settings.insight_rule_packs.split(",") if pack.strip()],
+        ),
+        state_loader=app.state.meeting_state_repository.load,
+        max_meetings=settings.state_max_meetings,
+        memory_budget_bytes=settings.state_memory_budget_mb * 1024 * 1024,
+        idle_ttl_seconds=settings.state_idle_ttl_seconds,
+        stopped_ttl_seconds=settings.state_stopped_ttl_seconds,
+        search_max_documents=settings.search_max_documents,
+        answer_cache_size=settings.answer_cache_size,
+        dedup_window_size=settings.dedup_window_size,
+        dedup_window_seconds=settings.dedup_window_seconds,
+        dedup_memory_budget_bytes=settings.dedup_memory_budget_kb * 1024,
+    )
+    if settings.state_restore_on_startup:
+        await app.state.state_manager.restore(
+            await app.state.meeting_state_repository.active_meeting_ids(
+                settings.state_max_meetings
+            ),
+        )
+    app.state.websocket_manager = WebSocketConnectionManager(
+        max_queue_size=settings.websocket_send_queue_size,
+        slow_consumer_policy=settings.websocket_slow_consumer_policy,
+        event_log_size=settings.websocket_event_log_size,
+        event_log_meetings=settings.state_max_meetings,
+        broker=create_broker(
+            settings.websocket_broker_url,
+            max_batch_size=settings.websocket_broker_batch_size,
+            flush_interval_seconds=settings.websocket_broker_flush_interval_seconds,
+        ),
+    )
+    await app.state.websocket_manager.start()
+    app.state.snapshot_cache = SnapshotCache(max_bytes=settings.snapshot_cache_mb * 1024 * 1024)
+    app.state.summary_scheduler = SummaryFlushScheduler(
+        app.state.state_manager,
+        app.state.websocket_manager,
+        min_delay_seconds=settings.summary_flush_min_delay_seconds,
+        max_delay_seconds=settings.summary_flush_max_delay_seconds,
+        busy_segment_rate=settings.summary_flush_busy_segment_rate,
+        busy_subscriber_count=settings.summary_flush_busy_subscribers,
+        max_meetings=settings.state_max_meetings,
+    )
+    app.state.transcript_stitcher = TranscriptStitcher(
+        min_overlap_tokens=settings.transcript_stitch_min_overlap_tokens,
+        max_overlap_tokens=settings.transcript_stitch_max_overlap_tokens,
+        max_meetings=settings.state_max_meetings,
+    )
+    app.state.ingest_rate_limiter = IngestRateLimiter(
+        meeting_rate=settings.ingest_meeting_segments_per_second,
+        meeting_burst=settings.ingest_meeting_burst,
+        connection_rate=settings.ingest_connection_segments_per_second,
+        connection_burst=settings.ingest_connection_burst,
+        policy=settings.ingest_overflow_policy,
+        max_coalesced_chars=settings.ingest_coalesce_max_chars,
+        max_meetings=settings.state_max_meetings,
+    )
+    ingest_executor = None
+    if settings.ingest_workers > 0:
+        ingest_executor = ThreadPoolExecutor(
+            max_workers=settings.ingest_workers,
+            thread_name_prefix="ingest",
+        )
+    app.state.ingest_pipeline = IngestPipeline(
+        app.state.state_manager,
+        app.state.meeting_state_repository,
+        app.state.websocket_manager,
+        app.state.summary_scheduler,
+        executor=ingest_executor,
+        max_queue_size=settings.ingest_queue_size,
+    )
+    app.state.http_clients = HttpClientPool.from_settings(settings)
+    app.state.telegram_bot = TelegramBotIntegration(
+        settings=settings,
+        command_handler=TelegramCommandHandler(),
+        http_clients=app.state.http_clients,
+    )
     app.state.export_service = ExportService()
     app.state.prompt_loader = PromptLoader()
     app.state.realtime_providers = {
-        "openai": OpenAIRealtimeProvider(settings),
-        "elevenlabs": ElevenLabsRealtimeProvider(settings),
+        "openai": OpenAIRealtimeProvider(settings, app.state.http_clients),
+        "elevenlabs": ElevenLabsRealtimeProvider(settings, app.state.http_clients),
     }
     app.state.active_stt_provider = settings.stt_provider.lower()
+    app.state.audio_gate = None
+    if settings.stt_vad_enabled:
+        app.state.audio_gate = AudioGate(
+            threshold_db=settings.stt_vad_threshold_db,
+            frame_ms=settings.stt_vad_frame_ms,
+            min_speech_ms=settings.stt_vad_min_speech_ms,
+            padding_ms=settings.stt_vad_padding_ms,
+            target_seconds=settings.stt_coalesce_target_seconds,
+            max_wait_seconds=settings.stt_coalesce_max_wait_seconds,
+            max_streams=settings.state_max_meetings,
+        )
+
+    eviction_task = asyncio.create_task(
+        app.state.state_manager.run_eviction(settings.state_eviction_interval_seconds),
+    )
+    heartbeat_task = asyncio.create_task(
+        app.state.websocket_manager.run_heartbeats(
+            settings.websocket_heartbeat_interval_seconds,
+            settings.websocket_heartbeat_timeout_seconds,
+        ),
+    )
+    background_tasks = [eviction_task, heartbeat_task]
+    if app.state.audio_gate is not None:
+        # Timed-out windows are transcribed here, the provider looked up per call, and their
+        # text joins the meeting's transcript like any segment from a socket
+        background_tasks.append(
+            asyncio.create_task(
+                app.state.audio_gate.run_flush(
+                    settings.stt_coalesce_flush_interval_seconds,
+                    lambda audio, mime_type: app.state.realtime_providers[
+                        "elevenlabs"
+                    ].transcribe_audio_chunk(audio, mime_type),
+                    lambda meeting_id, text: ingest_segments(
+                        app.state.websocket_manager,
+                        app.state.ingest_pipeline,
+                        meeting_id,
+                        [(text, None)],
+                    ),
+                ),
+            )
+        )
 
     yield
 
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await app.state.ingest_pipeline.close()
+    if ingest_executor is not None:
+        ingest_executor.shutdown(wait=False, cancel_futures=True)
+    await app.state.summary_scheduler.close()
+    await app.state.websocket_manager.close()
+    await app.state.write_behind.close()
+    await app.state.http_clients.close()
+
 
 def create_app() -> FastAPI:
     settings = get_settings()
@@ -1,8 +1,11 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from src.models.insights import ActionItem, Decision, InsightKind, OpenQuestion, Risk
+
 MeetingStatus = Literal["active", "stopped"]
 
 
@@ -35,3 +38,12 @@ class LiveSummarySnapshot(BaseModel):
     meeting_id: str
     summary: str
     created_at: datetime
+
+
+@dataclass(slots=True)
+class MeetingStateRecord:
+    status: MeetingStatus
+    segments: list[tuple[str | None, str]] = field(default_factory=list)
+    insights: list[tuple[InsightKind, Decision | ActionItem | Risk | OpenQuestion]] = field(
+        default_factory=list,
+    )
@@ -16,6 +16,8 @@ EventType = Literal[
     "bot.flag",
     "provider.status",
     "meeting.connected",
+    "meeting.ping",
+    "meeting.pong",
 ]
 
 
@@ -1,17 +1,18 @@
 import base64
-from typing import Any
-
-import httpx
+from typing import Any, BinaryIO
 
 from src.config.settings import Settings
 from src.services.ai.provider_base import EphemeralToken, RealtimeProvider
+from src.services.audio_upload import MultipartUpload
+from src.services.http_clients import HttpClientPool
 
 
 class ElevenLabsRealtimeProvider(RealtimeProvider):
     provider_name = "elevenlabs"
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_clients: HttpClientPool | None = None):
         self._settings = settings
+        self._http_clients = http_clients or HttpClientPool.from_settings(settings)
 
     async def create_ephemeral_token(self) -> EphemeralToken:
         if not self._settings.elevenlabs_api_key:
@@ -25,34 +26,36 @@ class ElevenLabsRealtimeProvider(RealtimeProvider):
         )
 
     async def transcribe_audio_chunk_base64(self, audio_base64: str, mime_type: str) -> dict[str, Any]:
-        if not self._settings.elevenlabs_api_key:
-            raise ValueError("ELEVENLABS_API_KEY is not configured")
-
         try:
             audio_bytes = base64.b64decode(audio_base64)
         except Exception as exc:
             raise ValueError("Invalid base64 audio payload") from exc
 
+        return await self.transcribe_audio_chunk(audio_bytes, mime_type)
+
+    async def transcribe_audio_chunk(
+        self, audio: bytes | BinaryIO, mime_type: str
+    ) -> dict[str, Any]:
+        """Upload raw audio; a file object is streamed to the API in chunks, not copied."""
+        if not self._settings.elevenlabs_api_key:
+            raise ValueError("ELEVENLABS_API_KEY is not configured")
+
+        upload = MultipartUpload(
+            {"model_id": self._settings.elevenlabs_stt_model},
+            "file",
+            "chunk.webm",
+            audio,
+            mime_type,
+        )
         headers = {
             "xi-api-key": self._settings.elevenlabs_api_key,
+            **upload.headers,
         }
 
-        files = {
-            "file": ("chunk.webm", audio_bytes, mime_type),
-        }
-        data = {
-            "model_id": self._settings.elevenlabs_stt_model,
-        }
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                "https://api.elevenlabs.io/v1/speech-to-text",
-                headers=headers,
-                data=data,
-                files=files,
-            )
-            response.raise_for_status()
-            payload: dict[str, Any] = response.json()
+        client = self._http_clients.client(self._settings.elevenlabs_base_url)
+        response = await client.post("/v1/speech-to-text", headers=headers, content=upload)
+        response.raise_for_status()
+        payload: dict[str, Any] = response.json()
 
         text = (
             payload.get("text")
@@ -1,16 +1,16 @@
 from typing import Any
 
-import httpx
-
 from src.config.settings import Settings
 from src.services.ai.provider_base import EphemeralToken, RealtimeProvider
+from src.services.http_clients import HttpClientPool
 
 
 class OpenAIRealtimeProvider(RealtimeProvider):
     provider_name = "openai"
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_clients: HttpClientPool | None = None):
         self._settings = settings
+        self._http_clients = http_clients or HttpClientPool.from_settings(settings)
 
     async def create_ephemeral_token(self) -> EphemeralToken:
         if not self._settings.openai_api_key:
@@ -26,14 +26,14 @@ class OpenAIRealtimeProvider(RealtimeProvider):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/realtime/sessions",
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
+        client = self._http_clients.client(self._settings.openai_base_url)
+        response = await client.post(
+            "/v1/realtime/sessions",
+            headers=headers,
+            json=payload,
+        )
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
 
         client_secret = data.get("client_secret", {}).get("value")
         if not client_secret:
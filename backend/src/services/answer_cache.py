@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+DEFAULT_ANSWER_CACHE_SIZE = 128
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+@dataclass(slots=True)
+class CachedAnswer:
+    dependencies: tuple[int, ...]
+    answer: str
+
+
+class AnswerCache:
+    """LRU of answers keyed by normalized question.
+
+    Each entry remembers the versions of the state collections its answer was built
+    from, so a change only invalidates the answers that read the changed collection.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_ANSWER_CACHE_SIZE):
+        self._max_entries = max(max_entries, 1)
+        self._entries: OrderedDict[str, CachedAnswer] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, dependencies: tuple[int, ...]) -> str | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.dependencies == dependencies:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.answer
+
+        if entry is not None:
+            del self._entries[key]
+            self.invalidations += 1
+        self.misses += 1
+        return None
+
+    def put(self, key: str, dependencies: tuple[int, ...], answer: str) -> None:
+        self._entries[key] = CachedAnswer(dependencies, answer)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
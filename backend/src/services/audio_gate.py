@@ -0,0 +1,296 @@
+import asyncio
+import io
+import logging
+import sys
+import wave
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # optional, frame energies fall back to a pure Python loop
+    np = None
+
+WAV_MIME_TYPES = ("audio/wav", "audio/x-wav", "audio/wave", "audio/vnd.wave")
+PCM_MIME_TYPE = "audio/pcm"
+FULL_SCALE_POWER = 32768.0**2
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PcmAudio:
+    """Interleaved 16-bit little-endian samples."""
+
+    samples: bytes
+    sample_rate: int
+    channels: int
+
+    @property
+    def seconds(self) -> float:
+        return len(self.samples) / (2 * self.channels * self.sample_rate)
+
+    def to_wav(self) -> bytes:
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as writer:
+            writer.setnchannels(self.channels)
+            writer.setsampwidth(2)
+            writer.setframerate(self.sample_rate)
+            writer.writeframes(self.samples)
+        return buffer.getvalue()
+
+
+def _mime_base(mime_type: str) -> str:
+    return mime_type.partition(";")[0].strip().lower()
+
+
+def parse_pcm(data: bytes, mime_type: str) -> PcmAudio:
+    """A 16-bit WAV file, or ``audio/pcm;rate=16000;channels=1`` raw samples."""
+    base, _, params = mime_type.partition(";")
+    if base.strip().lower() == PCM_MIME_TYPE:
+        options = dict(
+            (key.strip().lower(), value.strip())
+            for key, _, value in (param.partition("=") for param in params.split(";"))
+        )
+        try:
+            rate, channels = int(options.get("rate", 16000)), int(options.get("channels", 1))
+        except ValueError as exc:
+            raise ValueError(f"Invalid PCM audio parameters: {mime_type}") from exc
+        if rate <= 0 or channels <= 0:
+            raise ValueError(f"Invalid PCM audio parameters: {mime_type}")
+        return PcmAudio(data[: len(data) - len(data) % (2 * channels)], rate, channels)
+
+    try:
+        with wave.open(io.BytesIO(data)) as reader:
+            if reader.getsampwidth() != 2:
+                raise ValueError("Only 16-bit WAV audio can be gated")
+            frames = reader.readframes(reader.getnframes())
+            return PcmAudio(frames, reader.getframerate(), reader.getnchannels())
+    except (wave.Error, EOFError) as exc:
+        raise ValueError("Invalid WAV audio payload") from exc
+
+
+def voiced_frames(audio: PcmAudio, frame_samples: int, threshold_db: float) -> list[bool]:
+    """Whether each whole frame's RMS level is above ``threshold_db`` dBFS."""
+    width = frame_samples * audio.channels
+    threshold = FULL_SCALE_POWER * 10 ** (threshold_db / 10)
+    if np is not None:
+        samples = np.frombuffer(audio.samples, dtype="<i2")
+        count = len(samples) // width
+        frames = samples[: count * width].reshape(count, width).astype(np.float32)
+        return (np.einsum("ij,ij->i", frames, frames) / width > threshold).tolist()
+
+    samples = array("h", audio.samples)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    count = len(samples) // width
+    return [
+        sum(sample * sample for sample in samples[start : start + width]) / width > threshold
+        for start in range(0, count * width, width)
+    ]
+
+
+@dataclass(slots=True)
+class PendingWindow:
+    sample_rate: int
+    channels: int
+    started: float
+    chunks: list[bytes] = field(default_factory=list)
+    seconds: float = 0.0
+    meeting_id: str | None = None
+
+
+def _joined(pending: PendingWindow) -> PcmAudio:
+    return PcmAudio(b"".join(pending.chunks), pending.sample_rate, pending.channels)
+
+
+@dataclass(slots=True)
+class GateResult:
+    """``silent`` and ``buffered`` chunks need no STT call; ``ready`` carries a WAV window."""
+
+    status: str
+    audio: bytes | None = None
+    mime_type: str = "audio/wav"
+
+
+class AudioGate:
+    """Pre-STT stage for 16-bit PCM chunks: skips silence and batches short speech.
+
+    Chunks are cut into ``frame_ms`` frames, and a frame is speech when its RMS level is
+    above ``threshold_db``. Chunks with less than ``min_speech_ms`` of speech are dropped
+    and the rest lose any leading and trailing silence beyond ``padding_ms``. Chunks sent
+    with a ``stream`` key are held until they add up to ``target_seconds``, a silent chunk
+    ends the utterance or the stream sends ``final``, and then go out as one WAV window.
+
+    Nobody is left to read the response for a window that waits ``max_wait_seconds``
+    without another chunk, or whose stream is evicted past ``max_streams``. If its chunks
+    named a ``meeting_id``, ``run_flush`` transcribes it and delivers the text to that
+    meeting. Otherwise it is abandoned without an upstream call, so such clients should
+    end their streams with ``final``.
+    """
+
+    def __init__(
+        self,
+        threshold_db: float = -45.0,
+        frame_ms: int = 30,
+        min_speech_ms: int = 150,
+        padding_ms: int = 200,
+        target_seconds: float = 4.0,
+        max_wait_seconds: float = 10.0,
+        max_streams: int = 1000,
+    ):
+        self._threshold_db = threshold_db
+        self._frame_ms = max(frame_ms, 1)
+        self._min_speech_frames = max(-(-min_speech_ms // self._frame_ms), 1)
+        self._padding_frames = max(padding_ms // self._frame_ms, 0)
+        self._target_seconds = target_seconds
+        self._max_wait_seconds = max_wait_seconds
+        self._max_streams = max(max_streams, 1)
+        self._pending: OrderedDict[str, PendingWindow] = OrderedDict()
+        self._orphans: list[PendingWindow] = []
+        self._counts: Counter = Counter()
+
+    def accepts(self, mime_type: str) -> bool:
+        base = _mime_base(mime_type)
+        return base in WAV_MIME_TYPES or base == PCM_MIME_TYPE
+
+    def process(
+        self,
+        data: bytes,
+        mime_type: str,
+        stream: str | None = None,
+        final: bool = False,
+        now: float | None = None,
+        meeting_id: str | None = None,
+    ) -> GateResult:
+        now = monotonic() if now is None else now
+        audio = parse_pcm(data, mime_type)
+        self._counts["chunks"] += 1
+        self._counts["audio_seconds_in"] += audio.seconds
+
+        speech = self._trim(audio)
+        pending = self._pending.get(stream) if stream is not None else None
+        if speech is None:
+            self._counts["silent_chunks"] += 1
+            # A pause after speech ends the utterance, so what is held goes out now
+            if pending is not None:
+                return self._flush(stream)
+            return GateResult("silent")
+        if stream is None:
+            return self._send(speech)
+
+        if pending is not None and (pending.sample_rate, pending.channels) != (
+            speech.sample_rate,
+            speech.channels,
+        ):
+            # The format changed mid-stream: send what is held and start a new window
+            result = self._flush(stream)
+            self._hold(stream, speech, now, meeting_id)
+            return result
+
+        pending = self._hold(stream, speech, now, meeting_id)
+        if final or pending.seconds >= self._target_seconds or self._expired(pending, now):
+            return self._flush(stream)
+        self._counts["buffered_chunks"] += 1
+        return GateResult("buffered")
+
+    def expire(self, now: float | None = None) -> list[tuple[str, GateResult]]:
+        """Windows nobody is waiting for, evicted or held past the max wait, by meeting.
+
+        Only windows with a meeting to deliver their text to are sent on; the rest are
+        counted as abandoned and never cost an upstream call.
+        """
+        now = monotonic() if now is None else now
+        orphans, self._orphans = self._orphans, []
+        stale = [stream for stream, pending in self._pending.items() if self._expired(pending, now)]
+        orphans.extend(self._pending.pop(stream) for stream in stale)
+        self._counts["expired_windows"] += len(orphans)
+        expired = []
+        for pending in orphans:
+            if pending.meeting_id is None:
+                self._counts["abandoned_windows"] += 1
+            else:
+                expired.append((pending.meeting_id, self._send(_joined(pending))))
+        return expired
+
+    async def run_flush(
+        self,
+        interval_seconds: float,
+        transcribe: Callable[[bytes, str], Awaitable[dict[str, Any]]],
+        deliver: Callable[[str, str], Awaitable[None]],
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            for meeting_id, result in self.expire():
+                try:
+                    payload = await transcribe(result.audio, result.mime_type)
+                    text = str(payload.get("text", "")).strip()
+                    if text:
+                        await deliver(meeting_id, text)
+                except Exception:
+                    self._counts["failed_windows"] += 1
+                    logger.warning("Transcribing a held audio window failed", exc_info=True)
+
+    def stats(self) -> dict[str, float]:
+        counts = self._counts
+        return {
+            "chunks": counts["chunks"],
+            "silent_chunks": counts["silent_chunks"],
+            "buffered_chunks": counts["buffered_chunks"],
+            "expired_windows": counts["expired_windows"],
+            "abandoned_windows": counts["abandoned_windows"],
+            "failed_windows": counts["failed_windows"],
+            "upstream_calls": counts["upstream_calls"],
+            "upstream_calls_saved": counts["chunks"] - counts["upstream_calls"],
+            "audio_seconds_in": round(counts["audio_seconds_in"], 3),
+            "audio_seconds_sent": round(counts["audio_seconds_sent"], 3),
+            "audio_seconds_saved": round(
+                counts["audio_seconds_in"] - counts["audio_seconds_sent"], 3
+            ),
+        }
+
+    def _trim(self, audio: PcmAudio) -> PcmAudio | None:
+        frame_samples = max(audio.sample_rate * self._frame_ms // 1000, 1)
+        voiced = voiced_frames(audio, frame_samples, self._threshold_db)
+        if sum(voiced) < self._min_speech_frames:
+            return None
+        first = voiced.index(True)
+        last = len(voiced) - 1 - voiced[::-1].index(True)
+        frame_bytes = frame_samples * audio.channels * 2
+        start = max(first - self._padding_frames, 0) * frame_bytes
+        end = (last + 1 + self._padding_frames) * frame_bytes
+        if end >= len(voiced) * frame_bytes:
+            end = len(audio.samples)
+        if start == 0 and end == len(audio.samples):
+            return audio
+        return PcmAudio(audio.samples[start:end], audio.sample_rate, audio.channels)
+
+    def _expired(self, pending: PendingWindow, now: float) -> bool:
+        return now - pending.started >= self._max_wait_seconds
+
+    def _hold(
+        self, stream: str, audio: PcmAudio, now: float, meeting_id: str | None
+    ) -> PendingWindow:
+        pending = self._pending.get(stream)
+        if pending is None:
+            pending = self._pending[stream] = PendingWindow(audio.sample_rate, audio.channels, now)
+            if len(self._pending) > self._max_streams:
+                self._orphans.append(self._pending.popitem(last=False)[1])
+        else:
+            self._pending.move_to_end(stream)
+        pending.meeting_id = meeting_id or pending.meeting_id
+        pending.chunks.append(audio.samples)
+        pending.seconds += audio.seconds
+        return pending
+
+    def _flush(self, stream: str) -> GateResult:
+        return self._send(_joined(self._pending.pop(stream)))
+
+    def _send(self, audio: PcmAudio) -> GateResult:
+        self._counts["upstream_calls"] += 1
+        self._counts["audio_seconds_sent"] += audio.seconds
+        return GateResult("ready", audio.to_wav())
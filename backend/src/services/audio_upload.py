@@ -0,0 +1,100 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
+from uuid import uuid4
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+async def limit_stream(chunks: AsyncIterator[bytes], max_bytes: int = 0) -> AsyncIterator[bytes]:
+    """Passes a request body through, failing as soon as it grows past ``max_bytes``."""
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if max_bytes > 0 and size > max_bytes:
+            raise UploadTooLarge(f"Audio upload exceeds {max_bytes} bytes")
+        yield chunk
+
+
+async def spool_stream(
+    chunks: AsyncIterator[bytes],
+    spool_bytes: int = 1024 * 1024,
+    max_bytes: int = 0,
+) -> SpooledTemporaryFile:
+    """Collect a request body in memory, moving it to a temp file past ``spool_bytes``."""
+    spool = SpooledTemporaryFile(max_size=spool_bytes)
+    size = 0
+    try:
+        async for chunk in limit_stream(chunks, max_bytes):
+            size += len(chunk)
+            # Past the spool size a write rolls the body over to disk, or appends to it there
+            if size > spool_bytes:
+                await asyncio.to_thread(spool.write, chunk)
+            else:
+                spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+class MultipartUpload:
+    """A ``multipart/form-data`` body of text fields and one file part, sent as a stream.
+
+    The file is read in ``CHUNK_SIZE`` pieces on a worker thread, so a large spooled upload
+    is neither copied into memory nor read on the event loop. The length is known up front
+    and sent as ``Content-Length``.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        name: str,
+        filename: str,
+        file: BinaryIO | bytes,
+        content_type: str,
+    ):
+        self._boundary = uuid4().hex
+        self._file = file
+        parts = [
+            f'--{self._boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n'
+            f"{value}\r\n"
+            for key, value in fields.items()
+        ]
+        parts.append(
+            f'--{self._boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'
+        )
+        self._head = "".join(parts).encode()
+        self._tail = f"\r\n--{self._boundary}--\r\n".encode()
+        if isinstance(file, bytes):
+            self._size = len(file)
+        else:
+            self._start = file.tell()
+            self._size = file.seek(0, os.SEEK_END) - self._start
+            file.seek(self._start)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self._boundary}",
+            "Content-Length": str(len(self._head) + self._size + len(self._tail)),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        if isinstance(self._file, bytes):
+            yield self._file
+        else:
+            # Seek back on every pass, so a retried request sends the whole file again
+            self._file.seek(self._start)
+            while chunk := await asyncio.to_thread(self._file.read, CHUNK_SIZE):
+                yield chunk
+        yield self._tail
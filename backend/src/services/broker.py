@@ -0,0 +1,365 @@
+import asyncio
+import logging
+import sys
+from collections.abc import Callable
+from typing import Protocol
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL_PREFIX = "meeting-copilot:"
+DEFAULT_SERVER_URL = "unix:///tmp/meeting-copilot-broker.sock"
+
+Deliver = Callable[[str, list[str]], None]
+
+
+class BrokerError(Exception):
+    pass
+
+
+class MessageBroker(Protocol):
+    """Carries encoded broadcast frames between the processes serving one deployment.
+
+    Publishers deliver to their own sockets directly, so a broker only has to reach
+    the other processes; ``deliver`` is called with a meeting id and the frames that
+    arrived for it from elsewhere.
+    """
+
+    async def start(self, deliver: Deliver) -> None: ...
+
+    def subscribe(self, meeting_id: str) -> None: ...
+
+    def unsubscribe(self, meeting_id: str) -> None: ...
+
+    def publish(self, meeting_id: str, text: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalBroker:
+    """Single-process default: every socket is local, so there is nothing to forward."""
+
+    async def start(self, deliver: Deliver) -> None:
+        return None
+
+    def subscribe(self, meeting_id: str) -> None:
+        return None
+
+    def unsubscribe(self, meeting_id: str) -> None:
+        return None
+
+    def publish(self, meeting_id: str, text: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+def encode_command(*parts: str | bytes) -> bytes:
+    chunks = [b"*%d\r\n" % len(parts)]
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        chunks.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(chunks)
+
+
+async def read_reply(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Broker connection closed")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise BrokerError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        size = int(body)
+        return None if size < 0 else (await reader.readexactly(size + 2))[:-2]
+    if kind == b"*":
+        size = int(body)
+        return None if size < 0 else [await read_reply(reader) for _ in range(size)]
+    raise BrokerError(f"Unexpected broker reply: {line!r}")
+
+
+async def open_connection(url: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    parsed = urlsplit(url)
+    if parsed.scheme == "unix":
+        return await asyncio.open_unix_connection(parsed.path)
+    if parsed.scheme == "redis":
+        return await asyncio.open_connection(parsed.hostname or "localhost", parsed.port or 6379)
+    raise ValueError(f"Unsupported broker url: {url}")
+
+
+class RespBroker:
+    """Pub/sub over the Redis protocol: a real Redis, or ``LocalPubSubServer`` on one host.
+
+    ``publish`` only queues. A flusher task waits ``flush_interval_seconds`` after the
+    first queued frame, packs up to ``max_batch_size`` frames per meeting into one
+    PUBLISH (frames are JSON without raw newlines, so the payload is the origin id and
+    the frames joined by newlines) and writes all commands in one pipelined write.
+    Frames that come back from this process are skipped. When the broker is down,
+    queued frames are dropped; clients recover through the usual version-gap resync.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        channel_prefix: str = DEFAULT_CHANNEL_PREFIX,
+        max_batch_size: int = 256,
+        flush_interval_seconds: float = 0.002,
+        max_pending: int = 10_000,
+        retry_delay_seconds: float = 0.5,
+    ):
+        self._url = url
+        self._prefix = channel_prefix
+        self._max_batch_size = max(max_batch_size, 1)
+        self._flush_interval = max(flush_interval_seconds, 0.0)
+        self._max_pending = max(max_pending, 1)
+        self._retry_delay = retry_delay_seconds
+        self._origin = uuid4().hex
+        self._deliver: Deliver | None = None
+        self._channels: set[str] = set()
+        self._pending: dict[str, list[str]] = {}
+        self._pending_count = 0
+        self._ready = asyncio.Event()
+        self._publisher: asyncio.StreamWriter | None = None
+        self._publisher_replies: asyncio.Task | None = None
+        self._subscriber: asyncio.StreamWriter | None = None
+        self._tasks: list[asyncio.Task] = []
+        self.subscribed: set[str] = set()
+        self.published = 0
+        self.publish_commands = 0
+        self.received = 0
+        self.dropped = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run_subscriber()),
+                asyncio.create_task(self._run_publisher()),
+            ]
+
+    def subscribe(self, meeting_id: str) -> None:
+        channel = self._prefix + meeting_id
+        self._channels.add(channel)
+        if self._subscriber is not None:
+            self._subscriber.write(encode_command("SUBSCRIBE", channel))
+
+    def unsubscribe(self, meeting_id: str) -> None:
+        channel = self._prefix + meeting_id
+        self._channels.discard(channel)
+        if self._subscriber is not None:
+            self._subscriber.write(encode_command("UNSUBSCRIBE", channel))
+
+    def publish(self, meeting_id: str, text: str) -> None:
+        if self._pending_count >= self._max_pending:
+            self.dropped += 1
+            return
+        self._pending.setdefault(self._prefix + meeting_id, []).append(text)
+        self._pending_count += 1
+        self._ready.set()
+
+    async def close(self) -> None:
+        if self._pending:
+            try:
+                await self._flush()
+            except (OSError, ConnectionError):
+                logger.warning("Broker was unreachable, dropped frames queued at shutdown")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._drop_publisher()
+
+    async def _run_publisher(self) -> None:
+        while True:
+            await self._ready.wait()
+            if self._flush_interval:
+                await asyncio.sleep(self._flush_interval)
+            try:
+                await self._flush()
+            except (OSError, ConnectionError):
+                logger.warning("Broker publish failed, dropping queued frames", exc_info=True)
+                self._drop_publisher()
+                await asyncio.sleep(self._retry_delay)
+
+    async def _flush(self) -> None:
+        batch, count = self._pending, self._pending_count
+        self._pending, self._pending_count = {}, 0
+        self._ready.clear()
+
+        commands = []
+        for channel, texts in batch.items():
+            for start in range(0, len(texts), self._max_batch_size):
+                chunk = texts[start : start + self._max_batch_size]
+                payload = "\n".join([self._origin, *chunk])
+                commands.append(encode_command("PUBLISH", channel, payload))
+
+        try:
+            if self._publisher is None:
+                reader, self._publisher = await open_connection(self._url)
+                self._publisher_replies = asyncio.create_task(self._discard_replies(reader))
+            self._publisher.write(b"".join(commands))
+            await self._publisher.drain()
+        except BaseException:
+            self.dropped += count
+            raise
+        self.published += count
+        self.publish_commands += len(commands)
+
+    async def _discard_replies(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                await read_reply(reader)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, BrokerError):
+            logger.debug("Broker publisher connection closed", exc_info=True)
+            self._drop_publisher()
+
+    def _drop_publisher(self) -> None:
+        if self._publisher_replies is not None:
+            self._publisher_replies.cancel()
+            self._publisher_replies = None
+        if self._publisher is not None:
+            self._publisher.close()
+            self._publisher = None
+
+    async def _run_subscriber(self) -> None:
+        while True:
+            try:
+                reader, writer = await open_connection(self._url)
+            except OSError:
+                logger.warning("Broker is unreachable at %s, retrying", self._url)
+                await asyncio.sleep(self._retry_delay)
+                continue
+
+            self._subscriber = writer
+            if self._channels:
+                writer.write(encode_command("SUBSCRIBE", *self._channels))
+            try:
+                while True:
+                    self._handle(await read_reply(reader))
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, BrokerError):
+                logger.warning("Broker subscription dropped, reconnecting", exc_info=True)
+            finally:
+                self._subscriber = None
+                self.subscribed.clear()
+                writer.close()
+            await asyncio.sleep(self._retry_delay)
+
+    def _handle(self, reply) -> None:
+        if not isinstance(reply, list) or len(reply) != 3:
+            return
+        kind, channel = reply[0], reply[1].decode()
+        if kind == b"subscribe":
+            self.subscribed.add(channel)
+        elif kind == b"unsubscribe":
+            self.subscribed.discard(channel)
+        elif kind == b"message" and channel.startswith(self._prefix):
+            origin, *texts = reply[2].decode().split("\n")
+            if origin == self._origin or self._deliver is None:
+                return
+            self.received += len(texts)
+            self._deliver(channel[len(self._prefix) :], texts)
+
+
+def create_broker(url: str, **options) -> MessageBroker:
+    return RespBroker(url, **options) if url else LocalBroker()
+
+
+class LocalPubSubServer:
+    """Stand-in for the part of Redis ``RespBroker`` uses, for hosts without Redis.
+
+    Speaks SUBSCRIBE, UNSUBSCRIBE, PUBLISH and PING over a Unix socket or TCP. A
+    subscriber whose unsent output grows past ``max_buffer_bytes`` is disconnected.
+    """
+
+    def __init__(self, max_buffer_bytes: int = 16 * 1024 * 1024):
+        self._max_buffer_bytes = max_buffer_bytes
+        self._subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, url: str = DEFAULT_SERVER_URL) -> None:
+        parsed = urlsplit(url)
+        if parsed.scheme == "unix":
+            self._server = await asyncio.start_unix_server(self._serve, parsed.path)
+        elif parsed.scheme == "redis":
+            host, port = parsed.hostname or "localhost", parsed.port or 6379
+            self._server = await asyncio.start_server(self._serve, host, port)
+        else:
+            raise ValueError(f"Unsupported broker url: {url}")
+
+    async def serve_forever(self) -> None:
+        if self._server is not None:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        channels: set[bytes] = set()
+        try:
+            while True:
+                command = await read_reply(reader)
+                if not isinstance(command, list) or not command:
+                    break
+                name, args = command[0].upper(), command[1:]
+                if name == b"PUBLISH" and len(args) == 2:
+                    writer.write(b":%d\r\n" % self._publish(args[0], args[1]))
+                elif name in (b"SUBSCRIBE", b"UNSUBSCRIBE"):
+                    for channel in args or list(channels):
+                        listeners = self._subscribers.setdefault(channel, set())
+                        if name == b"SUBSCRIBE":
+                            listeners.add(writer)
+                            channels.add(channel)
+                        else:
+                            listeners.discard(writer)
+                            channels.discard(channel)
+                        kind = name.lower()
+                        writer.write(
+                            b"*3\r\n$%d\r\n%s\r\n$%d\r\n%s\r\n:%d\r\n"
+                            % (len(kind), kind, len(channel), channel, len(channels))
+                        )
+                elif name == b"PING":
+                    writer.write(b"+PONG\r\n")
+                else:
+                    writer.write(b"-ERR unsupported command\r\n")
+                await writer.drain()
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, BrokerError):
+            pass
+        finally:
+            for channel in channels:
+                self._subscribers.get(channel, set()).discard(writer)
+            writer.close()
+
+    def _publish(self, channel: bytes, payload: bytes) -> int:
+        listeners = self._subscribers.get(channel)
+        if not listeners:
+            return 0
+        message = encode_command(b"message", channel, payload)
+        for listener in list(listeners):
+            if listener.transport.get_write_buffer_size() > self._max_buffer_bytes:
+                logger.warning("Disconnecting a broker subscriber that stopped reading")
+                listeners.discard(listener)
+                listener.close()
+                continue
+            listener.write(message)
+        return len(listeners)
+
+
+async def _serve(url: str) -> None:
+    server = LocalPubSubServer()
+    await server.start(url)
+    logger.info("Broker listening on %s", url)
+    await server.serve_forever()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SERVER_URL))
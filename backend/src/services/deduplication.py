@@ -1,6 +1,15 @@
+import math
+import random
+import sys
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from hashlib import sha1
+from time import monotonic
+
+HASH_MASK = (1 << 64) - 1
+EMPTY_BIN = HASH_MASK
+WINDOW_ENTRY_OVERHEAD_BYTES = 200
 
 
 def normalize_text(value: str) -> str:
@@ -16,29 +25,345 @@ def similarity_ratio(left: str, right: str) -> float:
     return SequenceMatcher(a=normalize_text(left), b=normalize_text(right)).ratio()
 
 
+def quick_ratio_bound(left: Counter, right: Counter, total_length: int) -> float:
+    # Same value as SequenceMatcher.quick_ratio(), from cached character counts
+    if not total_length:
+        return 1.0
+    if len(right) < len(left):
+        left, right = right, left
+    matches = sum(min(count, right[char]) for char, count in left.items() if char in right)
+    return 2.0 * matches / total_length
+
+
+def length_bounds(length: int, threshold: float) -> tuple[float, float]:
+    # ratio() <= 2 * min(len) / (len_a + len_b), so longer or shorter texts cannot match
+    if threshold <= 0:
+        return 0.0, float("inf")
+    return length * threshold / (2 - threshold), length * (2 - threshold) / threshold
+
+
+class MinHashLSH:
+    """Banded MinHash index over character shingles.
+
+    A key becomes a candidate once it shares ``min_band_hits`` band buckets with the
+    query, which keeps recall high for near duplicates while unrelated texts that happen
+    to collide in a single band are dropped.
+
+    Signatures use one-permutation hashing: each shingle is hashed once into one of
+    ``bands * rows`` bins and empty bins borrow a filled bin's value, so building a
+    signature is a single pass instead of one pass per hash function.
+    """
+
+    def __init__(
+        self,
+        bands: int = 32,
+        rows: int = 2,
+        shingle_size: int = 4,
+        min_band_hits: int = 2,
+    ):
+        self.bands = bands
+        self.rows = rows
+        self.shingle_size = shingle_size
+        self.min_band_hits = min_band_hits
+        self._bins = bands * rows
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(bands)]
+        # Fixed per-bin probe orders used to fill empty bins
+        self._probes = [
+            random.Random(position).sample(range(self._bins), self._bins)
+            for position in range(self._bins)
+        ]
+
+    def shingles(self, normalized: str) -> set[str]:
+        size = self.shingle_size
+        if len(normalized) <= size:
+            return {normalized}
+        return {normalized[index : index + size] for index in range(len(normalized) - size + 1)}
+
+    def signature(self, normalized: str) -> list[int]:
+        bins = self._bins
+        values = [EMPTY_BIN] * bins
+        for shingle in self.shingles(normalized):
+            hashed = hash(shingle) & HASH_MASK
+            position = hashed % bins
+            value = hashed // bins
+            if value < values[position]:
+                values[position] = value
+
+        empty = values.count(EMPTY_BIN)
+        if not empty or empty == bins:
+            return values
+        # Each empty bin borrows from the first filled bin in its own probe order, so
+        # neighbouring empty bins (and the bands they form) do not copy the same value
+        densified = values.copy()
+        for position, value in enumerate(values):
+            if value == EMPTY_BIN:
+                densified[position] = next(
+                    values[probe] for probe in self._probes[position] if values[probe] != EMPTY_BIN
+                )
+        return densified
+
+    def _band_keys(self, signature: list[int]) -> list[int]:
+        rows = self.rows
+        return [
+            hash(tuple(signature[band * rows : (band + 1) * rows])) for band in range(self.bands)
+        ]
+
+    def add(self, key: int, signature: list[int]) -> None:
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            buckets.setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: list[int]) -> set[int]:
+        hits: Counter[int] = Counter()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            keys = buckets.get(band_key)
+            if keys:
+                hits.update(keys)
+        if self.min_band_hits <= 1:
+            return set(hits)
+        return {key for key, count in hits.items() if count >= self.min_band_hits}
+
+
 @dataclass
 class DeduplicationEngine:
+    """Exact-hash plus near-duplicate detection for accepted insight texts.
+
+    Near duplicates are looked up through a MinHash/LSH candidate index and confirmed
+    with ``SequenceMatcher.ratio`` on the cached normalized texts. Short texts, where
+    shingle sets are too small for MinHash to be reliable, are split into pieces instead:
+    a match can only have a few unmatched characters, so at least one piece reappears
+    verbatim near the same offset.
+    """
+
     similarity_threshold: float = 0.92
+    short_text_length: int = 24
     _known_hashes: set[str] = field(default_factory=set)
     _known_texts: list[str] = field(default_factory=list)
+    _known_chars: list[Counter] = field(default_factory=list)
+    _lsh: MinHashLSH = field(default_factory=MinHashLSH)
+    _ids_by_piece: dict[tuple[int, int, str], list[int]] = field(default_factory=dict)
+    _counts: Counter[str] = field(default_factory=Counter)
 
-    def is_duplicate(self, text: str) -> bool:
-        content_hash = compute_content_hash(text)
-        if content_hash in self._known_hashes:
-            return True
+    def __post_init__(self) -> None:
+        # Texts up to this length can match a short one, so they go into the piece index too
+        upper = length_bounds(self.short_text_length, self.similarity_threshold)[1]
+        self._piece_limit = math.floor(min(upper, 4 * self.short_text_length))
 
-        for candidate in self._known_texts:
-            if similarity_ratio(text, candidate) >= self.similarity_threshold:
-                return True
+    def __len__(self) -> int:
+        return len(self._known_texts)
 
+    def _hash(self, normalized: str) -> str:
+        return sha1(normalized.encode("utf-8")).hexdigest()
+
+    def _pieces(self, length: int) -> tuple[int, list[tuple[int, int]]]:
+        # Texts within the threshold of this length have at most ``edits`` unmatched
+        # characters, so one of ``edits + 1`` pieces is untouched and shifted by <= edits
+        threshold = self.similarity_threshold
+        edits = int(2 * length * (1 - threshold) / threshold) if threshold > 0 else length
+        count = edits + 1
+        bounds = [length * index // count for index in range(count + 1)]
+        return edits, list(zip(bounds[:-1], bounds[1:], strict=True))
+
+    def _candidates(self, normalized: str, signature: list[int]) -> set[int]:
+        size = len(normalized)
+        lower, upper = length_bounds(size, self.similarity_threshold)
+        found = self._lsh.candidates(signature)
+        # Either side may be short, and MinHash is unreliable for short texts
+        for length in range(math.ceil(lower), min(math.floor(upper), self._piece_limit) + 1):
+            edits, pieces = self._pieces(length)
+            for index, (start, end) in enumerate(pieces):
+                for shift in range(max(-edits, -start), min(edits, size - end) + 1):
+                    key = (length, index, normalized[start + shift : end + shift])
+                    found.update(self._ids_by_piece.get(key, ()))
+        return {
+            candidate
+            for candidate in found
+            if lower <= len(self._known_texts[candidate]) <= upper
+        }
+
+    def _is_near_duplicate(self, normalized: str, signature: list[int]) -> bool:
+        threshold = self.similarity_threshold
+        chars = Counter(normalized)
+        for candidate in sorted(self._candidates(normalized, signature)):
+            known = self._known_texts[candidate]
+            total_length = len(normalized) + len(known)
+            if quick_ratio_bound(chars, self._known_chars[candidate], total_length) < threshold:
+                self._counts["rejected_quick_ratio"] += 1
+                continue
+            if SequenceMatcher(a=normalized, b=known).ratio() >= threshold:
+                self._counts["near_matches"] += 1
+                return True
+            self._counts["rejected_ratio"] += 1
         return False
 
+    def _add_normalized(self, normalized: str, content_hash: str, signature: list[int]) -> None:
+        key = len(self._known_texts)
+        self._known_hashes.add(content_hash)
+        self._known_texts.append(normalized)
+        self._known_chars.append(Counter(normalized))
+        self._lsh.add(key, signature)
+        length = len(normalized)
+        if length <= self._piece_limit:
+            for index, (start, end) in enumerate(self._pieces(length)[1]):
+                piece_key = (length, index, normalized[start:end])
+                self._ids_by_piece.setdefault(piece_key, []).append(key)
+
+    def is_duplicate(self, text: str) -> bool:
+        normalized = normalize_text(text)
+        if self._hash(normalized) in self._known_hashes:
+            self._counts["exact_matches"] += 1
+            return True
+        return self._is_near_duplicate(normalized, self._lsh.signature(normalized))
+
     def add(self, text: str) -> None:
-        self._known_hashes.add(compute_content_hash(text))
-        self._known_texts.append(text)
+        normalized = normalize_text(text)
+        self._add_normalized(normalized, self._hash(normalized), self._lsh.signature(normalized))
 
     def add_if_unique(self, text: str) -> bool:
-        if self.is_duplicate(text):
+        normalized = normalize_text(text)
+        content_hash = self._hash(normalized)
+        if content_hash in self._known_hashes:
+            self._counts["exact_matches"] += 1
+            return False
+        signature = self._lsh.signature(normalized)
+        if self._is_near_duplicate(normalized, signature):
+            return False
+        self._add_normalized(normalized, content_hash, signature)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._known_texts),
+            "exact_matches": self._counts["exact_matches"],
+            "near_matches": self._counts["near_matches"],
+            "rejected_quick_ratio": self._counts["rejected_quick_ratio"],
+            "rejected_ratio": self._counts["rejected_ratio"],
+        }
+
+
+@dataclass(slots=True)
+class WindowEntry:
+    normalized: str
+    content_hash: str
+    added_at: float
+    size: int
+
+
+class WindowedDeduplicationEngine:
+    """Near-duplicate detection against a sliding window of recent insight texts.
+
+    Only the newest ``max_entries`` texts, those younger than ``max_age_seconds`` and as
+    many as fit in ``max_memory_bytes`` are kept, newest compared first. Each comparison
+    is a cascade from cheap to expensive: the length ratio (the ``real_quick_ratio``
+    bound), ``quick_ratio`` and finally ``ratio``, and ``stats`` counts the candidates
+    each stage rejected.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int | None = 1000,
+        max_age_seconds: float | None = None,
+        max_memory_bytes: int | None = None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self._max_entries = max_entries
+        self._max_age_seconds = max_age_seconds
+        self._max_memory_bytes = max_memory_bytes
+        self._entries: deque[WindowEntry] = deque()
+        self._hash_counts: Counter[str] = Counter()
+        self._counts: Counter[str] = Counter()
+        self.memory_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _hash(self, normalized: str) -> str:
+        return sha1(normalized.encode("utf-8")).hexdigest()
+
+    def _over_budget(self, now: float) -> bool:
+        entries = self._entries
+        return (
+            (self._max_entries is not None and len(entries) > self._max_entries)
+            or (self._max_memory_bytes is not None and self.memory_bytes > self._max_memory_bytes)
+            or (
+                self._max_age_seconds is not None
+                and now - entries[0].added_at > self._max_age_seconds
+            )
+        )
+
+    def _expire(self, now: float) -> None:
+        while self._entries and self._over_budget(now):
+            entry = self._entries.popleft()
+            self.memory_bytes -= entry.size
+            self._hash_counts[entry.content_hash] -= 1
+            if not self._hash_counts[entry.content_hash]:
+                del self._hash_counts[entry.content_hash]
+            self._counts["evicted"] += 1
+
+    def _is_near_duplicate(self, normalized: str) -> bool:
+        threshold = self.similarity_threshold
+        size = len(normalized)
+        # The new text is ``b`` so its index and character counts are built once per lookup
+        matcher = SequenceMatcher(b=normalized)
+        for entry in reversed(self._entries):
+            known_size = len(entry.normalized)
+            if 2 * min(size, known_size) < threshold * (size + known_size):
+                self._counts["rejected_length"] += 1
+                continue
+            matcher.set_seq1(entry.normalized)
+            if matcher.quick_ratio() < threshold:
+                self._counts["rejected_quick_ratio"] += 1
+                continue
+            if matcher.ratio() >= threshold:
+                self._counts["near_matches"] += 1
+                return True
+            self._counts["rejected_ratio"] += 1
+        return False
+
+    def _check(self, normalized: str, content_hash: str, now: float) -> bool:
+        self._expire(now)
+        if content_hash in self._hash_counts:
+            self._counts["exact_matches"] += 1
+            return True
+        return self._is_near_duplicate(normalized)
+
+    def _add_normalized(self, normalized: str, content_hash: str, now: float) -> None:
+        size = sys.getsizeof(normalized) + sys.getsizeof(content_hash) + WINDOW_ENTRY_OVERHEAD_BYTES
+        self._entries.append(WindowEntry(normalized, content_hash, now, size))
+        self._hash_counts[content_hash] += 1
+        self.memory_bytes += size
+        self._expire(now)
+
+    def is_duplicate(self, text: str, now: float | None = None) -> bool:
+        normalized = normalize_text(text)
+        content_hash = self._hash(normalized)
+        return self._check(normalized, content_hash, monotonic() if now is None else now)
+
+    def add(self, text: str, now: float | None = None) -> None:
+        normalized = normalize_text(text)
+        content_hash = self._hash(normalized)
+        self._add_normalized(normalized, content_hash, monotonic() if now is None else now)
+
+    def add_if_unique(self, text: str, now: float | None = None) -> bool:
+        now = monotonic() if now is None else now
+        normalized = normalize_text(text)
+        content_hash = self._hash(normalized)
+        if self._check(normalized, content_hash, now):
             return False
-        self.add(text)
+        self._add_normalized(normalized, content_hash, now)
         return True
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "memory_bytes": self.memory_bytes,
+            "evicted": self._counts["evicted"],
+            "exact_matches": self._counts["exact_matches"],
+            "near_matches": self._counts["near_matches"],
+            "rejected_length": self._counts["rejected_length"],
+            "rejected_quick_ratio": self._counts["rejected_quick_ratio"],
+            "rejected_ratio": self._counts["rejected_ratio"],
+        }
+
+
+Deduplicator = DeduplicationEngine | WindowedDeduplicationEngine
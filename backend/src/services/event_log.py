@@ -0,0 +1,56 @@
+from collections import OrderedDict, deque
+from typing import Generic, TypeVar
+from uuid import uuid4
+
+T = TypeVar("T")
+
+
+class MeetingEventLog(Generic[T]):
+    """The last ``max_events`` broadcasts of one meeting, numbered from 1.
+
+    ``stream`` changes whenever the log is recreated, so a sequence number from an
+    evicted log or another worker is never mistaken for a position in this one.
+    """
+
+    def __init__(self, max_events: int):
+        self.stream = uuid4().hex
+        self.seq = 0
+        self._events: deque[T] = deque(maxlen=max(max_events, 1))
+
+    def append(self, event: T) -> None:
+        self._events.append(event)
+        self.seq += 1
+
+    def since(self, stream: str | None, seq: int) -> list[T] | None:
+        """Events after ``seq``, or None when they are no longer all in the log."""
+        if stream != self.stream or not 0 <= seq <= self.seq:
+            return None
+        missed = self.seq - seq
+        if missed > len(self._events):
+            return None
+        return list(self._events)[len(self._events) - missed :]
+
+
+class EventLog(Generic[T]):
+    """Per-meeting event logs, least recently used meetings dropped first."""
+
+    def __init__(self, max_events: int = 512, max_meetings: int = 1000):
+        self._max_events = max_events
+        self._max_meetings = max(max_meetings, 1)
+        self._logs: OrderedDict[str, MeetingEventLog[T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def get(self, meeting_id: str) -> MeetingEventLog[T] | None:
+        return self._logs.get(meeting_id)
+
+    def log(self, meeting_id: str) -> MeetingEventLog[T]:
+        log = self._logs.get(meeting_id)
+        if log is None:
+            log = self._logs[meeting_id] = MeetingEventLog(self._max_events)
+            if len(self._logs) > self._max_meetings:
+                self._logs.popitem(last=False)
+        else:
+            self._logs.move_to_end(meeting_id)
+        return log
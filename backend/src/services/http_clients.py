@@ -0,0 +1,68 @@
+import importlib.util
+import ssl
+
+import httpx
+
+from src.config.settings import Settings
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    """One keep-alive ``httpx.AsyncClient`` per upstream base URL, shared by every caller.
+
+    Clients are created on first use and reuse their connections, so repeated calls to
+    the same host skip the TCP and TLS handshakes. ``close`` shuts them all down.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30,
+        connect_timeout_seconds: float = 5,
+        timeout_seconds: float = 30,
+        http2: bool = True,
+        verify: ssl.SSLContext | str | bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._verify = verify
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpClientPool":
+        return cls(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+            connect_timeout_seconds=settings.http_connect_timeout_seconds,
+            timeout_seconds=settings.http_timeout_seconds,
+            http2=settings.http2_enabled,
+        )
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = self._clients[base_url] = httpx.AsyncClient(
+                base_url=base_url,
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self._http2,
+                verify=self._verify,
+                transport=self._transport,
+            )
+        return client
+
+    async def close(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.db.repositories import MeetingStateRepository
+from src.services.state_manager import StateManager
+from src.services.summary_scheduler import SummaryFlushScheduler
+from src.services.websocket_manager import WebSocketConnectionManager
+
+Segment = tuple[str, str | None]
+
+
+@dataclass(slots=True)
+class IngestJob:
+    segments: Sequence[Segment]
+    done: asyncio.Future
+
+
+class IngestPipeline:
+    """Ordered per-meeting ingest with CPU-bound analysis offloaded to an executor.
+
+    Every meeting gets its own queue drained by a single task, so segments of one meeting
+    are applied in arrival order while different meetings proceed independently. The
+    task exits once its queue is empty and is recreated by the next ``submit``. A batch
+    from ``submit_batch`` is analyzed in one executor call and applied as one change
+    set, so it produces at most one delta.
+    """
+
+    def __init__(
+        self,
+        state_manager: StateManager,
+        state_repository: MeetingStateRepository,
+        websocket_manager: WebSocketConnectionManager,
+        summary_scheduler: SummaryFlushScheduler,
+        executor: Executor | None = None,
+        max_queue_size: int = 1000,
+    ):
+        self._state_manager = state_manager
+        self._state_repository = state_repository
+        self._websocket_manager = websocket_manager
+        self._summary_scheduler = summary_scheduler
+        self._executor = executor
+        self._max_queue_size = max_queue_size
+        self._queues: dict[str, asyncio.Queue[IngestJob]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    def queue_size(self, meeting_id: str) -> int:
+        queue = self._queues.get(meeting_id)
+        return queue.qsize() if queue is not None else 0
+
+    async def submit(self, meeting_id: str, text: str, speaker: str | None = None) -> dict | None:
+        return await self.submit_batch(meeting_id, [(text, speaker)])
+
+    async def submit_batch(self, meeting_id: str, segments: Sequence[Segment]) -> dict | None:
+        queue = self._queues.get(meeting_id)
+        if queue is None:
+            queue = self._queues[meeting_id] = asyncio.Queue(maxsize=self._max_queue_size)
+            self._workers[meeting_id] = asyncio.create_task(self._run(meeting_id, queue))
+
+        job = IngestJob(segments=segments, done=asyncio.get_running_loop().create_future())
+        await queue.put(job)
+        return await job.done
+
+    async def close(self) -> None:
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+
+    async def _run(self, meeting_id: str, queue: asyncio.Queue[IngestJob]) -> None:
+        try:
+            while not queue.empty():
+                job = queue.get_nowait()
+                try:
+                    result = await self._process(meeting_id, job)
+                except asyncio.CancelledError:
+                    job.done.cancel()
+                    raise
+                except Exception as exc:
+                    if not job.done.done():
+                        job.done.set_exception(exc)
+                else:
+                    # The submitter may have gone away (socket closed) while we worked
+                    if not job.done.done():
+                        job.done.set_result(result)
+        finally:
+            if self._queues.get(meeting_id) is queue:
+                del self._queues[meeting_id]
+                del self._workers[meeting_id]
+            while not queue.empty():
+                queue.get_nowait().done.cancel()
+
+    async def _process(self, meeting_id: str, job: IngestJob) -> dict | None:
+        # Pinned, the meeting cannot be evicted between loading, analysis and apply
+        self._state_manager.pin(meeting_id)
+        try:
+            return await self._apply(meeting_id, job)
+        finally:
+            self._state_manager.unpin(meeting_id)
+
+    async def _apply(self, meeting_id: str, job: IngestJob) -> dict | None:
+        base_version = (await self._state_manager.load_state(meeting_id, create=True)).version
+        dedup = self._state_manager.ingest_target(meeting_id)
+        if self._executor is None:
+            analyses = self._state_manager.analyze_segments(dedup, job.segments)
+        else:
+            analyses = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._state_manager.analyze_segments,
+                dedup,
+                job.segments,
+            )
+        # Only a discard (meeting deleted) can drop a pinned meeting, and the job goes with it
+        if (
+            not self._state_manager.is_loaded(meeting_id)
+            or self._state_manager.ingest_target(meeting_id) is not dedup
+        ):
+            return None
+        delta = self._state_manager.apply_segments(meeting_id, analyses)
+
+        for text, speaker in job.segments:
+            await self._state_repository.add_segment(meeting_id, text, speaker)
+        for kind, item in self._state_manager.insights_since(meeting_id, base_version):
+            await self._state_repository.add_insight(kind, item)
+
+        if delta is None:
+            self._summary_scheduler.notify(meeting_id, len(job.segments))
+        else:
+            await self._websocket_manager.broadcast(
+                meeting_id,
+                {
+                    "type": "meeting.delta",
+                    "meeting_id": meeting_id,
+                    "payload": delta,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        return delta
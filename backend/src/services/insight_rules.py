@@ -0,0 +1,159 @@
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+RULES_DIR = Path(__file__).resolve().parents[3] / "config" / "insight_rules"
+DEFAULT_RULE_PACKS = ("en", "ru")
+RULE_COLLECTIONS = ("decisions", "actions", "risks", "open_questions")
+
+RuleMatch = Literal["prefix", "keyword"]
+
+
+@dataclass(frozen=True, slots=True)
+class InsightRule:
+    collection: str
+    pattern: str
+    match: RuleMatch = "keyword"
+    priority: int = 0
+
+
+@dataclass(slots=True)
+class InsightMatch:
+    collection: str
+    content: str
+    rule: InsightRule
+
+
+def _trie_pattern(literals: Iterable[str]) -> str:
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" not in node:
+            return body
+        if len(branches) == 1 and len(branches[0]) > 1 and not body.startswith("(?:"):
+            body = f"(?:{body})"
+        return f"{body}?"
+
+    return render(trie)
+
+
+def _best(rules: Iterable[InsightRule | None]) -> InsightRule | None:
+    best: InsightRule | None = None
+    for rule in rules:
+        if rule is not None and (best is None or rule.priority > best.priority):
+            best = rule
+    return best
+
+
+class InsightClassifier:
+    """Finds the highest-priority prefix/keyword rule in a single regex pass.
+
+    All literals are compiled into one trie-shaped alternation inside a zero-width
+    lookahead, so ``finditer`` reports the longest literal starting at every position,
+    including overlapping ones. The rule chosen for a literal also accounts for the
+    shorter literals that are its prefixes, since those match at the same position.
+    """
+
+    def __init__(self, rules: Iterable[InsightRule]):
+        self.rules = tuple(rules)
+        prefix_rules: dict[str, InsightRule] = {}
+        keyword_rules: dict[str, InsightRule] = {}
+        for rule in self.rules:
+            if rule.collection not in RULE_COLLECTIONS:
+                raise ValueError(f"Unknown insight collection: {rule.collection}")
+            literal = rule.pattern.strip().lower()
+            if not literal:
+                continue
+            target = prefix_rules if rule.match == "prefix" else keyword_rules
+            target[literal] = _best((target.get(literal), rule))
+
+        literals = sorted(set(prefix_rules) | set(keyword_rules), key=len, reverse=True)
+        self._at_start: dict[str, InsightRule] = {}
+        self._anywhere: dict[str, InsightRule] = {}
+        for literal in literals:
+            shorter = [literal[:size] for size in range(1, len(literal) + 1)]
+            anywhere = _best(keyword_rules.get(part) for part in shorter)
+            at_start = _best([anywhere, *(prefix_rules.get(part) for part in shorter)])
+            if anywhere is not None:
+                self._anywhere[literal] = anywhere
+            if at_start is not None:
+                self._at_start[literal] = at_start
+
+        self._pattern: re.Pattern[str] | None = None
+        if literals:
+            first_chars = "".join(sorted({re.escape(literal[0]) for literal in literals}))
+            self._pattern = re.compile(f"(?=[{first_chars}])(?=({_trie_pattern(literals)}))")
+
+    def classify(self, text: str) -> InsightMatch | None:
+        normalized = text.strip()
+        if self._pattern is None or not normalized:
+            return None
+        lowered = normalized.lower()
+
+        best: InsightRule | None = None
+        best_end = 0
+        for found in self._pattern.finditer(lowered):
+            literal = found.group(1)
+            start = found.start()
+            rule = self._at_start.get(literal) if start == 0 else self._anywhere.get(literal)
+            if rule is not None and (best is None or rule.priority > best.priority):
+                best = rule
+                best_end = start + len(rule.pattern.strip().lower())
+
+        if best is None:
+            return None
+
+        if best.match == "prefix":
+            if len(lowered) == len(normalized):
+                content = normalized[best_end:].strip()
+            else:
+                content = normalized.split(":", 1)[-1].strip()
+        else:
+            content = normalized
+
+        return InsightMatch(collection=best.collection, content=content, rule=best)
+
+
+def load_rule_pack(name: str, rules_dir: Path | None = None) -> list[InsightRule]:
+    path = (rules_dir or RULES_DIR) / f"{name}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"Insight rule pack not found: {path}")
+
+    config = json.loads(path.read_text(encoding="utf-8"))
+    rules: list[InsightRule] = []
+    for entry in config.get("rules", []):
+        match = entry.get("match", "keyword")
+        if match not in ("prefix", "keyword"):
+            raise ValueError(f"Unsupported rule match type in {path}: {match}")
+        for pattern in entry.get("patterns", []):
+            rules.append(
+                InsightRule(
+                    collection=entry["collection"],
+                    pattern=pattern,
+                    match=match,
+                    priority=int(entry.get("priority", 0)),
+                ),
+            )
+    return rules
+
+
+def load_insight_classifier(
+    packs: Iterable[str] = DEFAULT_RULE_PACKS,
+    rules_dir: Path | None = None,
+) -> InsightClassifier:
+    rules: list[InsightRule] = []
+    for name in packs:
+        rules.extend(load_rule_pack(name, rules_dir))
+    return InsightClassifier(rules)
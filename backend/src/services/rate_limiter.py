@@ -0,0 +1,159 @@
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from math import ceil
+from time import monotonic
+
+OVERFLOW_POLICIES = ("coalesce", "drop")
+
+Segment = tuple[str, str | None]
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """``rate`` tokens per second up to ``burst``; a rate of 0 or less never limits."""
+
+    rate: float
+    burst: float
+    tokens: float = -1.0
+    updated: float = field(default_factory=monotonic)
+
+    def __post_init__(self) -> None:
+        if self.tokens < 0:
+            self.tokens = self.burst
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def available(self, now: float | None = None) -> int:
+        if self.unlimited:
+            return 1 << 62
+        now = monotonic() if now is None else now
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = max(now, self.updated)
+        return int(self.tokens)
+
+    def take(self, count: int) -> None:
+        if not self.unlimited:
+            self.tokens -= count
+
+    def retry_after(self) -> float:
+        if self.unlimited or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass(slots=True)
+class MeetingBudget:
+    bucket: TokenBucket
+    counts: Counter = field(default_factory=Counter)
+
+
+class ConnectionThrottle:
+    """Admits one socket's segments against its own bucket and its meeting's bucket.
+
+    Segments over budget are dropped, or with the ``coalesce`` policy appended to one
+    held-back line per speaker (up to ``max_coalesced_chars``) that goes out ahead of
+    the next admitted segments. ``status_change`` reports when the socket starts or
+    stops being throttled, for a ``provider.status`` event.
+    """
+
+    def __init__(self, limiter: "IngestRateLimiter", meeting_id: str, bucket: TokenBucket):
+        self._limiter = limiter
+        self._meeting_id = meeting_id
+        self._bucket = bucket
+        self._pending: dict[str | None, str] = {}
+        self._throttled = False
+        self._status: dict | None = None
+
+    def admit(self, segments: list[Segment], now: float | None = None) -> list[Segment]:
+        now = monotonic() if now is None else now
+        budget = self._limiter.budget(self._meeting_id)
+        wanted = self.drain()
+        held = len(wanted)
+        wanted += segments
+
+        granted = min(len(wanted), self._bucket.available(now), budget.bucket.available(now))
+        self._bucket.take(granted)
+        budget.bucket.take(granted)
+        budget.counts["admitted"] += granted
+
+        excess = wanted[granted:]
+        for index, (text, speaker) in enumerate(excess, start=granted):
+            previous = self._pending.get(speaker)
+            merged = text if previous is None else f"{previous} {text}"
+            if self._limiter.policy == "coalesce" and len(merged) <= self._limiter.max_coalesced:
+                self._pending[speaker] = merged
+                # Lines that were already held back are not counted twice
+                budget.counts["coalesced"] += index >= held
+            else:
+                budget.counts["dropped"] += 1
+
+        if excess and not self._throttled:
+            budget.counts["throttled"] += 1
+            retry_after = max(self._bucket.retry_after(), budget.bucket.retry_after())
+            self._status = {
+                "status": "throttled",
+                "policy": self._limiter.policy,
+                "retry_after_ms": ceil(retry_after * 1000),
+            }
+        elif not excess and self._throttled:
+            self._status = {"status": "ok"}
+        self._throttled = bool(excess)
+        return wanted[:granted]
+
+    def status_change(self) -> dict | None:
+        status, self._status = self._status, None
+        return status
+
+    def drain(self) -> list[Segment]:
+        """Held-back lines, released without a budget check when the socket closes."""
+        pending = [(text, speaker) for speaker, text in self._pending.items()]
+        self._pending = {}
+        return pending
+
+
+class IngestRateLimiter:
+    """Per-meeting and per-connection token buckets for transcript segments."""
+
+    def __init__(
+        self,
+        meeting_rate: float = 50,
+        meeting_burst: int = 200,
+        connection_rate: float = 20,
+        connection_burst: int = 100,
+        policy: str = "coalesce",
+        max_coalesced_chars: int = 2000,
+        max_meetings: int = 1000,
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown ingest overflow policy: {policy}")
+        self.policy = policy
+        self.max_coalesced = max_coalesced_chars
+        self._meeting_rate = meeting_rate
+        self._meeting_burst = meeting_burst
+        self._connection_rate = connection_rate
+        self._connection_burst = connection_burst
+        self._max_meetings = max(max_meetings, 1)
+        self._budgets: OrderedDict[str, MeetingBudget] = OrderedDict()
+
+    def connection(self, meeting_id: str) -> ConnectionThrottle:
+        bucket = TokenBucket(self._connection_rate, self._connection_burst)
+        return ConnectionThrottle(self, meeting_id, bucket)
+
+    def budget(self, meeting_id: str) -> MeetingBudget:
+        budget = self._budgets.get(meeting_id)
+        if budget is None:
+            bucket = TokenBucket(self._meeting_rate, self._meeting_burst)
+            budget = self._budgets[meeting_id] = MeetingBudget(bucket)
+            if len(self._budgets) > self._max_meetings:
+                self._budgets.popitem(last=False)
+        else:
+            self._budgets.move_to_end(meeting_id)
+        return budget
+
+    def stats(self, meeting_id: str) -> dict[str, int]:
+        budget = self._budgets.get(meeting_id)
+        counts = budget.counts if budget is not None else Counter()
+        return {name: counts[name] for name in ("admitted", "coalesced", "dropped", "throttled")}
@@ -0,0 +1,176 @@
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+TOKEN_PATTERN = re.compile(r"\w+")
+TERM_OVERHEAD_BYTES = 160
+CANDIDATE_PROBE_COST = 8
+CANDIDATE_POOL_FACTOR = 32
+MIN_CANDIDATE_POOL = 128
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "but", "by", "did", "do", "does", "for",
+        "from", "has", "have", "he", "how", "i", "in", "is", "it", "its", "me", "of", "on",
+        "or", "our", "she", "so", "that", "the", "their", "them", "there", "they", "this",
+        "to", "us", "was", "we", "were", "what", "when", "where", "which", "who", "why",
+        "will", "with", "you", "about", "said", "say",
+        "а", "в", "во", "и", "к", "как", "кто", "ли", "мы", "на", "не", "о", "об", "от",
+        "по", "про", "с", "то", "что", "это", "я", "вы", "он", "она", "они", "у", "за",
+    },
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+@dataclass(slots=True)
+class SearchHit:
+    ref: Any
+    score: float
+
+
+class _Postings:
+    __slots__ = ("docs", "freqs")
+
+    def __init__(self) -> None:
+        self.docs = array("I")
+        self.freqs = array("H")
+
+
+class SearchIndex:
+    """Append-only BM25 inverted index over a meeting's segments and insights.
+
+    Documents get increasing ids, so every postings list is sorted and the oldest
+    documents can be pruned by cutting list prefixes once ``max_documents`` is exceeded.
+    Query terms are scored rarest first. Once rarer terms have picked candidates, common
+    terms only probe the best of them, words found in most documents are skipped, and a
+    term that has to be scanned contributes its newest ``max_postings_per_term`` postings.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_documents: int = 100_000,
+        max_postings_per_term: int = 512,
+    ):
+        self._k1 = k1
+        self._b = b
+        self._max_documents = max(max_documents, 1)
+        self._max_postings_per_term = max(max_postings_per_term, 1)
+        self._postings: dict[str, _Postings] = {}
+        self._lengths = array("H")
+        self._refs: list[Any] = []
+        self._first_doc = 0
+        self._total_length = 0
+        self._posting_count = 0
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._postings)
+
+    @property
+    def memory_bytes(self) -> int:
+        postings_bytes = 6 * self._posting_count + TERM_OVERHEAD_BYTES * len(self._postings)
+        return postings_bytes + 10 * len(self._refs)
+
+    def add(self, text: str, ref: Any, tokens: list[str] | None = None) -> None:
+        doc_id = self._first_doc + len(self._refs)
+        if tokens is None:
+            tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, count in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.docs.append(doc_id)
+            postings.freqs.append(min(count, 0xFFFF))
+        self._posting_count += len(counts)
+
+        length = min(len(tokens), 0xFFFF)
+        self._lengths.append(length)
+        self._refs.append(ref)
+        self._total_length += length
+        if len(self._refs) > self._max_documents:
+            self._prune(max(len(self._refs) - self._max_documents, self._max_documents // 10))
+
+    def _prune(self, count: int) -> None:
+        self._first_doc += count
+        self._total_length -= sum(self._lengths[:count])
+        del self._lengths[:count]
+        del self._refs[:count]
+        for term in list(self._postings):
+            postings = self._postings[term]
+            cut = bisect_left(postings.docs, self._first_doc)
+            self._posting_count -= cut
+            if cut == len(postings.docs):
+                del self._postings[term]
+            elif cut:
+                del postings.docs[:cut]
+                del postings.freqs[:cut]
+
+    def search(self, query: str, limit: int = 5) -> list[SearchHit]:
+        total = len(self._refs)
+        if not total or limit <= 0:
+            return []
+
+        average_length = self._total_length / total or 1.0
+        k1 = self._k1
+        norm_base = k1 * (1 - self._b)
+        norm_scale = k1 * self._b / average_length
+        lengths = self._lengths
+        first_doc = self._first_doc
+
+        weighted_terms = []
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is not None:
+                weighted_terms.append(postings)
+        weighted_terms.sort(key=lambda postings: len(postings.docs))
+
+        scores: dict[int, float] = {}
+        candidate_pool = max(limit * CANDIDATE_POOL_FACTOR, MIN_CANDIDATE_POOL)
+        for postings in weighted_terms:
+            docs, freqs = postings.docs, postings.freqs
+            frequency = len(docs)
+            if scores and frequency * 2 > total:
+                # Near-zero IDF: a word in most segments cannot reorder the candidates
+                continue
+            idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            if scores and len(scores) * CANDIDATE_PROBE_COST < frequency:
+                # Rarer terms already picked the candidates; only look the best of them up
+                pool = scores
+                if len(scores) > candidate_pool:
+                    pool = heapq.nlargest(candidate_pool, scores, key=scores.__getitem__)
+                for doc_id in list(pool):
+                    position = bisect_left(docs, doc_id)
+                    if position < frequency and docs[position] == doc_id:
+                        tf = freqs[position]
+                        length = lengths[doc_id - first_doc]
+                        weight = tf * (k1 + 1) / (tf + norm_base + norm_scale * length)
+                        scores[doc_id] += idf * weight
+                continue
+
+            start = max(frequency - self._max_postings_per_term, 0)
+            for doc_id, tf in zip(docs[start:], freqs[start:], strict=True):
+                length = lengths[doc_id - first_doc]
+                weight = tf * (k1 + 1) / (tf + norm_base + norm_scale * length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * weight
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda entry: (entry[1], entry[0]))
+        return [
+            SearchHit(ref=self._refs[doc_id - first_doc], score=score) for doc_id, score in best
+        ]
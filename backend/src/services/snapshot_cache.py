@@ -0,0 +1,84 @@
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.services.state_manager import MeetingState, build_state_snapshot
+from src.services.websocket_manager import JSON_WIRE, OutboundFrame, WireFormat
+
+
+@dataclass(slots=True)
+class SnapshotEntry:
+    state: weakref.ref
+    version: int
+    published_version: int
+    frame: OutboundFrame
+    size: int
+
+
+class SnapshotCache:
+    """Encoded ``meeting.state`` frames, one per meeting, rebuilt when the state changes.
+
+    An entry is valid for the state object it was built from at its ``version`` and
+    ``published_version`` (the summary and ``updated_at`` only change on publish).
+    Entries are dropped least recently used first to keep their JSON text, and every
+    wire encoding made for them, within ``max_bytes``. Encodings are only made here, so
+    the budget sees each one.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, SnapshotEntry] = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def frame(
+        self,
+        meeting_id: str,
+        state: MeetingState,
+        wire_format: WireFormat = JSON_WIRE,
+    ) -> OutboundFrame:
+        entry = self._entries.get(meeting_id)
+        if (
+            entry is not None
+            and entry.state() is state
+            and entry.version == state.version
+            and entry.published_version == state.published_version
+        ):
+            self.hits += 1
+        else:
+            self.misses += 1
+            frame = OutboundFrame.encode(
+                {
+                    "type": "meeting.state",
+                    "meeting_id": meeting_id,
+                    "payload": build_state_snapshot(state),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            entry = SnapshotEntry(
+                weakref.ref(state), state.version, state.published_version, frame, 0
+            )
+        entry.frame.data(wire_format)
+        self._store(meeting_id, entry)
+        return entry.frame
+
+    def discard(self, meeting_id: str) -> None:
+        entry = self._entries.pop(meeting_id, None)
+        if entry is not None:
+            self.memory_bytes -= entry.size
+
+    def _store(self, meeting_id: str, entry: SnapshotEntry) -> None:
+        self.discard(meeting_id)
+        entry.size = entry.frame.memory_bytes
+        if entry.size > self._max_bytes:
+            return
+        self._entries[meeting_id] = entry
+        self.memory_bytes += entry.size
+        while self.memory_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.memory_bytes -= evicted.size
@@ -1,112 +1,391 @@
+import asyncio
+from collections import Counter, OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Any
 from uuid import uuid4
 
-from src.models.insights import ActionItem, Decision, OpenQuestion, Risk
-from src.services.deduplication import DeduplicationEngine
+from src.models.insights import ActionItem, Decision, InsightKind, OpenQuestion, Risk
+from src.models.meeting import MeetingStateRecord
+from src.services.answer_cache import DEFAULT_ANSWER_CACHE_SIZE, AnswerCache, normalize_question
+from src.services.deduplication import (
+    DeduplicationEngine,
+    Deduplicator,
+    WindowedDeduplicationEngine,
+)
+from src.services.insight_rules import InsightClassifier, load_insight_classifier
+from src.services.search_index import SearchIndex, tokenize
+from src.services.transcript_store import DEFAULT_TAIL_SIZE, TranscriptStore
+
+INSIGHT_COLLECTIONS = ("decisions", "actions", "risks", "open_questions")
+TRANSCRIPT_COLLECTION = "transcript_lines"
+SUMMARY_COLLECTION = "summary"
+DEFAULT_DELTA_HISTORY_SIZE = 2048
+INSIGHT_MODELS = {
+    "decisions": Decision,
+    "actions": ActionItem,
+    "risks": Risk,
+    "open_questions": OpenQuestion,
+}
+INSIGHT_KINDS = {
+    "decisions": "decision",
+    "actions": "action",
+    "risks": "risk",
+    "open_questions": "open_question",
+}
+COLLECTIONS_BY_KIND = {kind: collection for collection, kind in INSIGHT_KINDS.items()}
+INSIGHT_OVERHEAD_BYTES = 512
+
+StateLoader = Callable[[str], Awaitable[MeetingStateRecord | None]]
+
+
+class MeetingNotLoaded(LookupError):
+    pass
+
+
+@dataclass(slots=True)
+class StateChange:
+    version: int
+    collection: str
+    value: Any
+
+
+@dataclass(slots=True)
+class SegmentAnalysis:
+    line: str
+    line_tokens: list[str]
+    insight: tuple[str, str] | None = None
+    insight_tokens: list[str] | None = None
 
 
 @dataclass
 class MeetingState:
-    transcript_lines: list[str] = field(default_factory=list)
+    transcript_lines: TranscriptStore = field(default_factory=TranscriptStore)
+    search_index: SearchIndex = field(default_factory=SearchIndex)
     summary: str = ""
     decisions: list[Decision] = field(default_factory=list)
     actions: list[ActionItem] = field(default_factory=list)
     risks: list[Risk] = field(default_factory=list)
     open_questions: list[OpenQuestion] = field(default_factory=list)
     last_updated_at: datetime | None = None
+    version: int = 0
+    published_version: int = 0
+    changes: deque[StateChange] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_DELTA_HISTORY_SIZE),
+    )
+    stopped: bool = False
+    last_accessed: float = field(default_factory=monotonic)
+    collection_versions: dict[str, int] = field(default_factory=dict)
+    answer_cache: AnswerCache = field(default_factory=AnswerCache)
+    owner: str = ""
+
+    def estimated_bytes(self) -> int:
+        insight_count = sum(len(getattr(self, name)) for name in INSIGHT_COLLECTIONS)
+        insight_bytes = 2 * INSIGHT_OVERHEAD_BYTES * insight_count
+        return self.transcript_lines.memory_bytes + self.search_index.memory_bytes + insight_bytes
+
+    def record_change(self, collection: str, value: Any) -> None:
+        self.version += 1
+        self.collection_versions[collection] = self.version
+        self.changes.append(StateChange(self.version, collection, value))
+
+    def changes_since(self, version: int) -> list[StateChange] | None:
+        if version >= self.version:
+            return []
+        oldest = self.changes[0].version if self.changes else self.version + 1
+        if version + 1 < oldest:
+            return None
+
+        newer: list[StateChange] = []
+        for change in reversed(self.changes):
+            if change.version <= version:
+                break
+            newer.append(change)
+        newer.reverse()
+        return newer
+
+
+def build_state_snapshot(state: MeetingState) -> dict:
+    return {
+        "owner": state.owner,
+        "version": state.version,
+        "transcript_lines": list(state.transcript_lines),
+        "summary": state.summary,
+        "insights": {
+            name: [item.model_dump(mode="json") for item in getattr(state, name)]
+            for name in INSIGHT_COLLECTIONS
+        },
+        "updated_at": state.last_updated_at.isoformat() if state.last_updated_at else None,
+    }
+
+
+def build_delta_payload(state: MeetingState, base_version: int) -> dict:
+    changes = state.changes_since(base_version)
+    if changes is None:
+        return {**build_state_snapshot(state), "base_version": base_version, "full": True}
+
+    lines: list[str] = []
+    insights: dict[str, dict[str, dict]] = {name: {} for name in INSIGHT_COLLECTIONS}
+    for change in changes:
+        if change.collection == TRANSCRIPT_COLLECTION:
+            lines.append(change.value)
+        else:
+            insights[change.collection][change.value.id] = change.value.model_dump(mode="json")
+
+    return {
+        "owner": state.owner,
+        "version": state.version,
+        "base_version": base_version,
+        "full": False,
+        "summary": state.summary,
+        "transcript_lines": lines,
+        "insights": {name: list(items.values()) for name, items in insights.items()},
+        "updated_at": state.last_updated_at.isoformat() if state.last_updated_at else None,
+    }
+
+
+def merge_delta_payloads(older: dict, newer: dict) -> dict | None:
+    # One delta from older's base to newer's version; None if they are not contiguous
+    if newer["full"]:
+        return newer
+    if older["version"] != newer["base_version"]:
+        return None
+
+    insights: dict[str, list[dict]] = {}
+    for name in INSIGHT_COLLECTIONS:
+        items = {item["id"]: item for item in older["insights"][name]}
+        items.update((item["id"], item) for item in newer["insights"][name])
+        insights[name] = list(items.values())
+    return {
+        **newer,
+        "base_version": older["base_version"],
+        "full": older["full"],
+        "transcript_lines": older["transcript_lines"] + newer["transcript_lines"],
+        "insights": insights,
+    }
 
 
 class StateManager:
     def __init__(
         self,
         min_update_interval_seconds: int = 5,
+        delta_history_size: int = DEFAULT_DELTA_HISTORY_SIZE,
+        transcript_tail_size: int = DEFAULT_TAIL_SIZE,
+        transcript_spill_dir: str | None = None,
+        classifier: InsightClassifier | None = None,
+        state_loader: StateLoader | None = None,
+        max_meetings: int = 1000,
+        memory_budget_bytes: int = 256 * 1024 * 1024,
+        idle_ttl_seconds: float = 3600,
+        stopped_ttl_seconds: float = 300,
+        search_max_documents: int = 100_000,
+        answer_cache_size: int = DEFAULT_ANSWER_CACHE_SIZE,
+        dedup_window_size: int = 0,
+        dedup_window_seconds: float = 0,
+        dedup_memory_budget_bytes: int = 0,
     ):
+        self._classifier = classifier or load_insight_classifier()
         self._min_update_interval = timedelta(seconds=min_update_interval_seconds)
-        self._states: dict[str, MeetingState] = {}
-        self._dedup_by_meeting: dict[str, DeduplicationEngine] = {}
+        self._delta_history_size = delta_history_size
+        self._transcript_tail_size = transcript_tail_size
+        self._transcript_spill_dir = transcript_spill_dir
+        self._state_loader = state_loader
+        self._max_meetings = max_meetings
+        self._memory_budget_bytes = memory_budget_bytes
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._stopped_ttl_seconds = stopped_ttl_seconds
+        self._search_max_documents = search_max_documents
+        self._answer_cache_size = answer_cache_size
+        self._dedup_window_size = dedup_window_size
+        self._dedup_window_seconds = dedup_window_seconds
+        self._dedup_memory_budget_bytes = dedup_memory_budget_bytes
+        self._states: OrderedDict[str, MeetingState] = OrderedDict()
+        self._dedup_by_meeting: dict[str, Deduplicator] = {}
+        self._pins: Counter[str] = Counter()
+        self._version_floor = 0
+        # Versions only mean something to the manager that numbered them, so every
+        # payload names it; clients resync only against their own worker's versions
+        self.owner = uuid4().hex
 
-    def _state_for(self, meeting_id: str) -> MeetingState:
-        if meeting_id not in self._states:
-            self._states[meeting_id] = MeetingState()
-            self._dedup_by_meeting[meeting_id] = DeduplicationEngine()
-        return self._states[meeting_id]
+    @property
+    def meeting_count(self) -> int:
+        return len(self._states)
 
-    def _should_update(self, state: MeetingState, now: datetime) -> bool:
-        if state.last_updated_at is None:
-            return True
-        return now - state.last_updated_at >= self._min_update_interval
+    def is_loaded(self, meeting_id: str) -> bool:
+        return meeting_id in self._states
 
-    def _extract_insight(self, meeting_id: str, text: str):
-        normalized = text.strip()
-        lowered = normalized.lower()
-        now = datetime.now(timezone.utc)
+    def pin(self, meeting_id: str) -> None:
+        """Keep the meeting out of ``evict`` until it is unpinned as many times."""
+        self._pins[meeting_id] += 1
 
-        # Explicit prefix-based extraction
-        if lowered.startswith("decision:"):
-            return "decisions", Decision(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized.split(":", 1)[1].strip(),
-                created_at=now,
-            )
-        if lowered.startswith("action:") or lowered.startswith("action item:"):
-            return "actions", ActionItem(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized.split(":", 1)[1].strip(),
-                owner=None,
-                due_date=None,
-                created_at=now,
-            )
-        if lowered.startswith("risk:"):
-            return "risks", Risk(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized.split(":", 1)[1].strip(),
-                created_at=now,
-            )
-        if lowered.startswith("question:"):
-            return "open_questions", OpenQuestion(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized.split(":", 1)[1].strip(),
-                created_at=now,
-            )
+    def unpin(self, meeting_id: str) -> None:
+        self._pins[meeting_id] -= 1
+        if self._pins[meeting_id] <= 0:
+            del self._pins[meeting_id]
 
-        # Natural language heuristic extraction
-        action_keywords = ["need to", "should", "must", "will do", "to prepare", "to send", "to review", "to follow up", "let's", "please"]
-        if any(kw in lowered for kw in action_keywords):
-            return "actions", ActionItem(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized,
-                owner=None,
-                due_date=None,
-                created_at=now,
-            )
+    def _new_state(self) -> MeetingState:
+        # Versions never go backwards for a meeting, even after eviction and rehydration
+        return MeetingState(
+            transcript_lines=TranscriptStore(
+                tail_size=self._transcript_tail_size,
+                spill_dir=self._transcript_spill_dir,
+            ),
+            search_index=SearchIndex(max_documents=self._search_max_documents),
+            answer_cache=AnswerCache(self._answer_cache_size),
+            version=self._version_floor,
+            published_version=self._version_floor,
+            changes=deque(maxlen=self._delta_history_size),
+            owner=self.owner,
+        )
 
-        decision_keywords = ["decided", "agreed", "confirmed", "approved", "final decision", "we will", "we'll go with"]
-        if any(kw in lowered for kw in decision_keywords):
-            return "decisions", Decision(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized,
-                created_at=now,
+    def _new_dedup(self) -> Deduplicator:
+        # Any window or budget switches the meeting to the bounded, scan-based engine
+        if self._dedup_window_size or self._dedup_window_seconds or self._dedup_memory_budget_bytes:
+            return WindowedDeduplicationEngine(
+                max_entries=self._dedup_window_size or None,
+                max_age_seconds=self._dedup_window_seconds or None,
+                max_memory_bytes=self._dedup_memory_budget_bytes or None,
             )
+        return DeduplicationEngine()
 
-        risk_keywords = ["risk", "danger", "concern", "worried", "problem", "issue", "blocker"]
-        if any(kw in lowered for kw in risk_keywords):
-            return "risks", Risk(
-                id=str(uuid4()),
-                meeting_id=meeting_id,
-                content=normalized,
-                created_at=now,
-            )
+    def _register(self, meeting_id: str, state: MeetingState, dedup: Deduplicator) -> None:
+        self._states[meeting_id] = state
+        self._dedup_by_meeting[meeting_id] = dedup
+        # The meeting being registered is about to be used, so it never pays for the room
+        self.pin(meeting_id)
+        try:
+            self.evict()
+        finally:
+            self.unpin(meeting_id)
 
-        return None
+    def _touch(self, meeting_id: str) -> MeetingState | None:
+        state = self._states.get(meeting_id)
+        if state is not None:
+            state.last_accessed = monotonic()
+            self._states.move_to_end(meeting_id)
+        return state
+
+    def _state_for(self, meeting_id: str) -> MeetingState:
+        state = self._touch(meeting_id)
+        if state is None:
+            # A blank state would shadow what is stored for the meeting, so writers must
+            # go through load_state first whenever there is somewhere to load from
+            if self._state_loader is not None:
+                raise MeetingNotLoaded(f"Meeting state is not loaded: {meeting_id}")
+            state = self._new_state()
+            self._register(meeting_id, state, self._new_dedup())
+        return state
+
+    def _rehydrate(self, meeting_id: str, record: MeetingStateRecord) -> MeetingState:
+        state = self._new_state()
+        dedup = self._new_dedup()
+        lines = [f"{speaker}: {text}" if speaker else text for speaker, text in record.segments]
+        state.transcript_lines.extend(lines)
+        for position, line in enumerate(lines):
+            state.search_index.add(line, position)
+        for kind, item in record.insights:
+            getattr(state, COLLECTIONS_BY_KIND[kind]).append(item)
+            state.search_index.add(item.content, item)
+            dedup.add(item.content)
+
+        state.stopped = record.status == "stopped"
+        state.summary = self._build_summary(state.transcript_lines)
+        self._register(meeting_id, state, dedup)
+        return state
+
+    async def load_state(self, meeting_id: str, create: bool = False) -> MeetingState:
+        """The meeting's state, rebuilt from the loader when it is not in memory.
+
+        A meeting with nothing stored gets a blank state, which is only kept when
+        ``create`` is set; writers pass it, readers do not.
+        """
+        state = self._touch(meeting_id)
+        if state is not None:
+            return state
 
-    def _build_summary(self, lines: list[str]) -> str:
+        record = None
+        if self._state_loader is not None:
+            record = await self._state_loader(meeting_id)
+            # Another coroutine may have created or rehydrated the meeting while we awaited
+            state = self._touch(meeting_id)
+            if state is not None:
+                return state
+        if record is not None:
+            return self._rehydrate(meeting_id, record)
+        state = self._new_state()
+        if create:
+            self._register(meeting_id, state, self._new_dedup())
+        return state
+
+    async def restore(self, meeting_ids: Iterable[str]) -> int:
+        restored = 0
+        for meeting_id in meeting_ids:
+            if meeting_id not in self._states:
+                await self.load_state(meeting_id)
+                restored += meeting_id in self._states
+        return restored
+
+    def mark_stopped(self, meeting_id: str) -> None:
+        state = self._states.get(meeting_id)
+        if state is not None:
+            state.stopped = True
+
+    def discard(self, meeting_id: str) -> None:
+        state = self._states.pop(meeting_id, None)
+        self._dedup_by_meeting.pop(meeting_id, None)
+        if state is not None:
+            self._version_floor = max(self._version_floor, state.version)
+            state.transcript_lines.close()
+
+    def evict(self, now: float | None = None) -> list[str]:
+        """Drop idle meetings, then stopped and least recently used ones while over budget.
+
+        Pinned meetings (live sockets, ingest jobs in flight) are never dropped, even if
+        that leaves the manager over its count or memory budget for a while.
+        """
+        now = monotonic() if now is None else now
+        evicted: list[str] = []
+        for meeting_id, state in list(self._states.items()):
+            ttl = self._stopped_ttl_seconds if state.stopped else self._idle_ttl_seconds
+            if meeting_id not in self._pins and now - state.last_accessed >= ttl:
+                evicted.append(meeting_id)
+        for meeting_id in evicted:
+            self.discard(meeting_id)
+
+        # Over the count or memory budget: stopped meetings go first, then least recently used
+        total_bytes = sum(state.estimated_bytes() for state in self._states.values())
+        unpinned = [item for item in self._states.items() if item[0] not in self._pins]
+        candidates = [mid for mid, state in unpinned if state.stopped]
+        candidates += [mid for mid, state in unpinned if not state.stopped]
+        for meeting_id in candidates:
+            if len(self._states) <= self._max_meetings and total_bytes <= self._memory_budget_bytes:
+                break
+            if len(self._states) == 1:
+                break
+            total_bytes -= self._states[meeting_id].estimated_bytes()
+            self.discard(meeting_id)
+            evicted.append(meeting_id)
+        return evicted
+
+    async def run_eviction(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.evict()
+
+    def _should_update(self, state: MeetingState, now: datetime) -> bool:
+        if state.last_updated_at is None:
+            return True
+        return now - state.last_updated_at >= self._min_update_interval
+
+    def _extract_insight(self, text: str) -> tuple[str, str] | None:
+        match = self._classifier.classify(text)
+        if match is None:
+            return None
+        return match.collection, match.content
+
+    def _build_summary(self, lines: Sequence[str]) -> str:
         if not lines:
             return ""
         total = len(lines)
@@ -119,15 +398,60 @@ class StateManager:
         return header + body
 
     def get_state(self, meeting_id: str) -> MeetingState:
-        return self._state_for(meeting_id)
+        return self._touch(meeting_id) or self._new_state()
+
+    def build_delta(self, meeting_id: str, since_version: int) -> dict | None:
+        state = self.get_state(meeting_id)
+        if since_version > state.version or state.changes_since(since_version) is None:
+            return None
+        return build_delta_payload(state, since_version)
+
+    def insights_since(
+        self,
+        meeting_id: str,
+        since_version: int,
+    ) -> list[tuple[InsightKind, Decision | ActionItem | Risk | OpenQuestion]]:
+        changes = self.get_state(meeting_id).changes_since(since_version) or []
+        return [
+            (INSIGHT_KINDS[change.collection], change.value)
+            for change in changes
+            if change.collection in INSIGHT_KINDS
+        ]
+
+    def answer_cache_stats(self, meeting_id: str) -> dict[str, int]:
+        return self.get_state(meeting_id).answer_cache.stats()
+
+    def dedup_stats(self, meeting_id: str) -> dict[str, int]:
+        dedup = self._dedup_by_meeting.get(meeting_id) if self._touch(meeting_id) else None
+        return (dedup or self._new_dedup()).stats()
+
+    def _answer_dependencies(self, state: MeetingState, question_text: str) -> tuple[int, ...]:
+        if "summary" in question_text:
+            collections = (SUMMARY_COLLECTION,) if state.summary else (TRANSCRIPT_COLLECTION,)
+        elif "decision" in question_text:
+            collections = ("decisions",)
+        elif "action" in question_text:
+            collections = ("actions",)
+        elif "risk" in question_text:
+            collections = ("risks",)
+        else:
+            collections = (TRANSCRIPT_COLLECTION, *INSIGHT_COLLECTIONS)
+        return tuple(state.collection_versions.get(name, 0) for name in collections)
 
     def answer_question(self, meeting_id: str, question: str) -> str:
-        state = self._state_for(meeting_id)
+        state = self.get_state(meeting_id)
         if not state.transcript_lines:
             return "I do not have enough meeting context yet. Please continue the meeting first."
 
-        question_text = question.strip().lower()
+        question_text = normalize_question(question)
+        dependencies = self._answer_dependencies(state, question_text)
+        answer = state.answer_cache.get(question_text, dependencies)
+        if answer is None:
+            answer = self._compose_answer(state, question_text)
+            state.answer_cache.put(question_text, dependencies, answer)
+        return answer
 
+    def _compose_answer(self, state: MeetingState, question_text: str) -> str:
         if "summary" in question_text:
             return state.summary or self._build_summary(state.transcript_lines)
 
@@ -146,6 +470,22 @@ class StateManager:
                 return "No risks identified yet."
             return "Risks:\n" + "\n".join(f"• {item.content}" for item in state.risks[-5:])
 
+        hits = state.search_index.search(question_text, limit=5)
+        if hits:
+            positions = sorted(hit.ref for hit in hits if isinstance(hit.ref, int))
+            insights = [hit.ref for hit in hits if not isinstance(hit.ref, int)]
+            sections = []
+            if positions:
+                sections.append(
+                    "Here's what was said about that:\n"
+                    + "\n".join(f"• {state.transcript_lines[position]}" for position in positions),
+                )
+            if insights:
+                sections.append(
+                    "Related insights:\n" + "\n".join(f"• {item.content}" for item in insights),
+                )
+            return "\n\n".join(sections)
+
         # General answer: provide full context
         context = state.transcript_lines[-5:]
         answer = "Here's the recent meeting context:\n"
@@ -156,33 +496,87 @@ class StateManager:
             answer += "\n\nDecisions:\n" + "\n".join(f"• {item.content}" for item in state.decisions[-3:])
         return answer
 
-    def process_transcript_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> dict | None:
+    def ingest_target(self, meeting_id: str) -> Deduplicator:
+        self._state_for(meeting_id)
+        return self._dedup_by_meeting[meeting_id]
+
+    def analyze_segment(
+        self,
+        dedup: Deduplicator,
+        text: str,
+        speaker: str | None = None,
+    ) -> SegmentAnalysis:
+        # Touches no shared state, so it can run off the event loop as long as the
+        # segments of one meeting are analyzed in order
+        line = f"{speaker}: {text}" if speaker else text
+        analysis = SegmentAnalysis(line=line, line_tokens=tokenize(line))
+        extracted = self._extract_insight(text)
+        if extracted is not None and dedup.add_if_unique(extracted[1]):
+            analysis.insight = extracted
+            analysis.insight_tokens = tokenize(extracted[1])
+        return analysis
+
+    def analyze_segments(
+        self,
+        dedup: Deduplicator,
+        segments: Sequence[tuple[str, str | None]],
+    ) -> list[SegmentAnalysis]:
+        return [self.analyze_segment(dedup, text, speaker) for text, speaker in segments]
+
+    def apply_segment(self, meeting_id: str, analysis: SegmentAnalysis) -> dict | None:
+        return self.apply_segments(meeting_id, [analysis])
+
+    def apply_segments(self, meeting_id: str, analyses: Sequence[SegmentAnalysis]) -> dict | None:
+        # A whole batch lands before the publish check, so it yields at most one delta
         now = datetime.now(timezone.utc)
         state = self._state_for(meeting_id)
-        dedup = self._dedup_by_meeting[meeting_id]
 
-        line = f"{speaker}: {text}" if speaker else text
-        state.transcript_lines.append(line)
+        for analysis in analyses:
+            state.transcript_lines.append(analysis.line)
+            position = len(state.transcript_lines) - 1
+            state.search_index.add(analysis.line, position, analysis.line_tokens)
+            state.record_change(TRANSCRIPT_COLLECTION, analysis.line)
 
-        extracted = self._extract_insight(meeting_id, text)
-        if extracted is not None:
-            collection_name, item = extracted
-            if dedup.add_if_unique(item.content):
+            if analysis.insight is not None:
+                collection_name, content = analysis.insight
+                item = INSIGHT_MODELS[collection_name](
+                    id=str(uuid4()),
+                    meeting_id=meeting_id,
+                    content=content,
+                    created_at=now,
+                )
                 getattr(state, collection_name).append(item)
+                state.search_index.add(content, item, analysis.insight_tokens)
+                state.record_change(collection_name, item)
+
+        if not analyses or not self._should_update(state, now):
+            return None
+
+        return self._publish(state, now)
+
+    def process_transcript_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> dict | None:
+        dedup = self.ingest_target(meeting_id)
+        return self.apply_segment(meeting_id, self.analyze_segment(dedup, text, speaker))
+
+    def process_transcript_segments(
+        self,
+        meeting_id: str,
+        segments: Sequence[tuple[str, str | None]],
+    ) -> dict | None:
+        dedup = self.ingest_target(meeting_id)
+        return self.apply_segments(meeting_id, self.analyze_segments(dedup, segments))
 
-        if not self._should_update(state, now):
+    def flush(self, meeting_id: str) -> dict | None:
+        state = self._states.get(meeting_id)
+        if state is None or state.version == state.published_version:
             return None
+        return self._publish(state, datetime.now(timezone.utc))
 
+    def _publish(self, state: MeetingState, now: datetime) -> dict:
         state.summary = self._build_summary(state.transcript_lines)
         state.last_updated_at = now
+        state.collection_versions[SUMMARY_COLLECTION] = state.version
 
-        return {
-            "summary": state.summary,
-            "insights": {
-                "decisions": [item.model_dump(mode="json") for item in state.decisions],
-                "actions": [item.model_dump(mode="json") for item in state.actions],
-                "risks": [item.model_dump(mode="json") for item in state.risks],
-                "open_questions": [item.model_dump(mode="json") for item in state.open_questions],
-            },
-            "updated_at": state.last_updated_at.isoformat(),
-        }
+        delta = build_delta_payload(state, state.published_version)
+        state.published_version = state.version
+        return delta
@@ -0,0 +1,117 @@
+import asyncio
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from time import monotonic
+
+from src.services.state_manager import StateManager
+from src.services.websocket_manager import WebSocketConnectionManager
+
+
+class SummaryFlushScheduler:
+    """Trailing-edge flush of pending meeting changes, one timer per meeting.
+
+    Segment arrivals inside a window are coalesced into a single ``meeting.delta``. The
+    window widens from ``min_delay_seconds`` towards ``max_delay_seconds`` as the recent
+    segment rate and the subscriber count approach their "busy" levels. Arrival times
+    are pruned after each flush and kept for at most ``max_meetings`` meetings.
+    """
+
+    def __init__(
+        self,
+        state_manager: StateManager,
+        websocket_manager: WebSocketConnectionManager,
+        min_delay_seconds: float = 1.0,
+        max_delay_seconds: float = 10.0,
+        busy_segment_rate: float = 2.0,
+        busy_subscriber_count: int = 50,
+        rate_window_seconds: float = 10.0,
+        max_meetings: int = 1000,
+    ):
+        self._state_manager = state_manager
+        self._websocket_manager = websocket_manager
+        self._min_delay = min_delay_seconds
+        self._max_delay = max(max_delay_seconds, min_delay_seconds)
+        self._busy_segment_rate = busy_segment_rate
+        self._busy_subscriber_count = busy_subscriber_count
+        self._rate_window = rate_window_seconds
+        self._max_meetings = max(max_meetings, 1)
+        self._timers: dict[str, asyncio.Task] = {}
+        self._arrivals: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def tracked_meetings(self) -> int:
+        return len(self._arrivals)
+
+    def segment_rate(self, meeting_id: str) -> float:
+        return len(self._prune(meeting_id)) / self._rate_window
+
+    def next_delay(self, meeting_id: str) -> float:
+        pressure = 0.0
+        if self._busy_segment_rate > 0:
+            pressure += self.segment_rate(meeting_id) / self._busy_segment_rate
+        if self._busy_subscriber_count > 0:
+            subscribers = self._websocket_manager.connection_count(meeting_id)
+            pressure += subscribers / self._busy_subscriber_count
+        return self._min_delay + (self._max_delay - self._min_delay) * min(pressure, 1.0)
+
+    def notify(self, meeting_id: str, segments: int = 1) -> None:
+        arrivals = self._arrivals.get(meeting_id)
+        if arrivals is None:
+            arrivals = self._arrivals[meeting_id] = deque()
+            if len(self._arrivals) > self._max_meetings:
+                self._arrivals.popitem(last=False)
+        else:
+            self._arrivals.move_to_end(meeting_id)
+        arrivals.extend([monotonic()] * segments)
+        timer = self._timers.get(meeting_id)
+        if timer is not None and not timer.done():
+            return
+        self._timers[meeting_id] = asyncio.create_task(
+            self._flush_later(meeting_id, self.next_delay(meeting_id)),
+        )
+
+    async def flush(self, meeting_id: str) -> None:
+        delta = self._state_manager.flush(meeting_id)
+        if delta is None:
+            return
+        await self._websocket_manager.broadcast(
+            meeting_id,
+            {
+                "type": "meeting.delta",
+                "meeting_id": meeting_id,
+                "payload": delta,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    async def stop(self, meeting_id: str, flush: bool = True) -> None:
+        timer = self._timers.pop(meeting_id, None)
+        self._arrivals.pop(meeting_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+            await asyncio.gather(timer, return_exceptions=True)
+        if flush:
+            await self.flush(meeting_id)
+
+    async def close(self) -> None:
+        for meeting_id in list(self._timers):
+            await self.stop(meeting_id, flush=False)
+
+    async def _flush_later(self, meeting_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._timers.get(meeting_id) is asyncio.current_task():
+            del self._timers[meeting_id]
+        await self.flush(meeting_id)
+        if meeting_id not in self._timers:
+            self._prune(meeting_id)
+
+    def _prune(self, meeting_id: str) -> deque[float]:
+        """Drops arrivals older than the rate window, and the meeting once none are left."""
+        arrivals = self._arrivals.get(meeting_id)
+        if arrivals is None:
+            return deque()
+        cutoff = monotonic() - self._rate_window
+        while arrivals and arrivals[0] < cutoff:
+            arrivals.popleft()
+        if not arrivals and meeting_id not in self._timers:
+            del self._arrivals[meeting_id]
+        return arrivals
@@ -0,0 +1,82 @@
+import re
+from collections import OrderedDict
+
+TOKEN_PATTERN = re.compile(r"\w+")
+HASH_BASE = 1_000_003
+HASH_MODULUS = (1 << 61) - 1
+
+
+class TranscriptStitcher:
+    """Drops text that repeats the end of the previous segment from the same speaker.
+
+    Chunked STT transcribes overlapping audio, so a segment often starts with the words
+    the previous one ended with. The longest suffix/prefix overlap of normalized tokens
+    is found with rolling hashes over at most ``max_overlap_tokens`` tokens, confirmed
+    token by token, and only the text after it is kept. An overlap needs at least
+    ``min_overlap_tokens`` tokens and must leave something behind, so a speaker who
+    repeats a short phrase ("Thank you") is never trimmed to nothing.
+    """
+
+    def __init__(
+        self,
+        min_overlap_tokens: int = 3,
+        max_overlap_tokens: int = 32,
+        max_meetings: int = 1000,
+    ):
+        self._min_overlap = max(min_overlap_tokens, 1)
+        self._max_overlap = max(max_overlap_tokens, 0)
+        self._max_meetings = max(max_meetings, 1)
+        self._tails: OrderedDict[str, dict[str | None, list[str]]] = OrderedDict()
+        self.trimmed_tokens = 0
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    def discard(self, meeting_id: str) -> None:
+        self._tails.pop(meeting_id, None)
+
+    def stitch(self, meeting_id: str, text: str, speaker: str | None = None) -> str:
+        if not self._max_overlap:
+            return text
+
+        tails = self._tails.get(meeting_id)
+        if tails is None:
+            tails = self._tails[meeting_id] = {}
+            if len(self._tails) > self._max_meetings:
+                self._tails.popitem(last=False)
+        else:
+            self._tails.move_to_end(meeting_id)
+
+        matches = list(TOKEN_PATTERN.finditer(text))
+        tokens = [match.group().lower() for match in matches]
+        tail = tails.get(speaker, [])
+        overlap = self._overlap(tail, tokens)
+
+        fresh = tokens[overlap:]
+        if len(fresh) >= self._max_overlap:
+            tails[speaker] = fresh[-self._max_overlap :]
+        else:
+            tails[speaker] = (tail + fresh)[-self._max_overlap :]
+
+        if not overlap:
+            return text
+        self.trimmed_tokens += overlap
+        return text[matches[overlap].start() :]
+
+    def _overlap(self, tail: list[str], tokens: list[str]) -> int:
+        # prefix hashes tokens[:size], suffix hashes tail[-size:]; both grow one token a step
+        window = min(len(tail), len(tokens) - 1, self._max_overlap)
+        prefix = suffix = 0
+        power = 1
+        sizes: list[int] = []
+        for size in range(1, window + 1):
+            prefix = (prefix * HASH_BASE + hash(tokens[size - 1])) % HASH_MODULUS
+            suffix = (hash(tail[-size]) * power + suffix) % HASH_MODULUS
+            power = power * HASH_BASE % HASH_MODULUS
+            if prefix == suffix and size >= self._min_overlap:
+                sizes.append(size)
+
+        for size in reversed(sizes):
+            if tail[-size:] == tokens[:size]:
+                return size
+        return 0
@@ -0,0 +1,121 @@
+import mmap
+import tempfile
+from array import array
+from collections import deque
+from collections.abc import Iterator, Sequence
+from typing import IO, overload
+
+DEFAULT_TAIL_SIZE = 2000
+DEFAULT_SPILL_BATCH_SIZE = 256
+LINE_OVERHEAD_BYTES = 64
+
+
+class TranscriptStore(Sequence[str]):
+    """Append-only transcript that keeps a bounded tail in memory.
+
+    Older lines are spilled in batches to an anonymous append-only temp file and read
+    back lazily through a memory map, so indexing, slicing and iteration still see the
+    whole transcript.
+    """
+
+    def __init__(
+        self,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        spill_dir: str | None = None,
+        spill_batch_size: int = DEFAULT_SPILL_BATCH_SIZE,
+    ):
+        self._tail_size = max(tail_size, 1)
+        self._spill_dir = spill_dir or None
+        self._spill_batch_size = max(spill_batch_size, 1)
+        self._tail: deque[str] = deque()
+        self._tail_chars = 0
+        self._offsets = array("Q", [0])
+        self._spill_file: IO[bytes] | None = None
+        self._mmap: mmap.mmap | None = None
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def in_memory_count(self) -> int:
+        return len(self._tail)
+
+    @property
+    def memory_bytes(self) -> int:
+        tail_bytes = self._tail_chars + LINE_OVERHEAD_BYTES * len(self._tail)
+        return tail_bytes + self._offsets.itemsize * len(self._offsets)
+
+    def append(self, line: str) -> None:
+        self._tail.append(line)
+        self._tail_chars += len(line)
+        if len(self._tail) >= self._tail_size + self._spill_batch_size:
+            self._spill(self._spill_batch_size)
+
+    def extend(self, lines: Sequence[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _spill(self, count: int) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(dir=self._spill_dir, buffering=0)
+
+        chunks: list[bytes] = []
+        offset = self._offsets[-1]
+        for _ in range(count):
+            line = self._tail.popleft()
+            self._tail_chars -= len(line)
+            encoded = line.encode("utf-8")
+            chunks.append(encoded)
+            offset += len(encoded)
+            self._offsets.append(offset)
+        self._spill_file.write(b"".join(chunks))
+
+    def _mapped(self) -> mmap.mmap:
+        size = self._offsets[-1]
+        if self._mmap is None or len(self._mmap) < size:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._spill_file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _read_spilled(self, index: int) -> str:
+        return self._mapped()[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self.spilled_count + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("transcript index out of range")
+
+        spilled = self.spilled_count
+        if index < spilled:
+            return self._read_spilled(index)
+        return self._tail[index - spilled]
+
+    def __iter__(self) -> Iterator[str]:
+        spilled = self.spilled_count
+        for index in range(spilled):
+            yield self._read_spilled(index)
+        yield from list(self._tail)
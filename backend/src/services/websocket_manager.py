@@ -1,22 +1,432 @@
-from collections import defaultdict
+import asyncio
+import json
+import logging
+import zlib
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import monotonic
 
 from fastapi import WebSocket
 
+from src.services.broker import LocalBroker, MessageBroker
+from src.services.event_log import EventLog
+from src.services.state_manager import merge_delta_payloads
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder produces the same frames
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional, clients asking for MessagePack get JSON instead
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+SLOW_CONSUMER_POLICIES = ("drop", "coalesce", "disconnect")
+TRY_AGAIN_LATER_CLOSE_CODE = 1013
+GOING_AWAY_CLOSE_CODE = 1001
+INVALID_PAYLOAD_CLOSE_CODE = 1007
+MAX_INBOUND_FRAME_BYTES = 1024 * 1024
+WIRE_ENCODINGS = ("json", "msgpack")
+WIRE_COMPRESSIONS = ("none", "deflate")
+SUBPROTOCOL_PREFIX = "meeting-copilot."
+
+
+def encode_message(message: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass(frozen=True, slots=True)
+class WireFormat:
+    """How one socket's frames are serialized: JSON text or MessagePack, optionally deflated.
+
+    Deflated frames are raw deflate streams (``DecompressionStream("deflate-raw")`` in
+    browsers) and always go out as binary. Clients may send text frames as JSON at any
+    time; their binary frames are decoded with the negotiated format. A client frame that
+    inflates past ``MAX_INBOUND_FRAME_BYTES`` is rejected rather than expanded.
+    """
+
+    encoding: str = "json"
+    compression: str = "none"
+
+    @property
+    def subprotocol(self) -> str:
+        suffix = "+deflate" if self.compression == "deflate" else ""
+        return f"{SUBPROTOCOL_PREFIX}{self.encoding}{suffix}"
+
+    def encode(self, message: dict, text: str | None = None) -> str | bytes:
+        if self.encoding == "msgpack":
+            data = msgpack.packb(message)
+        else:
+            data = text if text is not None else encode_message(message)
+        if self.compression != "deflate":
+            return data
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        raw = data.encode() if isinstance(data, str) else data
+        return compressor.compress(raw) + compressor.flush()
+
+    def decode(self, data: bytes, max_bytes: int = MAX_INBOUND_FRAME_BYTES) -> dict:
+        if self.compression == "deflate":
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            try:
+                data = decompressor.decompress(data, max_bytes)
+            except zlib.error as exc:
+                raise ValueError("Invalid deflate frame") from exc
+            if decompressor.unconsumed_tail:
+                raise ValueError(f"Inbound frame inflates past {max_bytes} bytes")
+        if self.encoding == "msgpack":
+            return msgpack.unpackb(data)
+        return json.loads(data)
+
+
+JSON_WIRE = WireFormat()
+
+
+def _wire_format(encoding: str | None, compression: str | None) -> WireFormat | None:
+    encoding, compression = encoding or "json", compression or "none"
+    if encoding not in WIRE_ENCODINGS or compression not in WIRE_COMPRESSIONS:
+        return None
+    if encoding == "msgpack" and msgpack is None:
+        return None
+    return WireFormat(encoding, compression)
+
+
+def negotiate_wire_format(
+    query: Mapping[str, str],
+    subprotocols: Iterable[str] = (),
+) -> tuple[WireFormat, str | None]:
+    """Pick the first supported ``meeting-copilot.<encoding>[+deflate]`` subprotocol,
+    else the ``encoding``/``compression`` query parameters, else plain JSON."""
+    for subprotocol in subprotocols:
+        if not subprotocol.startswith(SUBPROTOCOL_PREFIX):
+            continue
+        encoding, _, compression = subprotocol.removeprefix(SUBPROTOCOL_PREFIX).partition("+")
+        wire_format = _wire_format(encoding, compression)
+        if wire_format is not None:
+            return wire_format, subprotocol
+
+    wire_format = _wire_format(query.get("encoding"), query.get("compression"))
+    if wire_format is None:
+        # An unavailable encoding still gets the compression that was asked for
+        wire_format = _wire_format(None, query.get("compression")) or JSON_WIRE
+    return wire_format, None
+
+
+@dataclass(slots=True)
+class OutboundFrame:
+    message: dict
+    text: str
+    encoded: dict[WireFormat, str | bytes] = field(default_factory=dict)
+
+    @classmethod
+    def encode(cls, message: dict) -> "OutboundFrame":
+        return cls(message, encode_message(message))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.text) + sum(len(data) for data in self.encoded.values())
+
+    def data(self, wire_format: WireFormat) -> str | bytes:
+        # Shared by every socket of a broadcast, so each format is encoded once
+        if wire_format == JSON_WIRE:
+            return self.text
+        data = self.encoded.get(wire_format)
+        if data is None:
+            data = self.encoded[wire_format] = wire_format.encode(self.message, self.text)
+        return data
+
+
+class ConnectionWriter:
+    """Bounded outbound queue for one socket, drained by its own writer task.
+
+    When the queue is full the slow-consumer policy decides what gives: ``drop``
+    discards the oldest queued ``meeting.delta`` (clients resync when they see the
+    version gap), ``coalesce`` folds the newest queued delta into the new one, which
+    goes to the tail so ``seq`` keeps rising in send order, and ``disconnect`` gives up
+    on the socket. Without a delta to drop or fold into, the
+    oldest queued message is dropped.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = 256,
+        policy: str = "coalesce",
+        wire_format: WireFormat = JSON_WIRE,
+    ):
+        self.websocket = websocket
+        self.wire_format = wire_format
+        self._max_queue_size = max(max_queue_size, 1)
+        self._policy = policy
+        self._queue: deque[OutboundFrame] = deque()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.last_seen = monotonic()
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def start(self, on_failure) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(on_failure))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue.clear()
+
+    def enqueue(self, frame: OutboundFrame) -> bool:
+        """Queue ``frame``; False means the consumer is too slow and must be dropped."""
+        if len(self._queue) >= self._max_queue_size:
+            if self._policy == "disconnect":
+                return False
+            if self._policy == "coalesce" and self._coalesce(frame.message):
+                return True
+            self._make_room()
+
+        self._queue.append(frame)
+        self._ready.set()
+        return True
+
+    def _coalesce(self, message: dict) -> bool:
+        if message.get("type") != "meeting.delta":
+            return False
+        for position in range(len(self._queue) - 1, -1, -1):
+            queued = self._queue[position].message
+            if queued.get("type") != "meeting.delta":
+                continue
+            merged = merge_delta_payloads(queued["payload"], message["payload"])
+            if merged is None:
+                return False
+            # Sent where the new delta would have gone, so frames queued in between keep
+            # their place ahead of its seq; only this connection sees it, so it gets its
+            # own encoding
+            del self._queue[position]
+            self._queue.append(OutboundFrame.encode({**message, "payload": merged}))
+            self.coalesced += 1
+            return True
+        return False
+
+    def _make_room(self) -> None:
+        for position, queued in enumerate(self._queue):
+            if queued.message.get("type") == "meeting.delta":
+                del self._queue[position]
+                break
+        else:
+            self._queue.popleft()
+        self.dropped += 1
+
+    async def _run(self, on_failure) -> None:
+        try:
+            while True:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                data = self._queue.popleft().data(self.wire_format)
+                if isinstance(data, str):
+                    await self.websocket.send_text(data)
+                else:
+                    await self.websocket.send_bytes(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("Dropping websocket after a failed send", exc_info=True)
+            on_failure()
+
 
 class WebSocketConnectionManager:
-    def __init__(self):
-        self._connections: dict[str, set[WebSocket]] = defaultdict(set)
+    """Tracks meeting sockets and fans messages out through per-connection writers.
 
-    async def connect(self, meeting_id: str, websocket: WebSocket) -> None:
-        await websocket.accept()
-        self._connections[meeting_id].add(websocket)
+    ``broadcast`` and ``send`` only queue, so one stalled browser neither delays the
+    other participants nor the receive loop that produced the message. A broadcast is
+    encoded once and the same text frame is queued for every socket. With several
+    workers, the ``broker`` forwards broadcast frames to the sockets of the others.
+
+    Every broadcast gets the next ``seq`` of its meeting and is kept in a bounded
+    event log, so a reconnecting socket can ``resume`` with just the frames it missed.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        slow_consumer_policy: str = "coalesce",
+        broker: MessageBroker | None = None,
+        event_log_size: int = 512,
+        event_log_meetings: int = 1000,
+    ):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy}")
+        self._max_queue_size = max_queue_size
+        self._policy = slow_consumer_policy
+        self._broker = broker or LocalBroker()
+        self._events: EventLog[OutboundFrame] = EventLog(event_log_size, event_log_meetings)
+        self._connections: dict[str, dict[WebSocket, ConnectionWriter]] = {}
+        self._closing: set[asyncio.Task] = set()
+        self.slow_disconnects = 0
+        self.reaped = 0
+
+    async def start(self) -> None:
+        await self._broker.start(self._deliver_remote)
+
+    async def connect(
+        self,
+        meeting_id: str,
+        websocket: WebSocket,
+        wire_format: WireFormat = JSON_WIRE,
+        subprotocol: str | None = None,
+    ) -> None:
+        if subprotocol is None:
+            await websocket.accept()
+        else:
+            await websocket.accept(subprotocol=subprotocol)
+        writer = ConnectionWriter(websocket, self._max_queue_size, self._policy, wire_format)
+        if meeting_id not in self._connections:
+            self._broker.subscribe(meeting_id)
+        self._connections.setdefault(meeting_id, {})[websocket] = writer
+        writer.start(lambda: self.disconnect(meeting_id, websocket))
 
     def disconnect(self, meeting_id: str, websocket: WebSocket) -> None:
-        if meeting_id in self._connections:
-            self._connections[meeting_id].discard(websocket)
-            if not self._connections[meeting_id]:
-                del self._connections[meeting_id]
+        connections = self._connections.get(meeting_id)
+        if connections is None:
+            return
+        writer = connections.pop(websocket, None)
+        if writer is not None:
+            writer.stop()
+        if not connections:
+            del self._connections[meeting_id]
+            self._broker.unsubscribe(meeting_id)
+
+    def connection_count(self, meeting_id: str) -> int:
+        return len(self._connections.get(meeting_id, ()))
+
+    def writer(self, meeting_id: str, websocket: WebSocket) -> ConnectionWriter | None:
+        return self._connections.get(meeting_id, {}).get(websocket)
+
+    def touch(self, meeting_id: str, websocket: WebSocket, now: float | None = None) -> None:
+        writer = self.writer(meeting_id, websocket)
+        if writer is not None:
+            writer.last_seen = monotonic() if now is None else now
+
+    def heartbeat(
+        self,
+        interval_seconds: float,
+        timeout_seconds: float,
+        now: float | None = None,
+    ) -> int:
+        """Ping sockets silent for ``interval_seconds`` and reap those silent past the timeout.
+
+        Any frame from the client counts as a sign of life. A reaped socket's writer is
+        cancelled even if it is stuck sending to a half-open connection.
+        """
+        now = monotonic() if now is None else now
+        reaped = 0
+        for meeting_id, connections in list(self._connections.items()):
+            ping: OutboundFrame | None = None
+            for websocket, writer in list(connections.items()):
+                silent = now - writer.last_seen
+                if silent >= timeout_seconds:
+                    self._drop(meeting_id, websocket, GOING_AWAY_CLOSE_CODE)
+                    reaped += 1
+                elif silent >= interval_seconds:
+                    ping = ping or OutboundFrame.encode(
+                        {
+                            "type": "meeting.ping",
+                            "meeting_id": meeting_id,
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        }
+                    )
+                    if not writer.enqueue(ping):
+                        self._drop_slow_consumer(meeting_id, websocket)
+        self.reaped += reaped
+        return reaped
+
+    async def run_heartbeats(self, interval_seconds: float, timeout_seconds: float) -> None:
+        if interval_seconds <= 0:
+            return
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.heartbeat(interval_seconds, timeout_seconds)
+
+    async def send(self, meeting_id: str, websocket: WebSocket, payload: dict) -> None:
+        await self.send_frame(meeting_id, websocket, OutboundFrame.encode(payload))
+
+    async def send_frame(self, meeting_id: str, websocket: WebSocket, frame: OutboundFrame) -> None:
+        writer = self.writer(meeting_id, websocket)
+        if writer is not None and not writer.enqueue(frame):
+            self._drop_slow_consumer(meeting_id, websocket)
+
+    def position(self, meeting_id: str) -> tuple[str, int]:
+        log = self._events.log(meeting_id)
+        return log.stream, log.seq
+
+    def resume(self, meeting_id: str, websocket: WebSocket, stream: str | None, seq: int) -> bool:
+        """Queue the broadcasts after ``seq``; False means the socket needs a snapshot."""
+        writer = self.writer(meeting_id, websocket)
+        log = self._events.get(meeting_id)
+        missed = None if log is None else log.since(stream, seq)
+        # A replay that would overflow the queue costs more than a snapshot
+        if writer is None or missed is None or writer.pending + len(missed) > self._max_queue_size:
+            return False
+        for frame in missed:
+            if not writer.enqueue(frame):
+                self._drop_slow_consumer(meeting_id, websocket)
+                break
+        return True
 
     async def broadcast(self, meeting_id: str, payload: dict) -> None:
-        for socket in list(self._connections.get(meeting_id, [])):
-            await socket.send_json(payload)
+        frame = self._record(meeting_id, payload)
+        self._deliver(meeting_id, frame)
+        self._broker.publish(meeting_id, frame.text)
+
+    async def close(self) -> None:
+        for meeting_id in list(self._connections):
+            for websocket in list(self._connections.get(meeting_id, ())):
+                self.disconnect(meeting_id, websocket)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+        await self._broker.close()
+
+    def _record(self, meeting_id: str, message: dict) -> OutboundFrame:
+        log = self._events.log(meeting_id)
+        frame = OutboundFrame.encode({**message, "seq": log.seq + 1})
+        log.append(frame)
+        return frame
+
+    def _deliver(self, meeting_id: str, frame: OutboundFrame) -> None:
+        connections = self._connections.get(meeting_id)
+        if not connections:
+            return
+        for websocket, writer in list(connections.items()):
+            if not writer.enqueue(frame):
+                self._drop_slow_consumer(meeting_id, websocket)
+
+    def _deliver_remote(self, meeting_id: str, texts: list[str]) -> None:
+        # Re-stamped with this worker's seq, so resumes against this worker see every event
+        for text in texts:
+            self._deliver(meeting_id, self._record(meeting_id, json.loads(text)))
+
+    def _drop_slow_consumer(self, meeting_id: str, websocket: WebSocket) -> None:
+        self._drop(meeting_id, websocket, TRY_AGAIN_LATER_CLOSE_CODE)
+        self.slow_disconnects += 1
+
+    def _drop(self, meeting_id: str, websocket: WebSocket, code: int) -> None:
+        self.disconnect(meeting_id, websocket)
+        task = asyncio.create_task(self._close_socket(websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_socket(self, websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            logger.debug("Dropped websocket was already closed", exc_info=True)
@@ -1,8 +1,13 @@
 import base64
+import time
+from array import array
+from time import monotonic
 
 from fastapi.testclient import TestClient
 
+from src.config.settings import get_settings
 from src.main import create_app
+from src.services.audio_gate import PcmAudio
 
 
 class FakeElevenLabsProvider:
@@ -47,3 +52,159 @@ def test_stt_chunk_transcription_invalid_payload() -> None:
 
         response = client.post('/api/stt/elevenlabs/chunk', json=payload)
         assert response.status_code == 400
+
+
+class StreamingElevenLabsProvider:
+    def __init__(self) -> None:
+        self.uploads: list[tuple[bytes, str]] = []
+        self.streamed: list[bool] = []
+
+    async def transcribe_audio_chunk(self, audio, mime_type: str) -> dict[str, str]:
+        self.streamed.append(not isinstance(audio, bytes))
+        self.uploads.append((audio if isinstance(audio, bytes) else audio.read(), mime_type))
+        return {'text': ' Action item: send the deck '}
+
+
+def test_stt_chunk_upload_accepts_raw_and_multipart_bodies() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        provider = StreamingElevenLabsProvider()
+        app.state.realtime_providers['elevenlabs'] = provider
+
+        raw = client.post(
+            '/api/stt/elevenlabs/chunk/upload',
+            content=b'raw-audio',
+            headers={'Content-Type': 'audio/ogg;codecs=opus'},
+        )
+        octet = client.post(
+            '/api/stt/elevenlabs/chunk/upload?mime_type=audio/mp4',
+            content=b'octet-audio',
+            headers={'Content-Type': 'application/octet-stream'},
+        )
+        multipart = client.post(
+            '/api/stt/elevenlabs/chunk/upload',
+            files={'file': ('chunk.webm', b'form-audio', 'audio/webm')},
+        )
+
+        for response in (raw, octet, multipart):
+            assert response.status_code == 200
+            assert response.json()['text'] == 'Action item: send the deck'
+        assert provider.uploads == [
+            (b'raw-audio', 'audio/ogg;codecs=opus'),
+            (b'octet-audio', 'audio/mp4'),
+            (b'form-audio', 'audio/webm'),
+        ]
+        assert provider.streamed == [True, True, True]
+
+
+def test_stt_chunk_upload_rejects_bad_bodies(monkeypatch) -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        app.state.realtime_providers['elevenlabs'] = StreamingElevenLabsProvider()
+        monkeypatch.setattr(app.state.settings, 'stt_upload_max_bytes', 8)
+        url = '/api/stt/elevenlabs/chunk/upload'
+        octet = {'Content-Type': 'application/octet-stream'}
+
+        assert client.post(url, content=b'', headers=octet).status_code == 400
+        assert client.post(url, content=b'x' * 9, headers=octet).status_code == 413
+        oversized = {'file': ('a.webm', b'x' * 9, 'audio/webm')}
+        assert client.post(url, files=oversized).status_code == 413
+        assert client.post(url, files={'other': ('a.webm', b'x', 'audio/webm')}).status_code == 400
+        assert client.post(url, json={'audio_base64': 'eA=='}).status_code == 415
+
+        # Without Content-Length the cap is applied while the body streams in
+        monkeypatch.setattr(app.state.settings, 'stt_upload_max_bytes', 1024)
+        head = (
+            b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.webm"\r\n'
+            b'Content-Type: audio/webm\r\n\r\n'
+        )
+
+        def unsized_body():
+            yield head
+            for _ in range(200):
+                yield b'x' * 1024
+            yield b'\r\n--b--\r\n'
+
+        response = client.post(
+            url,
+            content=unsized_body(),
+            headers={'Content-Type': 'multipart/form-data; boundary=b'},
+        )
+        assert response.status_code == 413
+
+
+def _wav(amplitude: int, seconds: float = 1.0) -> bytes:
+    rate = 16000
+    samples = int(rate * seconds)
+    square_wave = (amplitude if index % 40 < 20 else -amplitude for index in range(samples))
+    return PcmAudio(array('h', square_wave).tobytes(), rate, 1).to_wav()
+
+
+def test_stt_gate_skips_silence_and_coalesces_stream_chunks() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        provider = StreamingElevenLabsProvider()
+        app.state.realtime_providers['elevenlabs'] = provider
+        url = '/api/stt/elevenlabs/chunk/upload?stream=meeting-1'
+        wav = {'Content-Type': 'audio/wav'}
+
+        silent = client.post(url, content=_wav(5), headers=wav)
+        held = client.post(url, content=_wav(6000), headers=wav)
+        last = client.post(
+            '/api/stt/elevenlabs/chunk',
+            json={
+                'audio_base64': base64.b64encode(_wav(6000)).decode('utf-8'),
+                'mime_type': 'audio/wav',
+                'stream': 'meeting-1',
+                'final': True,
+            },
+        )
+
+        assert silent.json() == {'text': '', 'status': 'silent'}
+        assert held.json() == {'text': '', 'status': 'buffered'}
+        assert last.json() == {'text': 'Action item: send the deck', 'status': 'transcribed'}
+        assert [mime_type for _, mime_type in provider.uploads] == ['audio/wav']
+
+        stats = client.get('/api/stt/stats').json()
+        assert stats['chunks'] == 3
+        assert stats['upstream_calls'] == 1
+        assert stats['upstream_calls_saved'] == 2
+        assert stats['audio_seconds_saved'] == 1.0
+
+        # A window left hanging times out to the meeting it names, not to the caller
+        held = client.post(f'{url}&meeting_id=m-42', content=_wav(6000), headers=wav)
+        assert held.json() == {'text': '', 'status': 'buffered'}
+        expired = app.state.audio_gate.expire(now=monotonic() + 3600)
+        assert [(meeting_id, result.status) for meeting_id, result in expired] == [
+            ('m-42', 'ready')
+        ]
+
+
+def test_stt_gate_delivers_timed_out_windows_to_the_meeting_transcript(monkeypatch) -> None:
+    monkeypatch.setenv('STT_COALESCE_MAX_WAIT_SECONDS', '0.05')
+    monkeypatch.setenv('STT_COALESCE_FLUSH_INTERVAL_SECONDS', '0.02')
+    get_settings.cache_clear()
+    app = create_app()
+
+    with TestClient(app) as client:
+        app.state.realtime_providers['elevenlabs'] = StreamingElevenLabsProvider()
+        meeting_id = client.post('/api/meetings', json={'title': 'Gated'}).json()['id']
+        held = client.post(
+            f'/api/stt/elevenlabs/chunk/upload?stream=s-1&meeting_id={meeting_id}',
+            content=_wav(6000),
+            headers={'Content-Type': 'audio/wav'},
+        )
+        assert held.json() == {'text': '', 'status': 'buffered'}
+
+        lines: list[str] = []
+        for _ in range(100):
+            lines = list(app.state.state_manager.get_state(meeting_id).transcript_lines)
+            if lines:
+                break
+            time.sleep(0.02)
+        assert lines == ['Action item: send the deck']
+
+    get_settings.cache_clear()
@@ -1,6 +1,13 @@
+import json
+import time
+import zlib
+
+import pytest
 from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
 from src.main import create_app
+from src.services.rate_limiter import IngestRateLimiter
 
 
 def test_websocket_connect_sends_state_snapshot() -> None:
@@ -19,3 +26,284 @@ def test_websocket_connect_sends_state_snapshot() -> None:
             assert state['meeting_id'] == meeting_id
             assert state['payload']['summary'] == ''
             assert state['payload']['insights']['decisions'] == []
+            # Versions are tagged with the worker that numbered them
+            owner = app.state.state_manager.owner
+            assert connected['payload']['owner'] == state['payload']['owner'] == owner
+
+
+def test_websocket_resync_command_returns_missed_changes() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-resync') as ws:
+            ws.receive_json()
+            state = ws.receive_json()
+            base_version = state['payload']['version']
+
+            ws.send_json(
+                {
+                    'type': 'transcript.segment',
+                    'meeting_id': 'm-resync',
+                    'payload': {'text': 'Action: draft the rollout plan', 'speaker': 'PM'},
+                }
+            )
+            assert ws.receive_json()['type'] == 'transcript.segment'
+            assert ws.receive_json()['type'] == 'meeting.delta'
+
+            ws.send_json(
+                {
+                    'type': 'meeting.command',
+                    'meeting_id': 'm-resync',
+                    'payload': {'command': 'resync', 'version': base_version},
+                }
+            )
+            catch_up = ws.receive_json()
+            assert catch_up['type'] == 'meeting.delta'
+            assert catch_up['payload']['base_version'] == base_version
+            assert catch_up['payload']['transcript_lines'] == ['PM: Action: draft the rollout plan']
+            assert len(catch_up['payload']['insights']['actions']) == 1
+
+            ws.send_json(
+                {
+                    'type': 'meeting.command',
+                    'meeting_id': 'm-resync',
+                    'payload': {'command': 'resync', 'version': 10_000},
+                }
+            )
+            assert ws.receive_json()['type'] == 'meeting.state'
+
+
+def test_websocket_stitches_overlapping_segments() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-stitch') as ws:
+            ws.receive_json()
+            ws.receive_json()
+
+            for text in ('We will ship the beta on Friday', 'the beta on Friday if QA signs off'):
+                ws.send_json(
+                    {
+                        'type': 'transcript.segment',
+                        'meeting_id': 'm-stitch',
+                        'payload': {'text': text, 'speaker': 'PM', 'source': 'elevenlabs'},
+                    }
+                )
+
+            first = ws.receive_json()
+            assert first['payload']['text'] == 'We will ship the beta on Friday'
+            ws.receive_json()
+            second = ws.receive_json()
+            assert second['type'] == 'transcript.segment'
+            assert second['payload']['text'] == 'if QA signs off'
+
+
+def test_websocket_only_stitches_chunked_segments_and_forgets_closed_meetings() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-repeat') as ws:
+            ws.receive_json()
+            ws.receive_json()
+
+            for source in (None, None, 'elevenlabs'):
+                ws.send_json(
+                    {
+                        'type': 'transcript.segment',
+                        'meeting_id': 'm-repeat',
+                        'payload': {'text': 'Thank you all', 'speaker': 'PM', 'source': source},
+                    }
+                )
+
+            texts = []
+            while len(texts) < 3:
+                message = ws.receive_json()
+                if message['type'] == 'transcript.segment':
+                    texts.append(message['payload']['text'])
+            assert texts == ['Thank you all'] * 3
+            assert len(app.state.transcript_stitcher) == 1
+
+        client.get('/health')
+        assert len(app.state.transcript_stitcher) == 0
+
+
+def test_websocket_batched_segments_yield_one_broadcast_and_one_delta() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-batch') as ws:
+            ws.receive_json()
+            base_version = ws.receive_json()['payload']['version']
+
+            ws.send_json(
+                {
+                    'type': 'transcript.segments',
+                    'meeting_id': 'm-batch',
+                    'payload': {
+                        'segments': [
+                            {'text': 'Action: draft the rollout plan', 'speaker': 'PM'},
+                            {'text': '   '},
+                            {
+                                'text': 'the rollout plan by Monday',
+                                'speaker': 'PM',
+                                'source': 'elevenlabs',
+                            },
+                            {'text': 'Sounds good'},
+                        ]
+                    },
+                }
+            )
+
+            batch = ws.receive_json()
+            assert batch['type'] == 'transcript.segments'
+            assert batch['payload']['segments'] == [
+                {'text': 'Action: draft the rollout plan', 'speaker': 'PM'},
+                {'text': 'by Monday', 'speaker': 'PM'},
+                {'text': 'Sounds good', 'speaker': 'Attendee'},
+            ]
+
+            delta = ws.receive_json()
+            assert delta['type'] == 'meeting.delta'
+            assert delta['payload']['base_version'] == base_version
+            assert delta['payload']['transcript_lines'] == [
+                'PM: Action: draft the rollout plan',
+                'PM: by Monday',
+                'Sounds good',
+            ]
+            assert len(delta['payload']['insights']['actions']) == 1
+
+
+def test_websocket_negotiates_deflated_json_through_a_subprotocol() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect(
+            '/ws/meetings/m-wire', subprotocols=['meeting-copilot.json+deflate']
+        ) as ws:
+            assert ws.accepted_subprotocol == 'meeting-copilot.json+deflate'
+            connected = json.loads(zlib.decompress(ws.receive_bytes(), -zlib.MAX_WBITS))
+            assert connected['payload']['encoding'] == 'json'
+            assert connected['payload']['compression'] == 'deflate'
+            ws.receive_bytes()
+
+            ws.send_json(
+                {
+                    'type': 'transcript.segment',
+                    'meeting_id': 'm-wire',
+                    'payload': {'text': 'Hello there', 'speaker': 'PM'},
+                }
+            )
+            segment = json.loads(zlib.decompress(ws.receive_bytes(), -zlib.MAX_WBITS))
+            assert segment['payload'] == {'text': 'Hello there', 'speaker': 'PM'}
+
+
+def test_websocket_speaks_msgpack_when_asked_in_the_query() -> None:
+    msgpack = pytest.importorskip('msgpack')
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-msgpack?encoding=msgpack') as ws:
+            connected = msgpack.unpackb(ws.receive_bytes())
+            assert connected['payload']['encoding'] == 'msgpack'
+            assert connected['payload']['compression'] == 'none'
+            assert msgpack.unpackb(ws.receive_bytes())['type'] == 'meeting.state'
+
+            ws.send_bytes(
+                msgpack.packb(
+                    {
+                        'type': 'transcript.segment',
+                        'meeting_id': 'm-msgpack',
+                        'payload': {'text': 'Binary hello', 'speaker': 'PM'},
+                    }
+                )
+            )
+            assert msgpack.unpackb(ws.receive_bytes())['payload']['text'] == 'Binary hello'
+
+
+def test_websocket_closes_on_a_bad_frame_and_releases_the_connection() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-bad?compression=deflate') as ws:
+            ws.receive_bytes()
+            ws.receive_bytes()
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+            ws.send_bytes(compressor.compress(b' ' * 4_000_000) + compressor.flush())
+            with pytest.raises(WebSocketDisconnect) as closed:
+                ws.receive_bytes()
+            assert closed.value.code == 1007
+
+        manager = app.state.websocket_manager
+        for _ in range(100):
+            if not manager.connection_count('m-bad'):
+                break
+            time.sleep(0.01)
+        assert manager.connection_count('m-bad') == 0
+
+
+def test_websocket_reconnect_resumes_from_the_last_seen_sequence() -> None:
+    app = create_app()
+
+    def segment(text: str) -> dict:
+        return {
+            'type': 'transcript.segment',
+            'meeting_id': 'm-resume',
+            'payload': {'text': text, 'speaker': 'PM'},
+        }
+
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws/meetings/m-resume') as ws:
+            connected = ws.receive_json()
+            stream = connected['payload']['stream']
+            assert ws.receive_json()['type'] == 'meeting.state'
+            ws.send_json(segment('First point'))
+            assert ws.receive_json()['seq'] == connected['payload']['seq'] + 1
+            last_seq = ws.receive_json()['seq']
+
+        with client.websocket_connect('/ws/meetings/m-resume') as speaker:
+            speaker.receive_json()
+            speaker.receive_json()
+            speaker.send_json(segment('Said while you were away'))
+            speaker.receive_json()
+            speaker.receive_json()
+
+            url = f'/ws/meetings/m-resume?stream={stream}&last_seq={last_seq}'
+            with client.websocket_connect(url) as ws:
+                assert ws.receive_json()['type'] == 'meeting.connected'
+                missed = ws.receive_json()
+                assert missed['type'] == 'transcript.segment'
+                assert missed['seq'] == last_seq + 1
+                assert missed['payload']['text'] == 'Said while you were away'
+                assert ws.receive_json()['seq'] == last_seq + 2
+
+            with client.websocket_connect('/ws/meetings/m-resume?stream=gone&last_seq=1') as ws:
+                ws.receive_json()
+                assert ws.receive_json()['type'] == 'meeting.state'
+
+
+def test_websocket_throttles_segment_floods_and_reports_it() -> None:
+    app = create_app()
+
+    with TestClient(app) as client:
+        app.state.ingest_rate_limiter = IngestRateLimiter(
+            connection_rate=0.001, connection_burst=2, policy='drop'
+        )
+        with client.websocket_connect('/ws/meetings/m-flood') as ws:
+            ws.receive_json()
+            ws.receive_json()
+
+            ws.send_json(
+                {
+                    'type': 'transcript.segments',
+                    'meeting_id': 'm-flood',
+                    'payload': {'segments': [{'text': f'line {n}'} for n in range(5)]},
+                }
+            )
+            status = ws.receive_json()
+            assert status['type'] == 'provider.status'
+            assert status['payload']['status'] == 'throttled'
+            batch = ws.receive_json()
+            assert [s['text'] for s in batch['payload']['segments']] == ['line 0', 'line 1']
+
+        stats = client.get('/api/meetings/m-flood/ingest').json()
+        assert stats == {'admitted': 2, 'coalesced': 0, 'dropped': 3, 'throttled': 1}
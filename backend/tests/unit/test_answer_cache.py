@@ -0,0 +1,18 @@
+from src.services.answer_cache import AnswerCache, normalize_question
+
+
+def test_normalize_question_ignores_case_spacing_and_trailing_punctuation() -> None:
+    assert normalize_question("  What are the   Action items?? ") == "what are the action items"
+
+
+def test_answer_cache_evicts_least_recently_used_and_counts_stats() -> None:
+    cache = AnswerCache(max_entries=2)
+    cache.put("a", (1,), "A")
+    cache.put("b", (1,), "B")
+    assert cache.get("a", (1,)) == "A"
+    cache.put("c", (1,), "C")
+
+    assert cache.get("b", (1,)) is None
+    assert cache.get("a", (2,)) is None
+    assert cache.get("c", (1,)) == "C"
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 2, "invalidations": 1}
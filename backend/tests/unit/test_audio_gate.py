@@ -0,0 +1,138 @@
+import asyncio
+import math
+from array import array
+
+import pytest
+
+from src.services import audio_gate
+from src.services.audio_gate import AudioGate, PcmAudio, parse_pcm, voiced_frames
+
+RATE = 16_000
+
+
+def _pcm(*parts: tuple[float, int]) -> bytes:
+    """Mono 16-bit samples: (seconds, amplitude) runs of a 440 Hz tone."""
+    samples = array("h")
+    for seconds, amplitude in parts:
+        samples.extend(
+            int(amplitude * math.sin(2 * math.pi * 440 * index / RATE))
+            for index in range(int(seconds * RATE))
+        )
+    return samples.tobytes()
+
+
+def _wav(*parts: tuple[float, int]) -> bytes:
+    return PcmAudio(_pcm(*parts), RATE, 1).to_wav()
+
+
+def test_parse_pcm_reads_wav_and_raw_samples() -> None:
+    wav = parse_pcm(_wav((0.5, 8000)), "audio/wav")
+    assert (wav.sample_rate, wav.channels, wav.seconds) == (RATE, 1, 0.5)
+
+    raw = parse_pcm(_pcm((0.25, 8000)) + b"\x00", "audio/pcm; rate=16000; channels=1")
+    assert raw.seconds == 0.25
+
+    with pytest.raises(ValueError):
+        parse_pcm(b"not a wav file", "audio/wav")
+
+
+def test_voiced_frames_match_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    audio = PcmAudio(_pcm((0.3, 10), (0.3, 8000), (0.3, 10)), RATE, 1)
+    voiced = voiced_frames(audio, 480, -45.0)
+    assert voiced == [False] * 10 + [True] * 10 + [False] * 10
+
+    monkeypatch.setattr(audio_gate, "np", None)
+    assert voiced_frames(audio, 480, -45.0) == voiced
+
+
+def test_gate_drops_silence_and_trims_speech() -> None:
+    gate = AudioGate(padding_ms=90)
+
+    assert gate.process(_wav((1.0, 10)), "audio/wav").status == "silent"
+
+    result = gate.process(_wav((1.0, 10), (0.6, 8000), (1.0, 10)), "audio/wav")
+    assert result.status == "ready"
+    assert parse_pcm(result.audio, result.mime_type).seconds == pytest.approx(0.81)
+
+    stats = gate.stats()
+    assert stats["chunks"] == 2
+    assert stats["silent_chunks"] == 1
+    assert stats["upstream_calls"] == 1
+    assert stats["upstream_calls_saved"] == 1
+    assert stats["audio_seconds_in"] == 3.6
+    assert stats["audio_seconds_saved"] == pytest.approx(2.79)
+
+
+def test_gate_coalesces_stream_chunks_into_windows() -> None:
+    gate = AudioGate(target_seconds=2.0, max_wait_seconds=10.0)
+    speech = _wav((1.0, 8000))
+
+    assert gate.process(speech, "audio/wav", stream="m1", now=0.0).status == "buffered"
+    window = gate.process(speech, "audio/wav", stream="m1", now=1.0)
+    assert window.status == "ready"
+    assert parse_pcm(window.audio, "audio/wav").seconds == 2.0
+
+    # A pause after speech sends what is held, as does a final chunk
+    assert gate.process(speech, "audio/wav", stream="m1", now=2.0).status == "buffered"
+    assert gate.process(_wav((1.0, 10)), "audio/wav", stream="m1", now=3.0).status == "ready"
+    assert gate.process(_wav((1.0, 10)), "audio/wav", stream="m1", now=4.0).status == "silent"
+    assert gate.process(speech, "audio/wav", stream="m2", now=5.0).status == "buffered"
+    assert gate.process(speech, "audio/wav", stream="m2", final=True, now=6.0).status == "ready"
+
+    stats = gate.stats()
+    assert stats["chunks"] == 7
+    assert stats["buffered_chunks"] == 3
+    assert stats["upstream_calls"] == 3
+    assert stats["audio_seconds_sent"] == 5.0
+
+
+def test_gate_expires_evicted_and_stale_windows_to_their_meetings() -> None:
+    gate = AudioGate(target_seconds=5.0, max_wait_seconds=10.0, max_streams=1)
+    speech = _wav((1.0, 8000))
+
+    gate.process(speech, "audio/wav", stream="s1", now=0.0, meeting_id="m1")
+    gate.process(speech, "audio/wav", stream="s2", now=1.0, meeting_id="m2")
+
+    evicted = gate.expire(now=2.0)
+    assert [(meeting, result.status) for meeting, result in evicted] == [("m1", "ready")]
+    assert parse_pcm(evicted[0][1].audio, "audio/wav").seconds == 1.0
+
+    assert gate.expire(now=10.0) == []
+    assert [meeting for meeting, _ in gate.expire(now=11.0)] == ["m2"]
+
+    # With no meeting to deliver to, a timed-out window is not worth an upstream call
+    gate.process(speech, "audio/wav", stream="s3", now=20.0)
+    assert gate.expire(now=40.0) == []
+
+    stats = gate.stats()
+    assert stats["expired_windows"] == 3
+    assert stats["abandoned_windows"] == 1
+    assert stats["upstream_calls"] == 2
+    assert stats["audio_seconds_sent"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_run_flush_delivers_timed_out_text_to_the_meeting() -> None:
+    gate = AudioGate(target_seconds=5.0, max_wait_seconds=0.001)
+    gate.process(_wav((1.0, 8000)), "audio/wav", stream="s1", meeting_id="m1")
+    gate.process(_wav((1.0, 8000)), "audio/wav", stream="s2", meeting_id="m2")
+    replies = [{"text": " held words "}, RuntimeError("upstream down")]
+    delivered: list[tuple[str, str]] = []
+
+    async def transcribe(audio: bytes, mime_type: str) -> dict[str, str]:
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    async def deliver(meeting_id: str, text: str) -> None:
+        delivered.append((meeting_id, text))
+
+    task = asyncio.create_task(gate.run_flush(0.01, transcribe, deliver))
+    while replies:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert delivered == [("m1", "held words")]
+    assert gate.stats()["failed_windows"] == 1
@@ -0,0 +1,75 @@
+import email
+import email.policy
+
+import httpx
+import pytest
+
+from src.services.audio_upload import (
+    MultipartUpload,
+    UploadTooLarge,
+    limit_stream,
+    spool_stream,
+)
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_spool_stream_moves_large_bodies_to_disk() -> None:
+    small = await spool_stream(_chunks(b"ab", b"cd"), spool_bytes=8)
+    assert not small._rolled and small.read() == b"abcd"
+
+    large = await spool_stream(_chunks(b"x" * 6, b"y" * 6), spool_bytes=8)
+    assert large._rolled and large.read() == b"x" * 6 + b"y" * 6
+
+    with pytest.raises(UploadTooLarge):
+        await spool_stream(_chunks(b"x" * 6, b"y" * 6), max_bytes=10)
+
+
+@pytest.mark.asyncio
+async def test_limit_stream_stops_an_unsized_body_at_the_cap() -> None:
+    read = 0
+
+    async def endless():
+        nonlocal read
+        while True:
+            read += 1
+            yield b"x" * 1024
+
+    with pytest.raises(UploadTooLarge):
+        async for _ in limit_stream(endless(), max_bytes=4096):
+            pass
+    assert read == 5
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_streams_the_spool_as_a_form() -> None:
+    spool = await spool_stream(_chunks(b"audio" * 30_000), spool_bytes=1024)
+    received: list[httpx.Request] = []
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        await request.aread()
+        return httpx.Response(200)
+
+    upload = MultipartUpload({"model_id": "scribe_v1"}, "file", "chunk.webm", spool, "audio/webm")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        await client.post("https://upstream/stt", headers=upload.headers, content=upload)
+
+    request = received[0]
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert "transfer-encoding" not in request.headers
+    form = email.message_from_bytes(
+        b"Content-Type: " + request.headers["content-type"].encode() + b"\r\n\r\n"
+        + request.content,
+        policy=email.policy.HTTP,
+    )
+    parts = {
+        part.get_param("name", header="content-disposition"): part for part in form.iter_parts()
+    }
+    assert parts["model_id"].get_content() == "scribe_v1"
+    assert parts["file"].get_content_type() == "audio/webm"
+    assert parts["file"].get_payload(decode=True) == b"audio" * 30_000
@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import pytest
+
+from src.services.broker import LocalPubSubServer, RespBroker
+from src.services.websocket_manager import WebSocketConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    async def poll() -> None:
+        while not condition():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_broadcasts_reach_sockets_on_other_workers(tmp_path) -> None:
+    url = f"unix://{tmp_path / 'broker.sock'}"
+    server = LocalPubSubServer()
+    await server.start(url)
+
+    brokers = [RespBroker(url, flush_interval_seconds=0.01) for _ in range(3)]
+    managers = [WebSocketConnectionManager(broker=broker) for broker in brokers]
+    sockets = [FakeWebSocket() for _ in managers]
+    for manager, socket in zip(managers, sockets, strict=True):
+        await manager.start()
+        await manager.connect("m1", socket)
+    await _wait_for(lambda: all("meeting-copilot:m1" in broker.subscribed for broker in brokers))
+
+    for index in range(50):
+        await managers[index % 2].broadcast("m1", {"type": "bot.flag", "payload": {"n": index}})
+    await _wait_for(lambda: all(len(socket.sent) == 50 for socket in sockets))
+
+    for socket in sockets:
+        numbers = [message["payload"]["n"] for message in socket.sent]
+        assert sorted(numbers) == list(range(50))
+        assert [n for n in numbers if n % 2 == 0] == list(range(0, 50, 2))
+    # Each worker sent its 25 frames in a handful of batched PUBLISH commands
+    assert brokers[0].published == brokers[1].published == 25
+    assert brokers[0].publish_commands < 5
+    assert brokers[2].received == 50
+
+    for manager in managers:
+        await manager.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_workers_receive_nothing(tmp_path) -> None:
+    url = f"unix://{tmp_path / 'broker.sock'}"
+    server = LocalPubSubServer()
+    await server.start(url)
+
+    publisher = WebSocketConnectionManager(broker=RespBroker(url, flush_interval_seconds=0))
+    listener_broker = RespBroker(url, flush_interval_seconds=0)
+    listener = WebSocketConnectionManager(broker=listener_broker)
+    await publisher.start()
+    await listener.start()
+    socket = FakeWebSocket()
+    await listener.connect("m1", socket)
+    await _wait_for(lambda: "meeting-copilot:m1" in listener_broker.subscribed)
+
+    listener.disconnect("m1", socket)
+    await _wait_for(lambda: not listener_broker.subscribed)
+    await publisher.broadcast("m1", {"type": "bot.flag", "payload": {}})
+    await asyncio.sleep(0.05)
+    assert listener_broker.received == 0
+
+    await publisher.close()
+    await listener.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_publishes_are_dropped_while_the_broker_is_down(tmp_path) -> None:
+    broker = RespBroker(f"unix://{tmp_path / 'missing.sock'}", retry_delay_seconds=0.01)
+    manager = WebSocketConnectionManager(broker=broker)
+    await manager.start()
+    socket = FakeWebSocket()
+    await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", {"type": "bot.flag", "payload": {}})
+    await _wait_for(lambda: broker.dropped == 1)
+    await asyncio.sleep(0.01)
+    assert len(socket.sent) == 1
+    await manager.close()
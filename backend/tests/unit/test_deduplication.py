@@ -1,4 +1,12 @@
-from src.services.deduplication import DeduplicationEngine, compute_content_hash, similarity_ratio
+import random
+
+from src.services.deduplication import (
+    DeduplicationEngine,
+    MinHashLSH,
+    WindowedDeduplicationEngine,
+    compute_content_hash,
+    similarity_ratio,
+)
 
 
 def test_compute_content_hash_normalizes_whitespace_and_case() -> None:
@@ -16,3 +24,114 @@ def test_deduplication_engine_add_if_unique() -> None:
     engine = DeduplicationEngine(similarity_threshold=0.9)
     assert engine.add_if_unique("Risk: downtime in region A") is True
     assert engine.add_if_unique("risk: downtime in region a") is False
+
+
+def test_minhash_lsh_returns_near_duplicates_as_candidates() -> None:
+    lsh = MinHashLSH()
+    texts = [
+        "risk: api timeout spike in region a during peak hours",
+        "decision: move the launch to monday after the security review",
+        "action: prepare the customer email with the new pricing tiers",
+    ]
+    for key, text in enumerate(texts):
+        lsh.add(key, lsh.signature(text))
+
+    near_duplicate = lsh.signature("risk: api timeout spikes in region a during peak hours")
+    assert 0 in lsh.candidates(near_duplicate)
+    assert lsh.candidates(lsh.signature("thanks everyone, see you all next week")) == set()
+
+
+def test_deduplication_engine_catches_short_near_duplicates() -> None:
+    engine = DeduplicationEngine()
+    assert engine.add_if_unique("Ship it") is True
+    assert engine.add_if_unique("ship it!") is False
+    assert engine.add_if_unique("Skip it") is True
+    assert len(engine) == 2
+
+
+def test_deduplication_engine_matches_linear_scan() -> None:
+    rng = random.Random(7)
+    words = "api timeout vendor contract pricing launch review customer budget release".split()
+    texts: list[str] = []
+    for _ in range(150):
+        if texts and rng.random() < 0.3:
+            chars = list(rng.choice(texts))
+            chars[rng.randrange(len(chars))] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+            texts.append("".join(chars))
+        else:
+            texts.append(" ".join(rng.choices(words, k=rng.randint(2, 9))))
+
+    engine = DeduplicationEngine()
+    known: list[str] = []
+    for text in texts:
+        threshold = engine.similarity_threshold
+        expected = all(similarity_ratio(text, other) < threshold for other in known)
+        assert engine.add_if_unique(text) is expected
+        if expected:
+            known.append(text)
+
+
+def test_deduplication_engine_matches_linear_scan_on_short_edits() -> None:
+    rng = random.Random(3)
+    texts: list[str] = []
+    for _ in range(200):
+        if texts and rng.random() < 0.5:
+            chars = list(rng.choice(texts))
+            position = rng.randrange(len(chars))
+            if rng.random() < 0.5:
+                chars.insert(position, rng.choice("abcdefgh"))
+            else:
+                chars[position] = rng.choice("abcdefgh ")
+            texts.append("".join(chars))
+        else:
+            texts.append("".join(rng.choices("abcdefgh ", k=rng.randint(3, 40))).strip() or "a")
+
+    engine = DeduplicationEngine()
+    known: list[str] = []
+    for text in texts:
+        threshold = engine.similarity_threshold
+        expected = all(similarity_ratio(text, other) < threshold for other in known)
+        assert engine.add_if_unique(text) is expected
+        if expected:
+            known.append(text)
+
+
+def test_windowed_deduplication_forgets_texts_outside_the_window() -> None:
+    engine = WindowedDeduplicationEngine(max_entries=2, max_age_seconds=60)
+    assert engine.add_if_unique("Risk: vendor may raise prices", now=0) is True
+    assert engine.add_if_unique("Action: send the deck", now=1) is True
+    assert engine.add_if_unique("Decision: launch on Monday", now=2) is True
+
+    # The oldest text fell out of the count window, the others out of the time window
+    assert engine.add_if_unique("risk: vendor may raise prices", now=3) is True
+    assert engine.add_if_unique("action: send the deck", now=100) is True
+    assert len(engine) == 1
+    assert engine.stats()["evicted"] == 4
+
+
+def test_windowed_deduplication_respects_memory_cap() -> None:
+    engine = WindowedDeduplicationEngine(1.0, max_entries=None, max_memory_bytes=2_000)
+    for index in range(50):
+        engine.add(f"Action item number {index} for the release checklist")
+
+    assert 0 < len(engine) < 50
+    assert engine.memory_bytes <= 2_000
+    assert engine.is_duplicate("action item number 49 for the release checklist") is True
+    assert engine.is_duplicate("Action item number 0 for the release checklist") is False
+
+
+def test_windowed_deduplication_counts_rejections_per_stage() -> None:
+    engine = WindowedDeduplicationEngine()
+    engine.add("risk: vendor delays delivery")
+    engine.add("ok")
+    engine.add("zzzz yyyy xxxx wwww vvvv zz")
+    engine.add("risk: vendor delivery delays")
+
+    assert engine.is_duplicate("Risk: vendor delays delivery!") is True
+    assert engine.is_duplicate("RISK: vendor delays delivery") is True
+    stats = engine.stats()
+    assert stats["exact_matches"] == 1
+    assert stats["near_matches"] == 1
+    assert stats["rejected_length"] == 1
+    assert stats["rejected_quick_ratio"] == 1
+    assert stats["rejected_ratio"] == 1
@@ -0,0 +1,33 @@
+from src.services.event_log import EventLog
+
+
+def test_since_returns_only_the_missed_events() -> None:
+    log = EventLog(max_events=3).log("m1")
+    for event in "abcde":
+        log.append(event)
+
+    assert log.seq == 5
+    assert log.since(log.stream, 5) == []
+    assert log.since(log.stream, 3) == ["d", "e"]
+    assert log.since(log.stream, 2) == ["c", "d", "e"]
+    assert log.since(log.stream, 1) is None
+    assert log.since(log.stream, 6) is None
+    assert log.since("another-stream", 4) is None
+
+
+def test_evicted_meetings_start_a_new_stream() -> None:
+    events = EventLog(max_events=8, max_meetings=2)
+    first = events.log("m1")
+    first.append("a")
+    events.log("m2")
+    events.log("m1")
+    events.log("m3")
+
+    assert events.get("m2") is None
+    assert events.log("m1") is first
+    events.log("m2")
+    events.log("m3")
+    recreated = events.log("m1")
+    assert recreated is not first
+    assert recreated.since(first.stream, 1) is None
+    assert len(events) == 2
@@ -0,0 +1,71 @@
+import base64
+import json
+
+import httpx
+import pytest
+
+from src.config.settings import Settings
+from src.integrations.telegram.bot import TelegramBotIntegration
+from src.integrations.telegram.commands import TelegramCommandHandler
+from src.services.ai.elevenlabs_provider import ElevenLabsRealtimeProvider
+from src.services.http_clients import HttpClientPool
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(_env_file=None, **overrides)  # type: ignore[call-arg]
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_one_client_per_upstream_until_closed() -> None:
+    pool = HttpClientPool(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+    first = pool.client("https://api.elevenlabs.io")
+    assert pool.client("https://api.elevenlabs.io") is first
+    assert pool.client("https://api.telegram.org") is not first
+
+    await pool.close()
+    assert first.is_closed
+    assert pool.client("https://api.elevenlabs.io") is not first
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_providers_and_telegram_share_the_pool() -> None:
+    requests: list[httpx.Request] = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "api.elevenlabs.io":
+            return httpx.Response(200, json={"text": " hello "})
+        return httpx.Response(200, json={"ok": True})
+
+    pool = HttpClientPool(
+        timeout_seconds=7,
+        connect_timeout_seconds=2,
+        transport=httpx.MockTransport(upstream),
+    )
+    settings = _settings(
+        elevenlabs_api_key="key",
+        telegram_bot_token="token",
+        telegram_whitelist="42",
+    )
+    provider = ElevenLabsRealtimeProvider(settings, pool)
+    bot = TelegramBotIntegration(settings, TelegramCommandHandler(), http_clients=pool)
+
+    audio = base64.b64encode(b"chunk").decode()
+    for _ in range(3):
+        result = await provider.transcribe_audio_chunk_base64(audio, "audio/webm")
+        assert result["text"] == "hello"
+    assert await bot.send_message("42", "hi")
+
+    assert [request.url.path for request in requests] == [
+        "/v1/speech-to-text",
+        "/v1/speech-to-text",
+        "/v1/speech-to-text",
+        "/bottoken/sendMessage",
+    ]
+    assert requests[0].headers["xi-api-key"] == "key"
+    assert json.loads(requests[-1].content)["chat_id"] == "42"
+    # No call overrides the pool's timeouts
+    for request in requests:
+        assert request.extensions["timeout"] == {"connect": 2, "read": 7, "write": 7, "pool": 7}
+    await pool.close()
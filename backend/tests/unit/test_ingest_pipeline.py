@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.models.meeting import MeetingStateRecord
+from src.services.ingest_pipeline import IngestPipeline
+from src.services.state_manager import StateManager
+from src.services.summary_scheduler import SummaryFlushScheduler
+
+
+class FakeWebSocketManager:
+    def __init__(self):
+        self.sent: list[tuple[str, dict]] = []
+
+    def connection_count(self, meeting_id: str) -> int:
+        return 0
+
+    async def broadcast(self, meeting_id: str, payload: dict) -> None:
+        self.sent.append((meeting_id, payload))
+
+
+class FakeStateRepository:
+    def __init__(self):
+        self.segments: list[tuple[str, str]] = []
+        self.insights: list[tuple[str, str]] = []
+
+    async def add_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> None:
+        self.segments.append((meeting_id, text))
+
+    async def add_insight(self, kind, item) -> None:
+        self.insights.append((kind, item.content))
+
+
+@pytest.mark.asyncio
+async def test_ingest_pipeline_keeps_per_meeting_order_across_worker_threads() -> None:
+    state_manager = StateManager(min_update_interval_seconds=0)
+    websocket_manager = FakeWebSocketManager()
+    repository = FakeStateRepository()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager)
+    executor = ThreadPoolExecutor(max_workers=4)
+    pipeline = IngestPipeline(
+        state_manager,
+        repository,
+        websocket_manager,
+        scheduler,
+        executor=executor,
+    )
+
+    submissions = [
+        pipeline.submit(meeting_id, f"{meeting_id} line {index}", "Alice")
+        for index in range(30)
+        for meeting_id in ("m1", "m2", "m3")
+    ]
+    submissions.append(pipeline.submit("m1", "Decision: ship it"))
+    deltas = await asyncio.gather(*submissions)
+
+    for meeting_id in ("m1", "m2", "m3"):
+        expected = [f"Alice: {meeting_id} line {index}" for index in range(30)]
+        assert list(state_manager.get_state(meeting_id).transcript_lines)[:30] == expected
+        persisted = [text for owner, text in repository.segments if owner == meeting_id]
+        assert persisted[:30] == [f"{meeting_id} line {index}" for index in range(30)]
+
+    assert deltas[-1]["insights"]["decisions"][0]["content"] == "ship it"
+    assert repository.insights == [("decision", "ship it")]
+    assert len(websocket_manager.sent) == len(submissions)
+    assert pipeline.queue_size("m1") == 0
+
+    await pipeline.close()
+    await scheduler.close()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ingest_pipeline_reports_failures_to_the_submitter() -> None:
+    state_manager = StateManager(min_update_interval_seconds=0)
+    websocket_manager = FakeWebSocketManager()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager)
+
+    class BrokenRepository(FakeStateRepository):
+        async def add_segment(self, meeting_id: str, text: str, speaker: str | None = None) -> None:
+            raise RuntimeError("disk full")
+
+    pipeline = IngestPipeline(state_manager, BrokenRepository(), websocket_manager, scheduler)
+    with pytest.raises(RuntimeError, match="disk full"):
+        await pipeline.submit("m1", "hello")
+
+    # The worker survives the failure and keeps serving the meeting
+    with pytest.raises(RuntimeError):
+        await pipeline.submit("m1", "again")
+    assert len(state_manager.get_state("m1").transcript_lines) == 2
+
+    await pipeline.close()
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_ingest_pipeline_applies_a_batch_as_one_delta() -> None:
+    state_manager = StateManager(min_update_interval_seconds=0)
+    websocket_manager = FakeWebSocketManager()
+    repository = FakeStateRepository()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager)
+    pipeline = IngestPipeline(state_manager, repository, websocket_manager, scheduler)
+
+    delta = await pipeline.submit_batch(
+        "m1",
+        [("Decision: ship it", "Alice"), ("Risk: QA is short staffed", "Bob"), ("ok", None)],
+    )
+
+    assert delta["base_version"] == 0
+    assert delta["transcript_lines"] == [
+        "Alice: Decision: ship it",
+        "Bob: Risk: QA is short staffed",
+        "ok",
+    ]
+    assert len(delta["insights"]["decisions"]) == 1
+    assert len(delta["insights"]["risks"]) == 1
+    assert len(websocket_manager.sent) == 1
+    assert [text for _, text in repository.segments] == [
+        "Decision: ship it",
+        "Risk: QA is short staffed",
+        "ok",
+    ]
+
+    await pipeline.close()
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_ingest_pipeline_keeps_the_meeting_loaded_while_analysis_runs() -> None:
+    async def loader(meeting_id: str) -> MeetingStateRecord | None:
+        if meeting_id != "busy":
+            return None
+        segments = [("Alice", f"line {index}") for index in range(50)]
+        return MeetingStateRecord(status="active", segments=segments, insights=[])
+
+    state_manager = StateManager(
+        min_update_interval_seconds=0, state_loader=loader, max_meetings=1
+    )
+    websocket_manager = FakeWebSocketManager()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager)
+    executor = ThreadPoolExecutor(max_workers=1)
+    pipeline = IngestPipeline(
+        state_manager,
+        FakeStateRepository(),
+        websocket_manager,
+        scheduler,
+        executor=executor,
+    )
+    started, release = threading.Event(), threading.Event()
+    analyze_segments = state_manager.analyze_segments
+
+    def slow_analyze(dedup, segments):
+        started.set()
+        release.wait(5)
+        return analyze_segments(dedup, segments)
+
+    state_manager.analyze_segments = slow_analyze
+    submitted = asyncio.create_task(pipeline.submit("busy", "one more line"))
+    await asyncio.to_thread(started.wait, 5)
+    # A second meeting goes over the count budget while the first is being analyzed
+    await state_manager.load_state("other", create=True)
+    release.set()
+    await submitted
+
+    assert len(state_manager.get_state("busy").transcript_lines) == 51
+
+    await pipeline.close()
+    await scheduler.close()
+    executor.shutdown()
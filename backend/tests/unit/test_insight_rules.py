@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services.insight_rules import InsightClassifier, InsightRule, load_insight_classifier
+
+
+def test_classifier_matches_prefix_rules_and_strips_prefix() -> None:
+    classifier = load_insight_classifier(["en"])
+
+    match = classifier.classify("  Action Item: send the deck to Legal ")
+    assert match is not None
+    assert match.collection == "actions"
+    assert match.content == "send the deck to Legal"
+
+    question = classifier.classify("Question: who owns billing?")
+    assert question is not None
+    assert question.collection == "open_questions"
+    assert question.content == "who owns billing?"
+
+
+def test_classifier_prefers_highest_priority_among_overlapping_keywords() -> None:
+    classifier = load_insight_classifier(["en"])
+
+    # "we will" (decision) overlaps "will do" (action); actions have higher priority
+    match = classifier.classify("We will do the migration on Sunday")
+    assert match is not None
+    assert match.collection == "actions"
+    assert match.content == "We will do the migration on Sunday"
+
+    assert classifier.classify("The blocker is the vendor contract").collection == "risks"
+    assert classifier.classify("Nice weather today") is None
+
+
+def test_classifier_supports_russian_pack() -> None:
+    classifier = load_insight_classifier(["en", "ru"])
+
+    decision = classifier.classify("Решение: запускаем релиз в понедельник")
+    assert decision is not None
+    assert decision.collection == "decisions"
+    assert decision.content == "запускаем релиз в понедельник"
+
+    assert classifier.classify("Мы договорились о сроках").collection == "decisions"
+    assert classifier.classify("Нужно подготовить отчёт").collection == "actions"
+
+
+def test_classifier_loads_custom_pack_with_priorities(tmp_path: Path) -> None:
+    (tmp_path / "custom.json").write_text(
+        json.dumps(
+            {
+                "rules": [
+                    {"collection": "risks", "priority": 5, "patterns": ["late"]},
+                    {"collection": "decisions", "priority": 50, "patterns": ["go live"]},
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+
+    classifier = load_insight_classifier(["custom"], rules_dir=tmp_path)
+    assert classifier.classify("we go live even if late").collection == "decisions"
+
+    with pytest.raises(FileNotFoundError):
+        load_insight_classifier(["missing"], rules_dir=tmp_path)
+
+    with pytest.raises(ValueError):
+        InsightClassifier([InsightRule(collection="notes", pattern="fyi")])
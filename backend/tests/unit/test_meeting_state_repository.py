@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import get_settings
+from src.db.database import Database
+from src.db.migrations import apply_migrations
+from src.db.repositories import MeetingRepository, MeetingStateRepository
+from src.services.state_manager import StateManager
+
+
+@pytest.mark.asyncio
+async def test_state_manager_restores_active_meetings_after_restart(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'recovery.db'}")
+    get_settings.cache_clear()
+    database = Database(get_settings())
+    await apply_migrations(database)
+
+    meetings = MeetingRepository(database)
+    active = await meetings.create("Active")
+    stopped = await meetings.create("Stopped")
+    await meetings.stop(stopped.id)
+
+    repository = MeetingStateRepository(database)
+    manager = StateManager(min_update_interval_seconds=0)
+    for text in ("Decision: ship on Monday", "Action: write release notes", "Small talk"):
+        base_version = manager.get_state(active.id).version
+        manager.process_transcript_segment(active.id, text, "Alice")
+        await repository.add_segment(active.id, text, "Alice")
+        for kind, item in manager.insights_since(active.id, base_version):
+            await repository.add_insight(kind, item)
+    original = manager.get_state(active.id)
+
+    restarted = StateManager(min_update_interval_seconds=0, state_loader=repository.load)
+    assert await restarted.restore(await repository.active_meeting_ids(limit=10)) == 1
+    assert restarted.meeting_count == 1
+
+    state = restarted.get_state(active.id)
+    assert list(state.transcript_lines) == list(original.transcript_lines)
+    assert [item.id for item in state.decisions] == [item.id for item in original.decisions]
+    assert [item.content for item in state.actions] == ["write release notes"]
+
+    delta = restarted.process_transcript_segment(active.id, "decision: ship on monday")
+    assert delta is not None
+    assert delta["insights"]["decisions"] == []
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_meeting_removes_its_rows_and_drops_late_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'delete.db'}")
+    get_settings.cache_clear()
+    database = Database(get_settings())
+    await apply_migrations(database)
+
+    meetings = MeetingRepository(database)
+    meeting = await meetings.create("Deleted")
+    repository = MeetingStateRepository(database)
+    manager = StateManager(min_update_interval_seconds=0)
+    manager.process_transcript_segment(meeting.id, "Decision: ship it")
+    await repository.add_segment(meeting.id, "Decision: ship it")
+    for kind, item in manager.insights_since(meeting.id, 0):
+        await repository.add_insight(kind, item)
+    await repository.flush()
+
+    await meetings.delete(meeting.id)
+    await repository.add_segment(meeting.id, "written after the delete")
+    await repository.flush()
+
+    async with database.connection() as conn:
+        for table in ("transcript_segments", "insights"):
+            cursor = await conn.execute(f"SELECT COUNT(*) FROM {table}")
+            assert (await cursor.fetchone())[0] == 0
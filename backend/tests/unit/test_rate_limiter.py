@@ -0,0 +1,68 @@
+from time import monotonic
+
+import pytest
+
+from src.services.rate_limiter import IngestRateLimiter, TokenBucket
+
+
+def test_token_bucket_refills_at_its_rate_up_to_the_burst() -> None:
+    bucket = TokenBucket(rate=2, burst=4, updated=0.0)
+    assert bucket.available(now=0.0) == 4
+    bucket.take(4)
+    assert bucket.available(now=0.5) == 1
+    assert bucket.retry_after() == 0
+    bucket.take(1)
+    assert bucket.retry_after() == pytest.approx(0.5)
+    assert bucket.available(now=100.0) == 4
+    assert TokenBucket(rate=0, burst=0).available() > 1_000_000
+
+
+def test_drop_policy_sheds_segments_over_the_connection_budget() -> None:
+    limiter = IngestRateLimiter(connection_rate=1, connection_burst=2, policy="drop")
+    throttle = limiter.connection("m1")
+    start = monotonic()
+
+    admitted = throttle.admit([("a", "PM"), ("b", "PM"), ("c", "PM")], now=start)
+    assert admitted == [("a", "PM"), ("b", "PM")]
+    assert throttle.status_change() == {
+        "status": "throttled",
+        "policy": "drop",
+        "retry_after_ms": 1000,
+    }
+    assert throttle.admit([("d", "PM")], now=start + 0.1) == []
+    assert throttle.status_change() is None
+
+    assert throttle.admit([("e", "PM")], now=start + 1.1) == [("e", "PM")]
+    assert throttle.status_change() == {"status": "ok"}
+    assert limiter.stats("m1") == {"admitted": 3, "coalesced": 0, "dropped": 2, "throttled": 1}
+
+
+def test_coalesce_policy_holds_excess_back_as_one_line_per_speaker() -> None:
+    limiter = IngestRateLimiter(connection_rate=1, connection_burst=1, max_coalesced_chars=12)
+    throttle = limiter.connection("m1")
+    start = monotonic()
+
+    assert throttle.admit([("one", "A"), ("two", "A"), ("three", "B")], now=start) == [("one", "A")]
+    assert throttle.admit([("four", "A"), ("overflowing", "A")], now=start) == []
+    assert throttle.drain() == [("two four", "A"), ("three", "B")]
+
+    throttle.admit([("five", "A"), ("six", "B")], now=start)
+    assert throttle.admit([], now=start + 1) == [("five", "A")]
+    assert throttle.admit([], now=start + 2) == [("six", "B")]
+    assert limiter.stats("m1") == {"admitted": 3, "coalesced": 5, "dropped": 1, "throttled": 1}
+
+
+def test_meeting_budget_is_shared_by_its_connections() -> None:
+    limiter = IngestRateLimiter(meeting_rate=1, meeting_burst=3, policy="drop")
+    first, second = limiter.connection("m1"), limiter.connection("m1")
+    other = limiter.connection("m2")
+    now = monotonic()
+
+    assert len(first.admit([("a", None), ("b", None)], now=now)) == 2
+    assert len(second.admit([("c", None), ("d", None)], now=now)) == 1
+    assert len(other.admit([("e", None), ("f", None)], now=now)) == 2
+
+
+def test_unknown_overflow_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        IngestRateLimiter(policy="queue")
@@ -0,0 +1,31 @@
+from src.services.search_index import SearchIndex, tokenize
+
+
+def test_tokenize_drops_stop_words_and_single_characters() -> None:
+    assert tokenize("What did we say about the Vendor contract, a?") == ["vendor", "contract"]
+    assert tokenize("Что по бюджету на Q3?") == ["бюджету", "q3"]
+
+
+def test_search_index_ranks_rare_terms_higher() -> None:
+    index = SearchIndex()
+    index.add("the budget review is on Friday", 0)
+    index.add("budget budget everywhere", 1)
+    index.add("vendor contract renewal needs a budget", 2)
+    for position in range(3, 50):
+        index.add(f"status update number {position}", position)
+
+    hits = index.search("vendor budget")
+    assert hits[0].ref == 2
+    assert {hit.ref for hit in hits} == {0, 1, 2}
+    assert index.search("nothing matches here") == []
+
+
+def test_search_index_prunes_oldest_documents_within_budget() -> None:
+    index = SearchIndex(max_documents=100)
+    for position in range(250):
+        index.add(f"topic{position} shared", position)
+
+    assert len(index) <= 100
+    assert index.search("topic0") == []
+    assert index.search("topic249")[0].ref == 249
+    assert index.term_count <= 101
@@ -0,0 +1,76 @@
+import json
+
+from src.services.snapshot_cache import SnapshotCache
+from src.services.state_manager import StateManager
+from src.services.websocket_manager import WireFormat
+
+
+def test_snapshot_frames_are_reused_until_the_state_changes() -> None:
+    manager = StateManager(min_update_interval_seconds=3600)
+    cache = SnapshotCache()
+    manager.process_transcript_segment("m1", "Decision: ship on Friday", "PM")
+    state = manager.get_state("m1")
+
+    first = cache.frame("m1", state)
+    assert cache.frame("m1", state) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    payload = json.loads(first.text)["payload"]
+    assert payload["version"] == state.version
+    assert payload["insights"]["decisions"][0]["content"] == "ship on Friday"
+
+    # Within the update interval: a new version, but no publish yet
+    manager.process_transcript_segment("m1", "Sounds good", "QA")
+    second = cache.frame("m1", state)
+    assert second is not first
+    assert json.loads(second.text)["payload"]["transcript_lines"][-1] == "QA: Sounds good"
+
+    manager.flush("m1")
+    third = cache.frame("m1", state)
+    assert third is not second
+    assert "QA: Sounds good" in json.loads(third.text)["payload"]["summary"]
+
+    # A rehydrated state starts at the same version but is a different object
+    manager.discard("m1")
+    assert cache.frame("m1", manager.get_state("m1")) is not third
+
+
+def test_snapshot_cache_stays_within_its_byte_budget() -> None:
+    manager = StateManager(min_update_interval_seconds=0)
+    for meeting_id in ("m1", "m2", "m3"):
+        manager.process_transcript_segment(meeting_id, "x" * 400, "PM")
+
+    probe = SnapshotCache()
+    size = len(probe.frame("m1", manager.get_state("m1")).text)
+    cache = SnapshotCache(max_bytes=2 * size + size // 2)
+    for meeting_id in ("m1", "m2", "m3"):
+        cache.frame(meeting_id, manager.get_state(meeting_id))
+
+    assert len(cache) == 2
+    assert cache.memory_bytes <= 2 * size + size // 2
+    cache.frame("m1", manager.get_state("m1"))
+    assert cache.misses == 4
+
+    tiny = SnapshotCache(max_bytes=10)
+    tiny.frame("m1", manager.get_state("m1"))
+    assert len(tiny) == 0 and tiny.memory_bytes == 0
+
+
+def test_snapshot_cache_counts_wire_encodings_toward_its_budget() -> None:
+    manager = StateManager(min_update_interval_seconds=0)
+    manager.process_transcript_segment("m1", "Decision: ship on Friday", "PM")
+    state = manager.get_state("m1")
+    deflated = WireFormat("json", "deflate")
+    cache = SnapshotCache()
+
+    frame = cache.frame("m1", state)
+    assert cache.memory_bytes == len(frame.text)
+    assert cache.frame("m1", state, deflated) is frame
+    assert deflated in frame.encoded
+    assert cache.memory_bytes == len(frame.text) + len(frame.encoded[deflated])
+
+    # Room for the text alone, not for the text and its deflated copy
+    tight = SnapshotCache(max_bytes=len(frame.text))
+    tight.frame("m1", state)
+    assert len(tight) == 1
+    tight.frame("m1", state, deflated)
+    assert len(tight) == 0 and tight.memory_bytes == 0
@@ -1,4 +1,10 @@
-from src.services.state_manager import StateManager
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.insights import Decision
+from src.models.meeting import MeetingStateRecord
+from src.services.state_manager import MeetingNotLoaded, StateManager
 
 
 def test_state_manager_builds_summary_and_insights() -> None:
@@ -21,4 +27,173 @@ def test_state_manager_deduplicates_repeated_insights() -> None:
     delta = manager.process_transcript_segment("m2", "risk: api timeout spike")
 
     assert delta is not None
-    assert len(delta["insights"]["risks"]) == 1
+    assert delta["insights"]["risks"] == []
+    assert len(manager.get_state("m2").risks) == 1
+
+
+def test_state_manager_deltas_are_incremental_and_versioned() -> None:
+    manager = StateManager(min_update_interval_seconds=0)
+
+    delta_1 = manager.process_transcript_segment("m3", "Decision: adopt the new vendor", "Alice")
+    delta_2 = manager.process_transcript_segment("m3", "Risk: contract renewal slips", "Bob")
+
+    assert delta_1 is not None and delta_2 is not None
+    assert delta_2["base_version"] == delta_1["version"]
+    assert delta_2["version"] > delta_1["version"]
+    assert delta_2["full"] is False
+    assert delta_2["transcript_lines"] == ["Bob: Risk: contract renewal slips"]
+    assert delta_2["insights"]["decisions"] == []
+    assert len(delta_2["insights"]["risks"]) == 1
+
+
+def test_state_manager_build_delta_requires_resync_when_history_is_gone() -> None:
+    manager = StateManager(min_update_interval_seconds=0, delta_history_size=2)
+
+    for index in range(5):
+        manager.process_transcript_segment("m4", f"Line {index}")
+
+    catch_up = manager.build_delta("m4", manager.get_state("m4").version - 1)
+    assert catch_up is not None
+    assert catch_up["transcript_lines"] == ["Line 4"]
+
+    assert manager.build_delta("m4", 0) is None
+
+
+def test_state_manager_get_state_does_not_register_unknown_meetings() -> None:
+    manager = StateManager()
+
+    assert manager.get_state("unknown").summary == ""
+    assert manager.meeting_count == 0
+
+
+def test_state_manager_evicts_idle_and_over_capacity_meetings() -> None:
+    manager = StateManager(max_meetings=2, idle_ttl_seconds=100, stopped_ttl_seconds=10)
+
+    manager.process_transcript_segment("old", "hello")
+    manager.process_transcript_segment("stopped", "bye")
+    manager.mark_stopped("stopped")
+    manager.process_transcript_segment("new", "hi")
+
+    # Registering the third meeting went over capacity; the stopped one goes first
+    assert manager.meeting_count == 2
+    assert not manager.get_state("stopped").transcript_lines
+
+    now = manager.get_state("new").last_accessed
+    assert manager.evict(now=now + 150) == ["old", "new"]
+    assert manager.meeting_count == 0
+
+
+@pytest.mark.asyncio
+async def test_state_manager_rehydrates_evicted_meeting_from_loader() -> None:
+    now = datetime.now(timezone.utc)
+    decision = Decision(id="d1", meeting_id="m5", content="ship it", created_at=now)
+    loads: list[str] = []
+
+    async def loader(meeting_id: str) -> MeetingStateRecord | None:
+        loads.append(meeting_id)
+        if meeting_id != "m5":
+            return None
+        return MeetingStateRecord(
+            status="active",
+            segments=[("Alice", "Decision: ship it"), (None, "Next topic")],
+            insights=[("decision", decision)],
+        )
+
+    manager = StateManager(min_update_interval_seconds=0, state_loader=loader)
+
+    state = await manager.load_state("m5")
+    assert list(state.transcript_lines) == ["Alice: Decision: ship it", "Next topic"]
+    assert [item.content for item in state.decisions] == ["ship it"]
+    assert "2 segments" in state.summary
+
+    # Rehydrated dedup state rejects the same decision again
+    delta = manager.process_transcript_segment("m5", "Decision: ship it", "Bob")
+    assert delta is not None
+    assert delta["insights"]["decisions"] == []
+
+    await manager.load_state("m5")
+    assert loads == ["m5"]
+
+    missing = await manager.load_state("ghost")
+    assert missing.version >= 0
+    assert manager.meeting_count == 1
+
+
+@pytest.mark.asyncio
+async def test_state_manager_keeps_pinned_meetings_and_refuses_unloaded_writes() -> None:
+    async def loader(meeting_id: str) -> MeetingStateRecord | None:
+        if meeting_id != "busy":
+            return None
+        segments = [("Alice", f"line {index}") for index in range(50)]
+        return MeetingStateRecord(status="active", segments=segments, insights=[])
+
+    manager = StateManager(min_update_interval_seconds=0, state_loader=loader, max_meetings=1)
+    manager.pin("busy")
+    await manager.load_state("busy")
+    await manager.load_state("other", create=True)
+
+    # Over the count budget, but the pinned meeting is the one in use
+    assert manager.is_loaded("busy")
+    assert manager.evict(now=manager.get_state("busy").last_accessed + 10_000) == ["other"]
+    manager.process_transcript_segment("busy", "still here")
+    assert len(manager.get_state("busy").transcript_lines) == 51
+
+    manager.unpin("busy")
+    await manager.load_state("other", create=True)
+    assert not manager.is_loaded("busy")
+    with pytest.raises(MeetingNotLoaded):
+        manager.process_transcript_segment("busy", "lost line")
+
+
+def test_state_manager_answers_general_questions_from_search_index() -> None:
+    manager = StateManager(min_update_interval_seconds=0)
+    manager.process_transcript_segment("m6", "The vendor contract expires in March", "Carol")
+    manager.process_transcript_segment("m6", "Risk: vendor may raise prices")
+    for index in range(40):
+        manager.process_transcript_segment("m6", f"Sprint item {index} is on track", "Dan")
+
+    answer = manager.answer_question("m6", "What about the vendor contract?")
+    assert "Carol: The vendor contract expires in March" in answer
+    assert "Related insights:\n• vendor may raise prices" in answer
+    assert "Sprint item 39" not in answer
+
+    fallback = manager.answer_question("m6", "Anything else?")
+    assert "Here's the recent meeting context" in fallback
+
+
+def test_state_manager_answer_cache_only_invalidates_affected_answers() -> None:
+    manager = StateManager(min_update_interval_seconds=0)
+    manager.process_transcript_segment("m7", "Action: send the deck", "Alice")
+
+    first = manager.answer_question("m7", "What are the action items?")
+    assert manager.answer_question("m7", "what are the action items") == first
+    manager.answer_question("m7", "Any risks?")
+
+    # A plain segment does not touch actions or risks
+    manager.process_transcript_segment("m7", "Thanks everyone", "Bob")
+    assert manager.answer_question("m7", "What are the action items?") == first
+    assert manager.answer_question("m7", "Any risks?") == "No risks identified yet."
+    assert manager.answer_cache_stats("m7")["hits"] == 3
+
+    manager.process_transcript_segment("m7", "Action: book the venue", "Bob")
+    updated = manager.answer_question("m7", "What are the action items?")
+    assert "book the venue" in updated
+    assert manager.answer_cache_stats("m7") == {
+        "entries": 2,
+        "hits": 3,
+        "misses": 3,
+        "invalidations": 1,
+    }
+
+
+def test_state_manager_windowed_dedup_mode() -> None:
+    manager = StateManager(min_update_interval_seconds=0, dedup_window_size=1)
+    manager.process_transcript_segment("m8", "Risk: API timeout spike")
+    manager.process_transcript_segment("m8", "Risk: vendor may raise prices")
+    delta = manager.process_transcript_segment("m8", "risk: api timeout spike")
+
+    assert delta is not None
+    assert [item["content"] for item in delta["insights"]["risks"]] == ["api timeout spike"]
+    stats = manager.dedup_stats("m8")
+    assert stats["entries"] == 1
+    assert stats["evicted"] == 2
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from src.services.state_manager import StateManager
+from src.services.summary_scheduler import SummaryFlushScheduler
+
+
+class FakeWebSocketManager:
+    def __init__(self, subscribers: int = 0):
+        self.subscribers = subscribers
+        self.sent: list[dict] = []
+
+    def connection_count(self, meeting_id: str) -> int:
+        return self.subscribers
+
+    async def broadcast(self, meeting_id: str, payload: dict) -> None:
+        self.sent.append(payload)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_flushes_pending_changes_on_trailing_edge() -> None:
+    state_manager = StateManager(min_update_interval_seconds=3600)
+    websocket_manager = FakeWebSocketManager()
+    scheduler = SummaryFlushScheduler(
+        state_manager,
+        websocket_manager,
+        min_delay_seconds=0.01,
+        max_delay_seconds=0.02,
+    )
+
+    assert state_manager.process_transcript_segment("m1", "Kick-off") is not None
+    assert state_manager.process_transcript_segment("m1", "Decision: ship on Friday") is None
+    scheduler.notify("m1")
+    assert state_manager.process_transcript_segment("m1", "Risk: QA is understaffed") is None
+    scheduler.notify("m1")
+
+    await asyncio.sleep(0.05)
+
+    assert len(websocket_manager.sent) == 1
+    delta = websocket_manager.sent[0]
+    assert delta["type"] == "meeting.delta"
+    assert len(delta["payload"]["transcript_lines"]) == 2
+    assert len(delta["payload"]["insights"]["decisions"]) == 1
+    assert len(delta["payload"]["insights"]["risks"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stop_cancels_timer_and_flushes() -> None:
+    state_manager = StateManager(min_update_interval_seconds=3600)
+    websocket_manager = FakeWebSocketManager()
+    scheduler = SummaryFlushScheduler(state_manager, websocket_manager, min_delay_seconds=60)
+
+    state_manager.process_transcript_segment("m2", "Kick-off")
+    state_manager.process_transcript_segment("m2", "Action: send the notes")
+    scheduler.notify("m2")
+
+    await scheduler.stop("m2")
+
+    assert len(websocket_manager.sent) == 1
+    assert websocket_manager.sent[0]["payload"]["transcript_lines"] == ["Action: send the notes"]
+    await scheduler.close()
+
+
+def test_scheduler_delay_grows_with_load() -> None:
+    quiet = SummaryFlushScheduler(StateManager(), FakeWebSocketManager(subscribers=1))
+    crowded = SummaryFlushScheduler(StateManager(), FakeWebSocketManager(subscribers=500))
+
+    assert quiet.next_delay("m3") < crowded.next_delay("m3")
+    assert crowded.next_delay("m3") == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_prunes_arrivals_after_flush_and_bounds_meetings() -> None:
+    scheduler = SummaryFlushScheduler(
+        StateManager(),
+        FakeWebSocketManager(),
+        min_delay_seconds=0.02,
+        max_delay_seconds=0.02,
+        rate_window_seconds=0.01,
+        max_meetings=2,
+    )
+
+    scheduler.notify("m1")
+    await asyncio.sleep(0.05)
+    assert scheduler.tracked_meetings() == 0
+
+    for meeting_id in ("m2", "m3", "m4"):
+        scheduler.notify(meeting_id)
+    assert scheduler.tracked_meetings() == 2
+    await scheduler.close()
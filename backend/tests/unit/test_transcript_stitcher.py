@@ -0,0 +1,50 @@
+from src.services.transcript_stitcher import TranscriptStitcher
+
+
+def test_stitcher_drops_repeated_tail_of_previous_segment() -> None:
+    stitcher = TranscriptStitcher()
+
+    assert stitcher.stitch("m1", "We should move the launch to next Monday", "Alice") == (
+        "We should move the launch to next Monday"
+    )
+    assert stitcher.stitch("m1", "to next monday, and tell the customer.", "Alice") == (
+        "and tell the customer."
+    )
+    assert stitcher.trimmed_tokens == 3
+
+
+def test_stitcher_never_trims_a_repeated_phrase_to_nothing() -> None:
+    stitcher = TranscriptStitcher()
+    stitcher.stitch("m1", "Thank you", "Alice")
+
+    assert stitcher.stitch("m1", "Thank you", "Alice") == "Thank you"
+    stitcher.stitch("m1", "and tell the customer", "Alice")
+    assert stitcher.stitch("m1", "tell the customer!", "Alice") == "tell the customer!"
+    assert stitcher.trimmed_tokens == 0
+
+
+def test_stitcher_keeps_speakers_and_meetings_apart() -> None:
+    stitcher = TranscriptStitcher()
+    stitcher.stitch("m1", "so the budget is approved", "Alice")
+    text = "budget is approved for Q3"
+
+    assert stitcher.stitch("m1", text, "Bob") == text
+    assert stitcher.stitch("m2", text, "Alice") == text
+    assert stitcher.stitch("m1", "budget is approved for Q3", "Alice") == "for Q3"
+
+
+def test_stitcher_ignores_overlaps_below_minimum_and_beyond_window() -> None:
+    stitcher = TranscriptStitcher(min_overlap_tokens=2, max_overlap_tokens=4)
+    stitcher.stitch("m1", "thanks everyone")
+
+    # A single shared word is too weak to count as chunk overlap
+    assert stitcher.stitch("m1", "everyone is here") == "everyone is here"
+    stitcher.stitch("m1", "one two three four five six")
+    assert stitcher.stitch("m1", "two three four five six seven") == "two three four five six seven"
+    assert stitcher.stitch("m1", "six seven eight") == "eight"
+
+
+def test_stitcher_can_be_disabled() -> None:
+    stitcher = TranscriptStitcher(max_overlap_tokens=0)
+    stitcher.stitch("m1", "one two three")
+    assert stitcher.stitch("m1", "two three four") == "two three four"
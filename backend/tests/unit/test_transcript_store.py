@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from src.services.transcript_store import TranscriptStore
+
+
+def test_transcript_store_spills_old_lines_and_keeps_full_view(tmp_path: Path) -> None:
+    store = TranscriptStore(tail_size=4, spill_dir=str(tmp_path), spill_batch_size=2)
+    lines = [f"Speaker {index}: line {index} — ünïcode" for index in range(25)]
+    for line in lines:
+        store.append(line)
+
+    assert len(store) == 25
+    assert store.spilled_count > 0
+    assert store.in_memory_count < 4 + 2
+    assert list(store) == lines
+    assert store[0] == lines[0]
+    assert store[-1] == lines[-1]
+    assert store[-8:] == lines[-8:]
+    assert store[3:7] == lines[3:7]
+
+    store.close()
+
+
+def test_transcript_store_is_falsy_when_empty() -> None:
+    store = TranscriptStore()
+    assert not store
+    store.append("hello")
+    assert store
+    assert store[-5:] == ["hello"]
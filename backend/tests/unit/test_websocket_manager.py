@@ -0,0 +1,354 @@
+import asyncio
+import json
+import zlib
+
+import pytest
+
+from src.services import websocket_manager
+from src.services.websocket_manager import (
+    JSON_WIRE,
+    WebSocketConnectionManager,
+    WireFormat,
+    negotiate_wire_format,
+)
+
+
+class FakeWebSocket:
+    def __init__(self, stalled: bool = False, broken: bool = False):
+        self.sent: list[dict] = []
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+        self.broken = broken
+        self.gate = asyncio.Event()
+        if not stalled:
+            self.gate.set()
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, text: str) -> None:
+        await self.gate.wait()
+        if self.broken:
+            raise RuntimeError("socket is gone")
+        self.frames.append(text)
+        self.sent.append(json.loads(text))
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self.gate.wait()
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+def _delta(version: int, line: str, insight_id: str | None = None) -> dict:
+    risks = [{"id": insight_id, "content": line}] if insight_id else []
+    return {
+        "type": "meeting.delta",
+        "meeting_id": "m1",
+        "payload": {
+            "version": version,
+            "base_version": version - 1,
+            "full": False,
+            "summary": f"summary {version}",
+            "transcript_lines": [line],
+            "insights": {"decisions": [], "actions": [], "risks": risks, "open_questions": []},
+            "updated_at": None,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_a_stalled_socket() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=100)
+    fast, stalled = FakeWebSocket(), FakeWebSocket(stalled=True)
+    await manager.connect("m1", fast)
+    await manager.connect("m1", stalled)
+
+    for version in range(1, 21):
+        await asyncio.wait_for(manager.broadcast("m1", _delta(version, f"line {version}")), 0.1)
+    await asyncio.sleep(0.01)
+
+    assert len(fast.sent) == 20
+    assert stalled.sent == []
+    assert manager.writer("m1", stalled).pending == 19
+
+    stalled.gate.set()
+    await asyncio.sleep(0.01)
+    assert [message["payload"]["version"] for message in stalled.sent] == list(range(1, 21))
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_folds_deltas_for_slow_consumers() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=2, slow_consumer_policy="coalesce")
+    socket = FakeWebSocket(stalled=True)
+    await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", _delta(1, "line 1"))
+    await asyncio.sleep(0)  # the writer takes delta 1 and blocks on it
+    for version in range(2, 7):
+        await manager.broadcast("m1", _delta(version, f"line {version}", insight_id="r1"))
+
+    socket.gate.set()
+    await asyncio.sleep(0.01)
+    payloads = [message["payload"] for message in socket.sent]
+    assert [(p["base_version"], p["version"]) for p in payloads] == [(0, 1), (1, 2), (2, 6)]
+    assert payloads[-1]["transcript_lines"] == ["line 3", "line 4", "line 5", "line 6"]
+    assert payloads[-1]["insights"]["risks"] == [{"id": "r1", "content": "line 6"}]
+    assert payloads[-1]["summary"] == "summary 6"
+    assert manager.writer("m1", socket).coalesced == 3
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_deltas_keep_seq_rising_in_send_order() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=2, slow_consumer_policy="coalesce")
+    socket = FakeWebSocket(stalled=True)
+    await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", _delta(1, "line 1"))
+    await asyncio.sleep(0)
+    await manager.broadcast("m1", _delta(2, "line 2"))
+    await manager.broadcast("m1", {"type": "transcript.segment", "payload": {"text": "hi"}})
+    await manager.broadcast("m1", _delta(3, "line 3"))
+
+    socket.gate.set()
+    await asyncio.sleep(0.01)
+    assert [message["seq"] for message in socket.sent] == [1, 3, 4]
+    assert [message["type"] for message in socket.sent] == [
+        "meeting.delta",
+        "transcript.segment",
+        "meeting.delta",
+    ]
+    assert socket.sent[-1]["payload"]["transcript_lines"] == ["line 2", "line 3"]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_discards_oldest_queued_deltas() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=2, slow_consumer_policy="drop")
+    socket = FakeWebSocket(stalled=True)
+    await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", {"type": "transcript.segment", "payload": {"text": "hi"}})
+    await asyncio.sleep(0)
+    for version in range(1, 5):
+        await manager.broadcast("m1", _delta(version, f"line {version}"))
+
+    socket.gate.set()
+    await asyncio.sleep(0.01)
+    assert [message["type"] for message in socket.sent] == [
+        "transcript.segment",
+        "meeting.delta",
+        "meeting.delta",
+    ]
+    assert [message["payload"]["version"] for message in socket.sent[1:]] == [3, 4]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_consumers_only() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=1, slow_consumer_policy="disconnect")
+    fast, stalled = FakeWebSocket(), FakeWebSocket(stalled=True)
+    await manager.connect("m1", fast)
+    await manager.connect("m1", stalled)
+
+    for version in range(1, 4):
+        await manager.broadcast("m1", _delta(version, f"line {version}"))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+    assert stalled.closed_with == 1013
+    assert manager.connection_count("m1") == 1
+    assert manager.slow_disconnects == 1
+    assert len(fast.sent) == 3
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_send_removes_the_connection() -> None:
+    manager = WebSocketConnectionManager()
+    await manager.connect("m1", FakeWebSocket(broken=True))
+
+    await manager.broadcast("m1", _delta(1, "line 1"))
+    await asyncio.sleep(0.01)
+    assert manager.connection_count("m1") == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_each_message_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    encoded: list[dict] = []
+    encode = websocket_manager.encode_message
+    monkeypatch.setattr(
+        websocket_manager,
+        "encode_message",
+        lambda message: encoded.append(message) or encode(message),
+    )
+    manager = WebSocketConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(5)]
+    for socket in sockets:
+        await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", _delta(1, "Grüße from the all-hands"))
+    await asyncio.sleep(0.01)
+
+    assert len(encoded) == 1
+    assert all(socket.frames[0] is sockets[0].frames[0] for socket in sockets)
+    assert sockets[0].sent[0]["payload"]["transcript_lines"] == ["Grüße from the all-hands"]
+    await manager.close()
+
+
+def test_encoded_frames_do_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    message = _delta(3, "Grüße, \"quoted\" line")
+    fast = websocket_manager.encode_message(message)
+    monkeypatch.setattr(websocket_manager, "orjson", None)
+    assert websocket_manager.encode_message(message) == fast
+    assert json.loads(fast) == message
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_per_negotiated_format() -> None:
+    deflated = WireFormat("json", "deflate")
+    manager = WebSocketConnectionManager()
+    plain = [FakeWebSocket() for _ in range(2)]
+    compressed = [FakeWebSocket() for _ in range(2)]
+    for socket in plain:
+        await manager.connect("m1", socket)
+    for socket in compressed:
+        await manager.connect("m1", socket, deflated)
+
+    message = _delta(1, "line 1")
+    await manager.broadcast("m1", message)
+    await asyncio.sleep(0.01)
+
+    assert isinstance(plain[0].frames[0], str)
+    assert compressed[0].frames[0] is compressed[1].frames[0]
+    assert deflated.decode(compressed[0].frames[0]) == {**message, "seq": 1}
+    assert zlib.decompress(compressed[0].frames[0], -zlib.MAX_WBITS) == plain[0].frames[0].encode()
+    await manager.close()
+
+
+def test_msgpack_round_trips_through_the_wire_format() -> None:
+    wire_format = WireFormat("msgpack", "deflate")
+    message = _delta(2, "Grüße")
+    encoded = wire_format.encode(message)
+    assert isinstance(encoded, bytes)
+    assert len(encoded) < len(websocket_manager.encode_message(message))
+    assert wire_format.decode(encoded) == message
+
+
+def test_deflated_frames_that_inflate_past_the_cap_are_rejected() -> None:
+    wire_format = WireFormat("json", "deflate")
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    bomb = compressor.compress(b'{"type": "' + b" " * 4_000_000 + b'"}') + compressor.flush()
+    assert len(bomb) < 10_000
+
+    with pytest.raises(ValueError, match="inflates past"):
+        wire_format.decode(bomb)
+    with pytest.raises(ValueError):
+        wire_format.decode(b"not deflate at all")
+
+
+def test_wire_format_negotiation(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert negotiate_wire_format({}) == (JSON_WIRE, None)
+    assert negotiate_wire_format({}, ["chat", "meeting-copilot.json+deflate"]) == (
+        WireFormat("json", "deflate"),
+        "meeting-copilot.json+deflate",
+    )
+    assert negotiate_wire_format({"encoding": "xml"}) == (JSON_WIRE, None)
+
+    monkeypatch.setattr(websocket_manager, "msgpack", None)
+    assert negotiate_wire_format({}, ["meeting-copilot.msgpack"]) == (JSON_WIRE, None)
+    assert negotiate_wire_format({"encoding": "msgpack", "compression": "deflate"}) == (
+        WireFormat("json", "deflate"),
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_only_the_missed_broadcasts() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=10, event_log_size=5)
+    watcher = FakeWebSocket()
+    await manager.connect("m1", watcher)
+    for version in range(1, 4):
+        await manager.broadcast("m1", _delta(version, f"line {version}"))
+    stream, seq = manager.position("m1")
+    assert seq == 3
+
+    for version in range(4, 7):
+        await manager.broadcast("m1", _delta(version, f"line {version}"))
+
+    returning, stale, foreign = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    for socket in (returning, stale, foreign):
+        await manager.connect("m1", socket)
+    assert manager.resume("m1", returning, stream, seq)
+    assert not manager.resume("m1", stale, stream, 0)
+    assert not manager.resume("m1", foreign, "other-worker", seq)
+    await asyncio.sleep(0.01)
+
+    assert [message["seq"] for message in returning.sent] == [4, 5, 6]
+    assert returning.frames[0] is watcher.frames[3]
+    assert stale.sent == foreign.sent == []
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_resume_falls_back_when_the_replay_would_overflow_the_queue() -> None:
+    manager = WebSocketConnectionManager(max_queue_size=2, event_log_size=10)
+    stream, seq = manager.position("m1")
+    for version in range(1, 4):
+        await manager.broadcast("m1", _delta(version, f"line {version}"))
+
+    socket = FakeWebSocket()
+    await manager.connect("m1", socket)
+    assert not manager.resume("m1", socket, stream, seq)
+    assert manager.resume("m1", socket, stream, seq + 1)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_pings_quiet_sockets_and_reaps_silent_ones() -> None:
+    manager = WebSocketConnectionManager()
+    chatty, quiet, hung = FakeWebSocket(), FakeWebSocket(), FakeWebSocket(stalled=True)
+    for socket in (chatty, quiet, hung):
+        await manager.connect("m1", socket)
+    start = manager.writer("m1", chatty).last_seen
+
+    manager.touch("m1", chatty, now=start + 25)
+    manager.touch("m1", quiet, now=start + 5)
+    assert manager.heartbeat(20, 60, now=start + 30) == 0
+    await asyncio.sleep(0.01)
+    assert chatty.sent == []
+    assert [message["type"] for message in quiet.sent] == ["meeting.ping"]
+    assert "seq" not in quiet.sent[0]
+
+    manager.touch("m1", quiet, now=start + 31)
+    assert manager.heartbeat(20, 60, now=start + 61) == 1
+    await asyncio.sleep(0.01)
+    assert hung.closed_with == 1001
+    assert manager.connection_count("m1") == 2
+    assert manager.reaped == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_a_dead_socket_neither_blocks_nor_breaks_a_broadcast() -> None:
+    manager = WebSocketConnectionManager()
+    healthy = [FakeWebSocket() for _ in range(3)]
+    await manager.connect("m1", FakeWebSocket(broken=True))
+    for socket in healthy:
+        await manager.connect("m1", socket)
+
+    await manager.broadcast("m1", _delta(1, "line 1"))
+    await manager.broadcast("m1", _delta(2, "line 2"))
+    await asyncio.sleep(0.01)
+
+    assert manager.connection_count("m1") == 3
+    assert all(len(socket.sent) == 2 for socket in healthy)
+    await manager.close()
+
+
+def test_unknown_slow_consumer_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        WebSocketConnectionManager(slow_consumer_policy="buffer")
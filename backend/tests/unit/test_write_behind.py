@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import get_settings
+from src.db.database import Database
+from src.db.migrations import apply_migrations
+from src.db.repositories import MeetingRepository, MeetingStateRepository
+from src.db.write_behind import WriteBehindQueue
+
+
+async def _database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Database:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'write_behind.db'}")
+    get_settings.cache_clear()
+    database = Database(get_settings())
+    await apply_migrations(database)
+    return database
+
+
+@pytest.mark.asyncio
+async def test_write_behind_batches_segments_and_load_sees_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    database = await _database(tmp_path, monkeypatch)
+    meeting = await MeetingRepository(database).create("Batched")
+
+    writer = WriteBehindQueue(database, max_batch_size=500, flush_interval_seconds=0.01)
+    writer.start()
+    repository = MeetingStateRepository(database, writer)
+
+    for index in range(1200):
+        await repository.add_segment(meeting.id, f"line {index}", "Alice" if index % 2 else None)
+
+    record = await repository.load(meeting.id)
+    assert writer.pending == 0
+    assert writer.written == 1200
+    assert writer.failed == 0
+    assert record is not None
+    assert len(record.segments) == 1200
+    assert record.segments[0] == (None, "line 0")
+    assert record.segments[-1] == ("Alice", "line 1199")
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_put_blocks_when_full(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    database = await _database(tmp_path, monkeypatch)
+    meeting = await MeetingRepository(database).create("Backpressure")
+    writer = WriteBehindQueue(database, max_pending=2)
+    repository = MeetingStateRepository(database, writer)
+
+    await repository.add_segment(meeting.id, "one")
+    await repository.add_segment(meeting.id, "two")
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(repository.add_segment(meeting.id, "three"), timeout=0.05)
+
+    await writer.flush()
+    assert writer.pending == 0
+    assert writer.written == 2
+
+    record = await repository.load(meeting.id)
+    assert record is not None
+    assert [text for _, text in record.segments] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flush_does_not_wait_for_rows_queued_after_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    database = await _database(tmp_path, monkeypatch)
+    meetings = MeetingRepository(database)
+    busy, cold = await meetings.create("Busy"), await meetings.create("Cold")
+    writer = WriteBehindQueue(database, max_batch_size=50, flush_interval_seconds=0.01)
+    writer.start()
+    repository = MeetingStateRepository(database, writer)
+    await repository.add_segment(cold.id, "before eviction")
+
+    async def keep_ingesting() -> None:
+        index = 0
+        while True:
+            await repository.add_segment(busy.id, f"line {index}")
+            index += 1
+            await asyncio.sleep(0)
+
+    producer = asyncio.create_task(keep_ingesting())
+    try:
+        record = await asyncio.wait_for(repository.load(cold.id), timeout=2)
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+    assert record is not None
+    assert [text for _, text in record.segments] == ["before eviction"]
+    await writer.close()
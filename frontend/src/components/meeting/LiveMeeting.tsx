@@ -13,8 +13,119 @@ import { useAudioCapture } from '../../hooks/useAudioCapture'
 import { useCopilot } from '../../hooks/useCopilot'
 import { useWebSocket } from '../../hooks/useWebSocket'
 import { providersApi, sttApi } from '../../services/api'
+import type { WsEvent } from '../../types/events'
 import type { ActionItem, Decision, OpenQuestion, Risk } from '../../types/insights'
 
+interface MeetingInsights {
+  decisions: Decision[]
+  actions: ActionItem[]
+  risks: Risk[]
+  open_questions: OpenQuestion[]
+}
+
+interface MeetingSyncPayload {
+  owner?: string
+  version?: number
+  base_version?: number
+  full?: boolean
+  summary?: string
+  insights?: Partial<MeetingInsights>
+}
+
+interface MeetingSync {
+  version: number | null
+  outOfSync: boolean
+  summary: string
+  insights: MeetingInsights
+}
+
+function mergeById<T extends { id: string }>(current: T[], incoming: T[] | undefined): T[] {
+  if (!incoming?.length) return current
+  const byId = new Map(current.map((item) => [item.id, item]))
+  for (const item of incoming) {
+    byId.set(item.id, item)
+  }
+  return [...byId.values()]
+}
+
+function foldMeetingSync(events: WsEvent[]): MeetingSync {
+  let sync: MeetingSync = {
+    version: null,
+    outOfSync: false,
+    summary: '',
+    insights: { decisions: [], actions: [], risks: [], open_questions: [] },
+  }
+  // The worker this socket talks to; only its versions can be resynced against
+  let localOwner: string | undefined
+
+  for (const event of events) {
+    if (event.type === 'meeting.connected') {
+      localOwner = (event.payload as { owner?: string } | undefined)?.owner
+      continue
+    }
+    if (event.type !== 'meeting.state' && event.type !== 'meeting.delta') continue
+
+    const payload = (event.payload ?? {}) as MeetingSyncPayload
+    const isFull = event.type === 'meeting.state' || payload.full === true
+    // Deltas forwarded from the worker that owns the meeting use that worker's versions:
+    // fold their content in, but never treat them as a gap in our own
+    if (localOwner && payload.owner && payload.owner !== localOwner) {
+      sync = {
+        ...sync,
+        summary: payload.summary ?? sync.summary,
+        insights: isFull
+          ? {
+              decisions: payload.insights?.decisions ?? [],
+              actions: payload.insights?.actions ?? [],
+              risks: payload.insights?.risks ?? [],
+              open_questions: payload.insights?.open_questions ?? [],
+            }
+          : {
+              decisions: mergeById(sync.insights.decisions, payload.insights?.decisions),
+              actions: mergeById(sync.insights.actions, payload.insights?.actions),
+              risks: mergeById(sync.insights.risks, payload.insights?.risks),
+              open_questions: mergeById(sync.insights.open_questions, payload.insights?.open_questions),
+            },
+      }
+      continue
+    }
+
+    if (isFull) {
+      sync = {
+        version: payload.version ?? null,
+        outOfSync: false,
+        summary: payload.summary ?? '',
+        insights: {
+          decisions: payload.insights?.decisions ?? [],
+          actions: payload.insights?.actions ?? [],
+          risks: payload.insights?.risks ?? [],
+          open_questions: payload.insights?.open_questions ?? [],
+        },
+      }
+      continue
+    }
+
+    if (sync.version !== null && payload.base_version !== undefined && payload.base_version > sync.version) {
+      sync = { ...sync, outOfSync: true }
+      continue
+    }
+
+    sync = {
+      version: Math.max(sync.version ?? 0, payload.version ?? 0),
+      outOfSync: false,
+      summary: payload.summary ?? sync.summary,
+      insights: {
+        decisions: mergeById(sync.insights.decisions, payload.insights?.decisions),
+        actions: mergeById(sync.insights.actions, payload.insights?.actions),
+        risks: mergeById(sync.insights.risks, payload.insights?.risks),
+        open_questions: mergeById(sync.insights.open_questions, payload.insights?.open_questions),
+      },
+    }
+  }
+
+  return sync
+}
+
 export function LiveMeeting() {
   const { meetings, activeMeeting, loading, error, startMeeting, stopMeeting } = useMeetingState()
   const { stream, isCapturing, start: startAudio, stop: stopAudio, error: audioError } = useAudioCapture()
@@ -94,22 +205,14 @@ export function LiveMeeting() {
     while (chunkQueueRef.current.length > 0) {
       const blob = chunkQueueRef.current.shift()!
       try {
-        const arrayBuffer = await blob.arrayBuffer()
-        const bytes = new Uint8Array(arrayBuffer)
-        let binary = ''
-        for (let index = 0; index < bytes.length; index += 1) {
-          binary += String.fromCharCode(bytes[index])
-        }
-        const audioBase64 = btoa(binary)
-
-        const result = await sttApi.transcribeElevenlabsChunk(audioBase64, mime)
+        const result = await sttApi.uploadElevenlabsChunk(blob, mime)
         const text = result.text.trim()
         console.log('[MeetingCopilot] STT result:', text || '(silence)')
         if (text) {
           sendWsEvent({
             type: 'transcript.segment',
             meeting_id: meetingId,
-            payload: { text, speaker: 'Attendee' },
+            payload: { text, speaker: 'Attendee', source: 'elevenlabs' },
             timestamp: new Date().toISOString(),
           })
         }
@@ -163,9 +266,18 @@ export function LiveMeeting() {
   }, [activeMeeting, isCapturing, stream, sttProvider, sendWsEvent])
 
   const transcriptLines = events
-    .filter((event) => event.type === 'transcript.segment')
+    .flatMap((event) => {
+      if (event.type === 'transcript.segment') {
+        return [{ payload: event.payload ?? {}, timestamp: event.timestamp }]
+      }
+      if (event.type === 'transcript.segments') {
+        const { segments } = (event.payload ?? {}) as { segments?: Record<string, unknown>[] }
+        return (segments ?? []).map((payload) => ({ payload, timestamp: event.timestamp }))
+      }
+      return []
+    })
     .map((event, index) => {
-      const payload = (event.payload ?? {}) as { text?: string; speaker?: string }
+      const payload = event.payload as { text?: string; speaker?: string }
       const text = String(payload.text ?? '').trim()
       const speaker = String(payload.speaker ?? 'Attendee').trim() || 'Attendee'
       return {
@@ -178,16 +290,7 @@ export function LiveMeeting() {
     .filter((item) => item.text)
 
   const latestState = [...events].reverse().find((event) => event.type === 'meeting.state')
-  const statePayload = (latestState?.payload ?? {}) as {
-    transcript_lines?: string[]
-    summary?: string
-    insights?: {
-      decisions?: Decision[]
-      actions?: ActionItem[]
-      risks?: Risk[]
-      open_questions?: OpenQuestion[]
-    }
-  }
+  const statePayload = (latestState?.payload ?? {}) as { transcript_lines?: string[] }
 
   const transcriptFromState = (statePayload.transcript_lines ?? []).map((line, index) => {
     const separatorIndex = line.indexOf(':')
@@ -210,22 +313,21 @@ export function LiveMeeting() {
     }
   })
 
-  const latestDelta = [...events].reverse().find((event) => event.type === 'meeting.delta')
-  const deltaPayload = (latestDelta?.payload ?? {}) as {
-    summary?: string
-    insights?: {
-      decisions?: Decision[]
-      actions?: ActionItem[]
-      risks?: Risk[]
-      open_questions?: OpenQuestion[]
-    }
-  }
+  const meetingSync = foldMeetingSync(events)
+  const { summary } = meetingSync
+  const { decisions, actions, risks, open_questions: questions } = meetingSync.insights
+
+  // Deltas only carry changes since base_version; ask for a catch-up when one was missed
+  useEffect(() => {
+    if (!activeMeeting || !meetingSync.outOfSync || meetingSync.version === null) return
+    sendWsEvent({
+      type: 'meeting.command',
+      meeting_id: activeMeeting.id,
+      payload: { command: 'resync', version: meetingSync.version },
+      timestamp: new Date().toISOString(),
+    })
+  }, [activeMeeting, meetingSync.outOfSync, meetingSync.version, sendWsEvent])
 
-  const summary = deltaPayload.summary ?? statePayload.summary ?? ''
-  const decisions = deltaPayload.insights?.decisions ?? statePayload.insights?.decisions ?? []
-  const actions = deltaPayload.insights?.actions ?? statePayload.insights?.actions ?? []
-  const risks = deltaPayload.insights?.risks ?? statePayload.insights?.risks ?? []
-  const questions = deltaPayload.insights?.open_questions ?? statePayload.insights?.open_questions ?? []
   const { messages, ask, quickQuestions } = useCopilot({
     meetingId: activeMeeting?.id ?? null,
     events,
@@ -59,4 +59,10 @@ export const sttApi = {
       method: 'POST',
       body: JSON.stringify({ audio_base64: audioBase64, mime_type: mimeType }),
     }),
+  uploadElevenlabsChunk: (audio: Blob, mimeType: string) =>
+    request<{ text: string }>('/api/stt/elevenlabs/chunk/upload', {
+      method: 'POST',
+      headers: { 'Content-Type': mimeType.startsWith('audio/') ? mimeType : 'application/octet-stream' },
+      body: audio,
+    }),
 }
@@ -14,6 +14,8 @@ export class ReconnectingWebSocketClient {
   private readonly onMessage: (event: WsEvent) => void
   private onOpenCallback: (() => void) | null = null
   private onCloseCallback: (() => void) | null = null
+  private stream: string | null = null
+  private lastSeq = 0
 
   constructor(url: string, onMessage: (event: WsEvent) => void, options: WebSocketClientOptions = {}) {
     this.url = url
@@ -31,7 +33,7 @@ export class ReconnectingWebSocketClient {
   }
 
   connect(): void {
-    this.socket = new WebSocket(this.url)
+    this.socket = new WebSocket(this.resumeUrl())
 
     this.socket.onopen = () => {
       console.log('[MeetingCopilot] WebSocket connected to:', this.url)
@@ -42,6 +44,11 @@ export class ReconnectingWebSocketClient {
     this.socket.onmessage = (event) => {
       try {
         const parsed = JSON.parse(event.data) as WsEvent
+        if (parsed.type === 'meeting.ping') {
+          this.send({ type: 'meeting.pong', meeting_id: parsed.meeting_id })
+          return
+        }
+        this.track(parsed)
         this.onMessage(parsed)
       } catch {
         // ignore malformed event
@@ -60,6 +67,30 @@ export class ReconnectingWebSocketClient {
     }
   }
 
+  private resumeUrl(): string {
+    if (!this.stream) {
+      return this.url
+    }
+    // Reconnects ask for the broadcasts missed since the last one seen
+    const url = new URL(this.url, window.location.href)
+    url.searchParams.set('stream', this.stream)
+    url.searchParams.set('last_seq', String(this.lastSeq))
+    return url.toString()
+  }
+
+  private track(event: WsEvent): void {
+    if (event.type === 'meeting.connected') {
+      const payload = (event.payload ?? {}) as { stream?: string; seq?: number }
+      if (payload.stream !== this.stream) {
+        this.stream = payload.stream ?? null
+        this.lastSeq = payload.seq ?? 0
+      }
+    }
+    if (typeof event.seq === 'number') {
+      this.lastSeq = Math.max(this.lastSeq, event.seq)
+    }
+  }
+
   disconnect(): void {
     this.socket?.close()
     this.socket = null
@@ -11,10 +11,13 @@ export type WsEventType =
   | 'bot.flag'
   | 'provider.status'
   | 'meeting.connected'
+  | 'meeting.ping'
+  | 'meeting.pong'
 
 export interface WsEvent<TPayload = Record<string, unknown>> {
   type: WsEventType
   meeting_id: string
   payload?: TPayload
   timestamp?: string
+  seq?: number
 }